@@ -0,0 +1,54 @@
+"""Benchmarks of the per-message decode cost of json codecs
+
+Run with::
+
+    make benchmark bench_target=codec
+"""
+
+import pytest
+
+from binance.common.codec import JSON_CODECS
+
+from .common import (
+    TICKER_FRAME,
+    ALL_MARKET_TICKERS_FRAME
+)
+
+
+def get_codecs():
+    codecs = []
+
+    for Codec in JSON_CODECS:
+        try:
+            codecs.append(Codec())
+        except ImportError:
+            pass
+
+    return codecs
+
+
+CODECS = get_codecs()
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda c: c.NAME)
+def test_decode_ticker(benchmark, codec):
+    benchmark.group = 'decode ticker frame'
+    benchmark(codec.loads, TICKER_FRAME)
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda c: c.NAME)
+def test_decode_all_market_tickers(benchmark, codec):
+    benchmark.group = 'decode all market tickers frame'
+    benchmark(codec.loads, ALL_MARKET_TICKERS_FRAME)
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda c: c.NAME)
+def test_encode_subscribe(benchmark, codec):
+    benchmark.group = 'encode subscribe message'
+    benchmark(codec.dumps, {
+        'method': 'SUBSCRIBE',
+        'params': [
+            f'symbol{i}usdt@depth' for i in range(200)
+        ],
+        'id': 1
+    })
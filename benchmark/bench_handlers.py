@@ -0,0 +1,84 @@
+"""Benchmarks of converting stream messages into DataFrames
+
+Run with::
+
+    make benchmark bench_target=handlers
+"""
+
+from binance import (
+    Client,
+    ColumnarFormat,
+    TradeHandlerBase
+)
+
+from .common import create_trade
+
+
+TRADES = [create_trade(i) for i in range(1000)]
+
+
+def test_dataframe_per_message(benchmark):
+    benchmark.group = 'trade handler, 1000 messages'
+
+    handler = TradeHandlerBase()
+
+    def receive():
+        for trade in TRADES:
+            handler.receiveDispatch(trade)
+
+    benchmark(receive)
+
+
+def test_dataframe_per_batch(benchmark):
+    benchmark.group = 'trade handler, 1000 messages'
+
+    class Handler(TradeHandlerBase):
+        def receive_batch(self, df):
+            return df
+
+    handler = Handler(batch_size=100)
+
+    def receive():
+        for trade in TRADES:
+            handler.receiveDispatch(trade)
+
+    benchmark(receive)
+
+
+def test_columnar_per_batch(benchmark):
+    benchmark.group = 'trade handler, 1000 messages'
+
+    class Handler(TradeHandlerBase):
+        def receive_batch(self, trades):
+            return trades
+
+    handler = Handler(batch_size=100, columnar=ColumnarFormat.NUMPY)
+
+    def receive():
+        for trade in TRADES:
+            handler.receiveDispatch(trade)
+
+    benchmark(receive)
+
+
+MESSAGES = [
+    {'stream': 'bnbbtc@trade', 'data': trade}
+    for trade in TRADES
+]
+
+
+def test_route_and_dispatch(benchmark, loop):
+    benchmark.group = 'route and dispatch, 1000 messages'
+
+    class Handler(TradeHandlerBase):
+        def receive(self, payload):
+            return payload
+
+    client = Client()
+    client.handler(Handler())
+
+    async def receive():
+        for msg in MESSAGES:
+            await client._receive(msg)
+
+    benchmark(lambda: loop.run_until_complete(receive()))
@@ -0,0 +1,119 @@
+"""Benchmarks of applying depthUpdate payloads to orderbooks
+
+Run with::
+
+    make benchmark bench_target=orderbook
+"""
+
+import pytest
+
+from binance import (
+    OrderBook,
+    ArraySequencedList,
+    LevelFormat,
+    OrderSide
+)
+from binance.common.level_parser import create_level_parser
+
+from .common import (
+    create_orderbook_snapshot,
+    create_depth_update_payloads
+)
+
+
+DEPTHS = [100, 1000, 5000]
+COUNT = 1000
+
+
+class ArrayOrderBook(OrderBook):
+    SEQUENCED_LIST = ArraySequencedList
+
+
+ORDERBOOKS = [OrderBook, ArrayOrderBook]
+
+# The filters of the synthetic levels
+FILTERS = {
+    'PRICE_FILTER': {'tickSize': '0.01000000'},
+    'LOT_SIZE': {'stepSize': '0.00100000'}
+}
+
+
+@pytest.mark.parametrize('depth', DEPTHS)
+@pytest.mark.parametrize('Book', ORDERBOOKS, ids=lambda c: c.__name__)
+def test_orderbook_update(benchmark, loop, Book, depth):
+    benchmark.group = f'orderbook update, depth={depth}, {COUNT} updates'
+
+    snapshot = create_orderbook_snapshot(depth)
+    payloads = create_depth_update_payloads(depth, COUNT)
+
+    def setup():
+        orderbook = Book('BTCUSDT')
+        orderbook._merge(
+            snapshot['lastUpdateId'],
+            snapshot['asks'],
+            snapshot['bids']
+        )
+
+        return (orderbook,), {}
+
+    def update(orderbook):
+        for payload in payloads:
+            orderbook.update(payload)
+
+    benchmark.pedantic(update, setup=setup, rounds=20)
+
+
+@pytest.mark.parametrize('level_format', list(LevelFormat), ids=str)
+def test_orderbook_level_format(benchmark, loop, level_format):
+    depth = 1000
+    benchmark.group = f'orderbook levels, depth={depth}, {COUNT} updates'
+
+    snapshot = create_orderbook_snapshot(depth)
+    payloads = create_depth_update_payloads(depth, COUNT)
+
+    def setup():
+        orderbook = OrderBook('BTCUSDT', level_format=level_format)
+        orderbook._level_parser = create_level_parser(level_format, FILTERS)
+        orderbook._merge(
+            snapshot['lastUpdateId'],
+            snapshot['asks'],
+            snapshot['bids']
+        )
+
+        return (orderbook,), {}
+
+    def update(orderbook):
+        for payload in payloads:
+            orderbook.update(payload)
+
+    benchmark.pedantic(update, setup=setup, rounds=20)
+
+
+@pytest.mark.parametrize('depth', DEPTHS)
+@pytest.mark.parametrize('Book', ORDERBOOKS, ids=lambda c: c.__name__)
+def test_orderbook_queries(benchmark, loop, Book, depth):
+    benchmark.group = f'orderbook update and query, depth={depth}, {COUNT} updates'
+
+    snapshot = create_orderbook_snapshot(depth)
+    payloads = create_depth_update_payloads(depth, COUNT)
+
+    def setup():
+        orderbook = Book('BTCUSDT')
+        orderbook._merge(
+            snapshot['lastUpdateId'],
+            snapshot['asks'],
+            snapshot['bids']
+        )
+
+        return (orderbook,), {}
+
+    def update(orderbook):
+        for payload in payloads:
+            orderbook.update(payload)
+
+            # As quoting logic does on every update
+            orderbook.quantity_within(orderbook.mid * 0.001)
+            orderbook.fill_price(OrderSide.BUY, 10.)
+            orderbook.fill_price(OrderSide.SELL, 10.)
+
+    benchmark.pedantic(update, setup=setup, rounds=20)
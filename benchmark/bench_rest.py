@@ -0,0 +1,124 @@
+"""Benchmarks of signing requests and the overhead of the rest client against a local aiohttp server
+
+Run with::
+
+    make benchmark bench_target=rest
+"""
+
+import pytest
+from aiohttp import web
+
+from binance import (
+    Client,
+    HMACSigner,
+    RSASigner,
+    Ed25519Signer
+)
+from binance.client.base import encode_params
+from binance.common.codec import json_stringify
+
+from .common import (
+    LocalServer,
+    create_orderbook_snapshot
+)
+
+
+PORT = 9182
+
+QUERY = encode_params(dict(
+    symbol='BTCUSDT',
+    side='BUY',
+    type='LIMIT',
+    timeInForce='GTC',
+    quantity='1.00000000',
+    price='7000.10000000',
+    recvWindow=5000,
+    timestamp=1590000000000
+)).encode('utf-8')
+
+
+def create_signers():
+    signers = [HMACSigner('secret')]
+
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import (
+            ed25519,
+            rsa
+        )
+    except ModuleNotFoundError:
+        return signers
+
+    def pem(key):
+        return key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        )
+
+    signers.append(RSASigner(pem(rsa.generate_private_key(65537, 2048))))
+    signers.append(Ed25519Signer(pem(ed25519.Ed25519PrivateKey.generate())))
+
+    return signers
+
+
+@pytest.mark.parametrize(
+    'signer',
+    create_signers(),
+    ids=lambda s: type(s).__name__
+)
+def test_sign(benchmark, signer):
+    benchmark.group = 'sign order query'
+    benchmark(signer.sign, QUERY)
+
+
+SNAPSHOT = json_stringify(create_orderbook_snapshot(100))
+
+
+async def depth_handler(request):
+    return web.json_response(text=SNAPSHOT)
+
+
+async def account_handler(request):
+    return web.json_response({'balances': []})
+
+
+ROUTES = [
+    web.get('/api/v3/depth', depth_handler),
+    web.get('/api/v3/account', account_handler)
+]
+
+
+@pytest.fixture
+def server(loop):
+    server = LocalServer(ROUTES, PORT)
+    loop.run_until_complete(server.start())
+
+    yield server
+
+    loop.run_until_complete(server.close())
+
+
+@pytest.mark.parametrize('signed', [False, True], ids=['depth', 'account'])
+def test_request(benchmark, loop, server, signed):
+    benchmark.group = 'rest request'
+
+    client = Client(
+        'api_key',
+        'api_secret',
+        api_host=f'http://{server.host}'
+    )
+
+    def request():
+        if signed:
+            return client.get_account()
+
+        return client.get_orderbook(symbol='BTCUSDT', limit=100)
+
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(request()),
+        rounds=500,
+        warmup_rounds=10
+    )
+
+    loop.run_until_complete(client.close())
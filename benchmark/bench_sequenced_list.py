@@ -0,0 +1,50 @@
+"""Benchmarks of merging depth updates into asks or bids
+
+Run with::
+
+    make benchmark bench_target=sequenced_list
+"""
+
+import pytest
+
+from binance import (
+    SequencedList,
+    ArraySequencedList
+)
+
+from .common import (
+    create_levels,
+    create_depth_updates
+)
+
+
+DEPTHS = [100, 1000, 5000]
+LISTS = [SequencedList, ArraySequencedList]
+
+
+@pytest.mark.parametrize('depth', DEPTHS)
+@pytest.mark.parametrize('List', LISTS, ids=lambda c: c.__name__)
+def test_merge_depth_update(benchmark, List, depth):
+    benchmark.group = f'merge depth update, depth={depth}'
+
+    updates = iter(create_depth_updates(depth, 100000))
+    l = List(create_levels(depth))  # noqa:E741
+
+    def merge():
+        l.merge(next(updates))
+
+    benchmark.pedantic(merge, rounds=2000)
+
+
+@pytest.mark.parametrize('depth', DEPTHS)
+@pytest.mark.parametrize('List', LISTS, ids=lambda c: c.__name__)
+def test_merge_snapshot(benchmark, List, depth):
+    benchmark.group = f'merge bids snapshot, depth={depth}'
+
+    # Bids of snapshots are in descending order
+    levels = create_levels(depth)[::-1]
+
+    def merge():
+        List().merge(levels)
+
+    benchmark(merge)
@@ -0,0 +1,102 @@
+"""Benchmarks of the whole stream pipeline, i.e. reading frames from a local websocket server, decoding, routing by `HandlerContext` and dispatching to handlers
+
+Run with::
+
+    make benchmark bench_target=stream
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import (
+    web,
+    WSMsgType
+)
+
+from binance import (
+    Client,
+    SubType,
+    TradeHandlerBase
+)
+from binance.common.codec import json_stringify
+
+from .common import (
+    LocalServer,
+    create_trade
+)
+
+
+PORT = 9181
+COUNT = 5000
+
+TRADE_FRAMES = [
+    json_stringify({
+        'stream': 'bnbbtc@trade',
+        'data': create_trade(i)
+    })
+    for i in range(COUNT)
+]
+
+
+async def stream_handler(request):
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+
+    async for msg in ws:
+        if msg.type != WSMsgType.TEXT:
+            break
+
+        msg = msg.json()
+        await ws.send_json({'result': None, 'id': msg['id']})
+
+        if msg['method'] == 'SUBSCRIBE':
+            # Replays the synthetic frames for each subscription
+            for frame in TRADE_FRAMES:
+                await ws.send_str(frame)
+
+    return ws
+
+
+class TradeCounter(TradeHandlerBase):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.done = None
+
+    def receive(self, payload):
+        self.count += 1
+
+        if self.count == COUNT:
+            self.done.set_result(None)
+
+
+@pytest.mark.parametrize('queue_size', [None, 1024])
+def test_stream_pipeline(benchmark, loop, queue_size):
+    benchmark.group = f'stream pipeline, {COUNT} trade frames'
+
+    server = LocalServer([web.get('/stream', stream_handler)], PORT)
+    client = Client(
+        stream_host=f'ws://{server.host}',
+        stream_queue_size=queue_size
+    )
+
+    handler = TradeCounter()
+    client.handler(handler)
+
+    loop.run_until_complete(server.start())
+
+    async def receive():
+        handler.count = 0
+        handler.done = asyncio.get_running_loop().create_future()
+
+        await client.subscribe(SubType.TRADE, 'BNBBTC')
+        await handler.done
+
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(receive()),
+        rounds=10,
+        warmup_rounds=1
+    )
+
+    loop.run_until_complete(client.close())
+    loop.run_until_complete(server.close())
@@ -0,0 +1,178 @@
+import random
+
+from aiohttp import web
+
+from binance.common.codec import json_stringify
+
+
+def create_ticker(i: int) -> dict:
+    return {
+        'e': '24hrTicker',
+        'E': 1590000000000 + i,
+        's': f'SYMBOL{i}USDT',
+        'p': '0.0015',
+        'P': '250.00',
+        'w': '0.0018',
+        'x': '0.0009',
+        'c': '0.0025',
+        'Q': '10',
+        'b': '0.0024',
+        'B': '10',
+        'a': '0.0026',
+        'A': '100',
+        'o': '0.0010',
+        'h': '0.0025',
+        'l': '0.0010',
+        'v': '10000',
+        'q': '18',
+        'O': 0,
+        'C': 86400000,
+        'F': 0,
+        'L': 18150,
+        'n': 18151
+    }
+
+
+TICKER_FRAME = json_stringify({
+    'stream': 'symbol0usdt@ticker',
+    'data': create_ticker(0)
+})
+
+# Binance has more than 1000 symbols
+ALL_MARKET_TICKERS_FRAME = json_stringify({
+    'stream': '!ticker@arr',
+    'data': [create_ticker(i) for i in range(1000)]
+})
+
+
+def format_level(price: int, quantity: int) -> list:
+    # The same as the levels of depth updates
+    return [f'{price / 100:.8f}', f'{quantity / 1000:.8f}']
+
+
+def create_levels(depth: int) -> list:
+    return [
+        format_level(10000 + i, 1000 + i)
+        for i in range(depth)
+    ]
+
+
+def create_depth_updates(
+    depth: int,
+    count: int,
+    size: int = 20,
+    seed: int = 0
+) -> list:
+    """Creates `count` batches of levels each of which has `size` levels and 1/4 of which removes the price
+    """
+
+    rand = random.Random(seed)
+    updates = []
+
+    for _ in range(count):
+        updates.append([
+            format_level(
+                10000 + rand.randrange(depth),
+                0 if rand.random() < 0.25 else rand.randrange(1, 100000)
+            )
+            for _ in range(size)
+        ])
+
+    return updates
+
+
+def create_trade(i: int) -> dict:
+    return {
+        'e': 'trade',
+        'E': 1590000000000 + i,
+        's': 'BNBBTC',
+        't': i,
+        'p': '0.00100000',
+        'q': '100.00000000',
+        'b': 88,
+        'a': 50,
+        'T': 1590000000000 + i,
+        'm': True,
+        'M': True
+    }
+
+
+def create_orderbook_snapshot(depth: int) -> dict:
+    """Creates a snapshot of `depth` asks above and `depth` bids below the price 100
+    """
+
+    return {
+        'lastUpdateId': 1,
+        'asks': [
+            format_level(10000 + i, 1000 + i)
+            for i in range(depth)
+        ],
+        'bids': [
+            format_level(9999 - i, 1000 + i)
+            for i in range(depth)
+        ]
+    }
+
+
+def create_depth_update_payloads(
+    depth: int,
+    count: int,
+    size: int = 10,
+    seed: int = 0
+) -> list:
+    """Creates `count` continuous depthUpdate payloads, whose levels are clustered around the top of the orderbook as the real ones
+    """
+
+    rand = random.Random(seed)
+
+    def levels(sign: int, start: int) -> list:
+        return [
+            format_level(
+                # Most of updates are close to the best price
+                start + sign * min(
+                    int(rand.expovariate(10 / depth)), depth - 1
+                ),
+                0 if rand.random() < 0.25 else rand.randrange(1, 100000)
+            )
+            for _ in range(size)
+        ]
+
+    return [
+        {
+            'e': 'depthUpdate',
+            'E': 1590000000000 + i,
+            's': 'BTCUSDT',
+            'U': i * 10 + 2,
+            'u': i * 10 + 11,
+            'a': levels(1, 10000),
+            'b': levels(-1, 9999)
+        }
+        for i in range(count)
+    ]
+
+
+class LocalServer:
+    """A local aiohttp server for benchmarks against real sockets
+
+    Args:
+        routes (list): the routes of `aiohttp.web`
+        port (int): the port to listen
+    """
+
+    def __init__(self, routes: list, port: int) -> None:
+        app = web.Application()
+        app.add_routes(routes)
+
+        self._runner = web.AppRunner(app)
+        self._port = port
+
+    @property
+    def host(self) -> str:
+        return f'localhost:{self._port}'
+
+    async def start(self) -> None:
+        await self._runner.setup()
+        await web.TCPSite(self._runner, 'localhost', self._port).start()
+
+    async def close(self) -> None:
+        await self._runner.cleanup()
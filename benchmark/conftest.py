@@ -0,0 +1,17 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def loop():
+    """A new event loop for benchmarks of coroutines, which runs each round by `loop.run_until_complete()`
+    """
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    yield loop
+
+    loop.close()
+    asyncio.set_event_loop(None)
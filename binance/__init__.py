@@ -4,6 +4,12 @@ from binance.client import Client
 from binance.common.constants import (
     SubType,
     KlineInterval,
+    DepthFormat,
+    LevelFormat,
+    ColumnarFormat,
+    ShardStrategy,
+    OverflowPolicy,
+    RateLimitType,
     SecurityType,
     RequestMethod,
     OrderSide,
@@ -22,10 +28,12 @@ from binance.common.exceptions import (
     InvalidResponseException,
     InvalidSubParamsException,
     UnsupportedSubTypeException,
+    UnsupportedJSONCodecException,
     InvalidSubTypeParamException,
     InvalidHandlerException,
     ReuseHandlerException,
-    OrderBookFetchAbandonedException
+    OrderBookFetchAbandonedException,
+    ReplaySnapshotNotFoundException
 )
 
 from binance.handlers.handlers import (
@@ -40,6 +48,7 @@ from binance.handlers.handlers import (
 )
 
 from binance.handlers.orderbook_handler import OrderBookHandlerBase
+from binance.handlers.snapshot_scheduler import SnapshotScheduler
 
 from binance.handlers.user_handlers import (
     AccountInfoHandlerBase,
@@ -49,5 +58,40 @@ from binance.handlers.user_handlers import (
     OrderListStatusHandlerBase
 )
 
+from binance.client.signer import (
+    Signer,
+    HMACSigner,
+    RSASigner,
+    Ed25519Signer
+)
+
+from binance.client.rate_limiter import RateLimiter
+from binance.apis.history import HistoryIterator
+from binance.client.cache import ResponseCache
+
+from binance.common.codec import (
+    JSONCodec,
+    get_json_codec
+)
+
+from binance.common.metrics import (
+    Metrics,
+    Histogram,
+    HistogramMetrics
+)
+
 from binance.handlers.orderbook import OrderBook
+from binance.common.sequenced_list import SequencedList
+from binance.common.level_parser import (
+    LevelParser,
+    DecimalLevelParser,
+    FixedPointLevelParser
+)
+from binance.common.array_sequenced_list import ArraySequencedList
 from binance.subscribe.stream import Stream
+from binance.subscribe.message_queue import MessageQueue
+from binance.subscribe.recorder import (
+    Recorder,
+    RecordingReader
+)
+from binance.subscribe.replay import ReplayClient
@@ -1,2 +1,6 @@
 from .rest import RestAPIGetters
 from .wapi import WapiAPIGetters
+from .history import (
+    HistoryAPIs,
+    HistoryIterator
+)
@@ -0,0 +1,482 @@
+import asyncio
+from collections import deque
+from itertools import count
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+    Union
+)
+
+from binance.common.constants import (
+    KLINE_INTERVAL_MS,
+    MAX_HISTORY_PAGE_LIMIT,
+    DEFAULT_HISTORY_CONCURRENCY,
+    AGG_TRADES_MAX_WINDOW,
+    KlineInterval
+)
+from binance.client.clock import now_ms
+
+Row = Any
+Page = List[Row]
+FetchPage = Callable[[int], Awaitable[Page]]
+
+KEY_AGG_TRADE_ID = 'a'
+KEY_AGG_TRADE_TIME = 'T'
+KEY_TRADE_ID = 'id'
+KEY_ORDER_ID = 'orderId'
+KEY_ORDER_TIME = 'time'
+
+
+async def fetch_pages(
+    fetch: FetchPage,
+    cursors: Iterable[int],
+    concurrency: int,
+    stop_if_short: Optional[int] = None
+) -> AsyncIterator[Page]:
+    """Fetches the pages of the cursors concurrently, and yields the pages in order
+
+    Args:
+        fetch (Callable): the function to fetch the page of a cursor
+        cursors (Iterable[int]): the cursors of pages which could be infinite
+        concurrency (int): the max number of pages fetched ahead
+        stop_if_short (:obj:`int`, optional): stops if a page has less rows than this number
+    """
+
+    cursors = iter(cursors)
+    pending: Deque[asyncio.Future] = deque()
+
+    def fetch_next() -> None:
+        cursor = next(cursors, None)
+
+        if cursor is not None:
+            pending.append(asyncio.ensure_future(fetch(cursor)))
+
+    try:
+        for _ in range(concurrency):
+            fetch_next()
+
+        while pending:
+            page = await pending.popleft()
+            fetch_next()
+
+            yield page
+
+            if stop_if_short is not None and len(page) < stop_if_short:
+                return
+    finally:
+        # Cancels the pages fetched ahead if stopped early
+        for future in pending:
+            future.cancel()
+
+
+async def fetch_sequential(
+    fetch: FetchPage,
+    cursor: int,
+    next_cursor: Callable[[Row], int],
+    limit: int
+) -> AsyncIterator[Page]:
+    """Fetches pages one by one, each of which starts from the cursor after the last row of the previous page
+    """
+
+    while True:
+        page = await fetch(cursor)
+
+        if page:
+            yield page
+
+        if len(page) < limit:
+            return
+
+        cursor = next_cursor(page[-1])
+
+
+class HistoryIterator:
+    """The async iterator of the rows of a history range, whose `checkpoint` could be passed to the same method to resume the iteration::
+
+        iterator = client.iter_klines(
+            symbol='BTCUSDT',
+            interval=KlineInterval.M1,
+            start_time=1577836800000
+        )
+
+        async for kline in iterator:
+            save(kline)
+            # Save the checkpoint with the data
+            save_checkpoint(iterator.checkpoint)
+    """
+
+    def __init__(
+        self,
+        pages: AsyncIterator[Page],
+        next_cursor: Callable[[Row], int],
+        cursor: int,
+        until: Optional[Callable[[Row], bool]] = None
+    ) -> None:
+        self._pages = pages
+        self._next_cursor = next_cursor
+        self._until = until
+        self._rows: Deque[Row] = deque()
+        self._done = False
+
+        self.checkpoint = cursor
+
+    def __aiter__(self) -> 'HistoryIterator':
+        return self
+
+    async def __anext__(self) -> Row:
+        while not self._rows:
+            if self._done:
+                raise StopAsyncIteration
+
+            try:
+                self._rows.extend(await self._pages.__anext__())
+            except StopAsyncIteration:
+                self._done = True
+
+        row = self._rows.popleft()
+
+        if self._until is not None and self._until(row):
+            # Out of range
+            await self.close()
+            raise StopAsyncIteration
+
+        self.checkpoint = self._next_cursor(row)
+        return row
+
+    async def pages(self) -> AsyncIterator[Page]:
+        """Iterates by pages rather than rows
+        """
+
+        page = []
+
+        async for row in self:
+            page.append(row)
+
+            if not self._rows:
+                yield page
+                page = []
+
+        if page:
+            yield page
+
+    async def to_list(self) -> List[Row]:
+        """Fetches all rows
+        """
+
+        return [row async for row in self]
+
+    async def close(self) -> None:
+        """Stops fetching pages
+        """
+
+        self._done = True
+        self._rows.clear()
+        await self._pages.aclose()
+
+
+def _check_limit(limit: int) -> int:
+    return min(limit, MAX_HISTORY_PAGE_LIMIT)
+
+
+class HistoryAPIs:
+    """Iterators of history endpoints which split ranges into pages.
+
+    Pages are requested via the api getters, so they are limited by the rate limiter of the client if any.
+    """
+
+    def iter_klines(
+        self,
+        symbol: str,
+        interval: Union[str, KlineInterval],
+        start_time: int,
+        end_time: Optional[int] = None,
+        limit: int = MAX_HISTORY_PAGE_LIMIT,
+        concurrency: int = DEFAULT_HISTORY_CONCURRENCY,
+        checkpoint: Optional[int] = None
+    ) -> HistoryIterator:
+        """Iterates klines whose open time is in the range [start_time, end_time]
+
+        Args:
+            symbol (str): the symbol name
+            interval (KlineInterval): the kline interval
+            start_time (int): the start time in milliseconds
+            end_time (:obj:`int`, optional): the end time in milliseconds. Defaults to now
+            limit (:obj:`int`, optional): the number of klines of each page. Defaults to `1000`
+            concurrency (:obj:`int`, optional): the max number of pages requested concurrently. Defaults to `4`
+            checkpoint (:obj:`int`, optional): the `checkpoint` of a previous iterator to resume from
+
+        Returns:
+            HistoryIterator: the iterator of klines, each of which is a list in the format of `get_klines()`
+        """
+
+        interval = KlineInterval(interval)
+        limit = _check_limit(limit)
+
+        if checkpoint is not None:
+            start_time = checkpoint
+
+        if end_time is None:
+            end_time = int(now_ms())
+
+        def fetch(cursor: int) -> Awaitable[Page]:
+            return self.get_klines(
+                symbol=symbol,
+                interval=interval,
+                startTime=cursor,
+                endTime=min(cursor + span - 1, end_time),
+                limit=limit
+            )
+
+        interval_ms = KLINE_INTERVAL_MS.get(interval)
+
+        if interval_ms is None:
+            # Months have different lengths
+            span = end_time - start_time + 1
+
+            pages = fetch_sequential(
+                fetch,
+                start_time,
+                _next_kline_cursor,
+                limit
+            )
+        else:
+            # The time range could be split into pages in advance,
+            #   and pages could be short if the market was closed
+            span = interval_ms * limit
+
+            pages = fetch_pages(
+                fetch,
+                range(start_time, end_time + 1, span),
+                concurrency
+            )
+
+        return HistoryIterator(pages, _next_kline_cursor, start_time)
+
+    def iter_aggregate_trades(
+        self,
+        symbol: str,
+        from_id: Optional[int] = None,
+        to_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = MAX_HISTORY_PAGE_LIMIT,
+        concurrency: int = DEFAULT_HISTORY_CONCURRENCY,
+        checkpoint: Optional[int] = None
+    ) -> HistoryIterator:
+        """Iterates aggregate trades in the id range [from_id, to_id] or in the time range [start_time, end_time]
+
+        Aggregate trade ids are continuous, so pages are requested by ids concurrently. If `from_id` is not specified, the id of the first trade since `start_time` is requested first.
+
+        Args:
+            symbol (str): the symbol name
+            from_id (:obj:`int`, optional): the first aggregate trade id
+            to_id (:obj:`int`, optional): the last aggregate trade id
+            start_time (:obj:`int`, optional): the start time in milliseconds if `from_id` is not specified
+            end_time (:obj:`int`, optional): the end time in milliseconds
+            limit (:obj:`int`, optional): the number of trades of each page. Defaults to `1000`
+            concurrency (:obj:`int`, optional): the max number of pages requested concurrently. Defaults to `4`
+            checkpoint (:obj:`int`, optional): the `checkpoint` of a previous iterator to resume from
+
+        Returns:
+            HistoryIterator: the iterator of aggregate trades in the format of `get_aggregate_trades()`
+        """
+
+        if checkpoint is not None:
+            from_id = checkpoint
+
+        if from_id is None and start_time is None:
+            raise ValueError('either `from_id` or `start_time` is required')
+
+        limit = _check_limit(limit)
+
+        async def pages() -> AsyncIterator[Page]:
+            first_id = from_id
+
+            if first_id is None:
+                first_id = await self._find_first_agg_trade_id(
+                    symbol, start_time, end_time
+                )
+
+                if first_id is None:
+                    return
+
+            id_pages = self._fetch_pages_by_id(
+                self.get_aggregate_trades,
+                symbol, first_id, to_id, limit, concurrency
+            )
+
+            try:
+                async for page in id_pages:
+                    yield page
+            finally:
+                # Cancels the pages fetched ahead
+                await id_pages.aclose()
+
+        return HistoryIterator(
+            pages(),
+            _next_cursor_of(KEY_AGG_TRADE_ID),
+            from_id,
+            _after(KEY_AGG_TRADE_TIME, end_time)
+        )
+
+    def iter_historical_trades(
+        self,
+        symbol: str,
+        from_id: int,
+        to_id: Optional[int] = None,
+        limit: int = MAX_HISTORY_PAGE_LIMIT,
+        concurrency: int = DEFAULT_HISTORY_CONCURRENCY,
+        checkpoint: Optional[int] = None
+    ) -> HistoryIterator:
+        """Iterates trades in the id range [from_id, to_id], which requires the api key
+
+        Args:
+            symbol (str): the symbol name
+            from_id (int): the first trade id
+            to_id (:obj:`int`, optional): the last trade id. Defaults to the latest trade
+            limit (:obj:`int`, optional): the number of trades of each page. Defaults to `1000`
+            concurrency (:obj:`int`, optional): the max number of pages requested concurrently. Defaults to `4`
+            checkpoint (:obj:`int`, optional): the `checkpoint` of a previous iterator to resume from
+
+        Returns:
+            HistoryIterator: the iterator of trades in the format of `get_historical_trades()`
+        """
+
+        if checkpoint is not None:
+            from_id = checkpoint
+
+        return HistoryIterator(
+            self._fetch_pages_by_id(
+                self.get_historical_trades,
+                symbol, from_id, to_id, _check_limit(limit), concurrency
+            ),
+            _next_cursor_of(KEY_TRADE_ID),
+            from_id
+        )
+
+    def iter_all_orders(
+        self,
+        symbol: str,
+        from_order_id: int = 0,
+        end_time: Optional[int] = None,
+        limit: int = MAX_HISTORY_PAGE_LIMIT,
+        checkpoint: Optional[int] = None
+    ) -> HistoryIterator:
+        """Iterates all orders of the account since `from_order_id`. Order ids are not continuous, so pages are requested one by one
+
+        Args:
+            symbol (str): the symbol name
+            from_order_id (:obj:`int`, optional): the first order id. Defaults to `0`
+            end_time (:obj:`int`, optional): the end time in milliseconds
+            limit (:obj:`int`, optional): the number of orders of each page. Defaults to `1000`
+            checkpoint (:obj:`int`, optional): the `checkpoint` of a previous iterator to resume from
+
+        Returns:
+            HistoryIterator: the iterator of orders in the format of `get_all_orders()`
+        """
+
+        if checkpoint is not None:
+            from_order_id = checkpoint
+
+        limit = _check_limit(limit)
+
+        def fetch(cursor: int) -> Awaitable[Page]:
+            return self.get_all_orders(
+                symbol=symbol,
+                orderId=cursor,
+                limit=limit
+            )
+
+        next_cursor = _next_cursor_of(KEY_ORDER_ID)
+
+        return HistoryIterator(
+            fetch_sequential(fetch, from_order_id, next_cursor, limit),
+            next_cursor,
+            from_order_id,
+            _after(KEY_ORDER_TIME, end_time)
+        )
+
+    def _fetch_pages_by_id(
+        self,
+        getter: Callable[..., Awaitable[Page]],
+        symbol: str,
+        from_id: int,
+        to_id: Optional[int],
+        limit: int,
+        concurrency: int
+    ) -> AsyncIterator[Page]:
+        def fetch(cursor: int) -> Awaitable[Page]:
+            return getter(
+                symbol=symbol,
+                fromId=cursor,
+                limit=limit if to_id is None
+                else min(limit, to_id - cursor + 1)
+            )
+
+        if to_id is None:
+            # Until the latest trade
+            cursors = count(from_id, limit)
+        else:
+            cursors = range(from_id, to_id + 1, limit)
+
+        # Ids are continuous, so a short page means the end
+        return fetch_pages(fetch, cursors, concurrency, limit)
+
+    async def _find_first_agg_trade_id(
+        self,
+        symbol: str,
+        start_time: int,
+        end_time: Optional[int]
+    ) -> Optional[int]:
+        if end_time is None:
+            end_time = int(now_ms())
+
+        # The time window of a request could not exceed one hour
+        for window_start in range(
+            start_time, end_time + 1, AGG_TRADES_MAX_WINDOW
+        ):
+            trades = await self.get_aggregate_trades(
+                symbol=symbol,
+                startTime=window_start,
+                endTime=min(
+                    window_start + AGG_TRADES_MAX_WINDOW - 1,
+                    end_time
+                ),
+                limit=1
+            )
+
+            if trades:
+                return trades[0][KEY_AGG_TRADE_ID]
+
+        return None
+
+
+def _next_kline_cursor(kline: list) -> int:
+    # The open time of the next kline is greater than the current one
+    return kline[0] + 1
+
+
+def _next_cursor_of(key: str) -> Callable[[dict], int]:
+    def next_cursor(row: dict) -> int:
+        return row[key] + 1
+
+    return next_cursor
+
+
+def _after(
+    key: str,
+    end_time: Optional[int]
+) -> Optional[Callable[[dict], bool]]:
+    if end_time is None:
+        return None
+
+    def after(row: dict) -> bool:
+        return row[key] > end_time
+
+    return after
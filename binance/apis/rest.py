@@ -3,10 +3,53 @@ from typing import (
 )
 
 from binance.common.constants import (
+    DEFAULT_DEPTH_LIMIT,
+    EXCHANGE_INFO_CACHE_TTL,
     REST_API_VERSION,
     SecurityType,
-    RequestMethod
+    RequestMethod,
+    ColumnarFormat
 )
+from binance.common.columnar import (
+    REST_KLINE_FIELDS,
+    REST_TRADE_FIELDS,
+    REST_AGG_TRADE_FIELDS,
+    check_columnar_format,
+    decode_rows
+)
+
+
+def depth_weight(params: dict) -> int:
+    limit = int(params.get('limit', DEFAULT_DEPTH_LIMIT))
+
+    if limit <= 100:
+        return 1
+
+    if limit <= 500:
+        return 5
+
+    if limit <= 1000:
+        return 10
+
+    return 50
+
+
+def symbol_weight(single: int, all_symbols: int):
+    # The weight of an endpoint which returns the data of all symbols
+    #   if `symbol` is omitted
+    def weight(params: dict) -> int:
+        return single if 'symbol' in params else all_symbols
+
+    return weight
+
+
+async def decode_response(
+    response: Awaitable,
+    schema: list,
+    columnar: ColumnarFormat
+):
+    return decode_rows(await response, schema, columnar)
+
 
 # Rest APIs ref:
 # https://github.com/binance-exchange/binance-official-api-docs/blob/master/rest-api.md
@@ -30,6 +73,26 @@ APIS = [
 
         # api version
         # version=REST_API_VERSION
+
+        # The request weight for the rate limiter, which could be an int
+        #   or a function to calculate the weight from params,
+        #   defaults to 1
+        # weight=1
+
+        # The number of orders the request creates, defaults to 0
+        # orders=0
+
+        # The name of the method to be called with the response
+        #   and the params
+        # on_response=None
+
+        # Seconds to cache responses if the client has a response cache,
+        #   defaults to `None` which means not to cache
+        # cache_ttl=None
+
+        # The fields to decode the rows of the response into columns
+        #   if the `columnar` argument is specified
+        # schema=None
     ),
 
     dict(
@@ -41,35 +104,44 @@ APIS = [
     dict(
         name='get_exchange_info',
         path='exchangeInfo',
-        params=False
+        params=False,
+        cache_ttl=EXCHANGE_INFO_CACHE_TTL,
+        on_response='_on_exchange_info'
     ),
 
     # Market Data endpoints
 
     dict(
         name='get_orderbook',
-        path='depth'
+        path='depth',
+        weight=depth_weight,
+        on_response='_on_orderbook'
     ),
 
     dict(
         name='get_recent_trades',
-        path='trades'
+        path='trades',
+        schema=REST_TRADE_FIELDS
     ),
 
     dict(
         name='get_historical_trades',
         path='historicalTrades',
-        security_type=SecurityType.MARKET_DATA
+        weight=5,
+        security_type=SecurityType.MARKET_DATA,
+        schema=REST_TRADE_FIELDS
     ),
 
     dict(
         name='get_aggregate_trades',
-        path='aggTrades'
+        path='aggTrades',
+        schema=REST_AGG_TRADE_FIELDS
     ),
 
     dict(
         name='get_klines',
-        path='klines'
+        path='klines',
+        schema=REST_KLINE_FIELDS
     ),
 
     dict(
@@ -79,17 +151,20 @@ APIS = [
 
     dict(
         name='get_ticker',
-        path='ticker/24hr'
+        path='ticker/24hr',
+        weight=symbol_weight(1, 40)
     ),
 
     dict(
         name='get_ticker_price',
-        path='ticker/price'
+        path='ticker/price',
+        weight=symbol_weight(1, 2)
     ),
 
     dict(
         name='get_orderbook_ticker',
-        path='ticker/bookTicker'
+        path='ticker/bookTicker',
+        weight=symbol_weight(1, 2)
     ),
 
     # Account endpoints
@@ -97,6 +172,7 @@ APIS = [
     dict(
         name='create_order',
         path='order',
+        orders=1,
         method=RequestMethod.POST,
         security_type=SecurityType.TRADE
     ),
@@ -124,12 +200,14 @@ APIS = [
     dict(
         name='get_open_orders',
         path='openOrders',
+        weight=symbol_weight(1, 40),
         security_type=SecurityType.USER_DATA
     ),
 
     dict(
         name='get_all_orders',
         path='allOrders',
+        weight=5,
         security_type=SecurityType.USER_DATA
     ),
 
@@ -137,6 +215,7 @@ APIS = [
     dict(
         name='create_oco',
         path='order/oco',
+        orders=2,
         method=RequestMethod.POST,
         security_type=SecurityType.TRADE
     ),
@@ -157,24 +236,28 @@ APIS = [
     dict(
         name='get_all_oco',
         path='allOrderList',
+        weight=10,
         security_type=SecurityType.USER_DATA
     ),
 
     dict(
         name='get_open_oco',
         path='openOrderList',
+        weight=2,
         security_type=SecurityType.USER_DATA
     ),
 
     dict(
         name='get_account',
         path='account',
+        weight=5,
         security_type=SecurityType.USER_DATA
     ),
 
     dict(
         name='get_trades',
         path='myTrades',
+        weight=5,
         security_type=SecurityType.USER_DATA
     )
 ]
@@ -187,19 +270,53 @@ def define_getter(
     params=True,
     version=REST_API_VERSION,
     method=RequestMethod.GET,
-    security_type=SecurityType.NONE
+    security_type=SecurityType.NONE,
+    weight=1,
+    orders=0,
+    on_response=None,
+    cache_ttl=None,
+    schema=None
 ):
-    def getter(self, **kwargs):
+    def request(self, **kwargs):
         uri = self._rest_uri(path, version)
         ka = kwargs if params else {}
 
-        return self._request(
-            method,
-            uri,
-            security_type,
-            **ka
+        return self._request_cached(
+            name,
+            ka,
+            cache_ttl,
+            lambda: self._request(
+                method,
+                uri,
+                security_type,
+                weight=weight(ka) if callable(weight) else weight,
+                orders=orders,
+                **ka
+            )
         )
 
+    if on_response is None:
+        getter = request
+    else:
+        async def getter(self, **kwargs):
+            response = await request(self, **kwargs)
+            getattr(self, on_response)(response, kwargs)
+            return response
+
+    if schema is not None:
+        raw_getter = getter
+
+        def getter(self, columnar=None, **kwargs):
+            if columnar is None:
+                return raw_getter(self, **kwargs)
+
+            columnar = ColumnarFormat(columnar)
+            check_columnar_format(columnar)
+
+            return decode_response(
+                raw_getter(self, **kwargs), schema, columnar
+            )
+
     origin = getattr(Target, name)
 
     # Migrate the docstring to the new getter
@@ -335,6 +452,7 @@ class RestAPIGetters:
         Args:
             symbol (str): The symbol.
             limit (:obj:`int`, optional): Defaults to 100; max 5000.
+            columnar (:obj:`ColumnarFormat`, optional): if specified, the rows are decoded into typed columns of the format instead of being returned as a list.
 
         Returns:
             list: A list of recent trade orders. For example::
@@ -362,6 +480,7 @@ class RestAPIGetters:
             symbol (str): The symbol name
             limit (:obj:`int`, optional): Defaults to 500, max 1000.
             fromId (:obj:`long`, optional): TradeId to fetch from. Default gets most recent trades.
+            columnar (:obj:`ColumnarFormat`, optional): if specified, the rows are decoded into typed columns of the format instead of being returned as a list.
 
         Returns:
             list: A list of trade orders. For example::
@@ -391,6 +510,7 @@ class RestAPIGetters:
             startTime (:obj:`long`, optional): Timestamp in ms to get aggregate trades from INCLUSIVE.
             endTime (:obj:`long`, optional): Timestamp in ms to get aggregate trades until INCLUSIVE.
             limit (:obj:`int`, optional): Defaults to 500, max 1000.
+            columnar (:obj:`ColumnarFormat`, optional): if specified, the rows are decoded into typed columns of the format instead of being returned as a list.
 
             If both ``startTime`` and ``endTime`` are sent, time between ``startTime`` and ``endTime`` must be less than 1 hour.
             If ``fromId``, ``startTime``, and ``endTime`` are not sent, the most recent aggregate trades will be returned.
@@ -422,6 +542,7 @@ class RestAPIGetters:
             startTime (:obj:`long`, optional):
             endTime (:obj:`long`, optional):
             limit (:obj:`int`, optional): Defaults to 500, max 1000.
+            columnar (:obj:`ColumnarFormat`, optional): if specified, the rows are decoded into typed columns of the format instead of being returned as a list.
 
             If ``startTime`` and ``endTime`` are not sent, the most recent klines are returned.
 
@@ -1,5 +1,6 @@
 from typing import Awaitable
 from binance.common.constants import (
+    ASSET_INFO_CACHE_TTL,
     REST_API_VERSION,
     SecurityType,
     RequestMethod
@@ -61,12 +62,14 @@ APIS = [
 
     dict(
         name='get_trade_fee',
-        path='tradeFee'
+        path='tradeFee',
+        cache_ttl=ASSET_INFO_CACHE_TTL
     ),
 
     dict(
         name='get_asset_detail',
-        path='assetDetail'
+        path='assetDetail',
+        cache_ttl=ASSET_INFO_CACHE_TTL
     ),
 
     dict(
@@ -115,17 +118,26 @@ def define_getter(
     params=True,
     version=REST_API_VERSION,
     method=RequestMethod.GET,
-    security_type=SecurityType.USER_DATA
+    security_type=SecurityType.USER_DATA,
+    cache_ttl=None
 ) -> None:
     def getter(self, **kwargs) -> Awaitable:
         uri = self._wapi_uri(path, version, prefix)
         ka = kwargs if params else {}
 
-        return self._request(
-            method,
-            uri,
-            security_type,
-            **ka
+        return self._request_cached(
+            name,
+            ka,
+            cache_ttl,
+            lambda: self._request(
+                method,
+                uri,
+                security_type,
+                # The limits of wapi and sapi are not tracked
+                #   by the rate limiter
+                weight=0,
+                **ka
+            )
         )
 
     origin = getattr(Target, name)
@@ -1,25 +1,56 @@
+from typing import (
+    Optional,
+    Union
+)
+
 from binance.apis import (
     RestAPIGetters,
-    WapiAPIGetters
+    WapiAPIGetters,
+    HistoryAPIs
 )
 
 from aioretry import RetryPolicy
 
 from binance.subscribe.manager import SubscriptionManager
+from binance.subscribe.recorder import (
+    Recorder,
+    snapshot_stream
+)
+from binance.common.metrics import Metrics
 from binance.common.constants import (
     REST_API_HOST,
     STREAM_HOST,
-    DEFAULT_RETRY_POLICY, DEFAULT_STREAM_TIMEOUT
+    DEFAULT_RETRY_POLICY, DEFAULT_STREAM_TIMEOUT,
+    DEFAULT_STREAM_CLOSE_CODE,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_SIZE_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_STREAM_SHARDS,
+    ShardStrategy,
+    OverflowPolicy
 )
 from binance.common.types import Timeout
+from binance.common.codec import (
+    JSONCodec,
+    get_json_codec
+)
 
 from .base import ClientBase
+from .clock import Clock
+from .rate_limiter import RateLimiter
+from .cache import ResponseCache
+from .single_flight import SingleFlight
+from .signer import (
+    Signer,
+    HMACSigner
+)
 
 
 class Client(
     ClientBase,
     RestAPIGetters,
     WapiAPIGetters,
+    HistoryAPIs,
     SubscriptionManager
 ):
     def __init__(
@@ -32,7 +63,23 @@ class Client(
         # website_host=WEBSITE_HOST,
         stream_host: str = STREAM_HOST,
         stream_retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
-        stream_timeout: Timeout = DEFAULT_STREAM_TIMEOUT
+        stream_timeout: Timeout = DEFAULT_STREAM_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_size_per_host: int = DEFAULT_POOL_SIZE_PER_HOST,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        json_codec: Union[str, JSONCodec, None] = None,
+        stream_shards: int = DEFAULT_STREAM_SHARDS,
+        stream_shard_strategy: ShardStrategy = ShardStrategy.HASH,
+        handler_processes: int = 0,
+        stream_queue_size: Optional[int] = None,
+        stream_overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        signer: Optional[Signer] = None,
+        clock_sync_interval: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        recorder: Optional[Recorder] = None,
+        metrics: Optional[Metrics] = None
     ):
         """Binance API Client constructor
 
@@ -42,26 +89,85 @@ class Client(
         :type api_secret: str.
         :param requests_params: optional - Dictionary of requests params to use for all calls
         :type requests_params: dict.
+        :param pool_size: optional - max number of connections kept by the http session, 0 for no limit
+        :type pool_size: int.
+        :param pool_size_per_host: optional - max number of connections to the same host, 0 for no limit
+        :type pool_size_per_host: int.
+        :param dns_cache_ttl: optional - seconds to cache resolved DNS entries, `None` to cache forever
+        :type dns_cache_ttl: int.
+        :param json_codec: optional - the json codec for both rest api responses and stream messages, which could be `'orjson'`, `'msgspec'`, `'ujson'`, `'json'` or a `JSONCodec`. Defaults to the fastest installed one
+        :type json_codec: str or JSONCodec.
+        :param stream_shards: optional - the number of stream connections to distribute subscriptions among
+        :type stream_shards: int.
+        :param stream_shard_strategy: optional - how to distribute subscriptions among stream connections, by the hash of symbols or by the load of connections
+        :type stream_shard_strategy: ShardStrategy.
+        :param handler_processes: optional - the number of worker processes to run handlers, 0 to run handlers in the current process
+        :type handler_processes: int.
+        :param stream_queue_size: optional - the max number of messages queued between the socket reader and handlers for each stream connection, `None` to handle messages before reading the next one
+        :type stream_queue_size: int.
+        :param stream_overflow_policy: optional - what to do if the message queue is full
+        :type stream_overflow_policy: OverflowPolicy.
+        :param signer: optional - the signer of signed requests, such as `RSASigner` and `Ed25519Signer`. Defaults to a `HMACSigner` of `api_secret`
+        :type signer: Signer.
+        :param clock_sync_interval: optional - seconds between the syncs of the server clock, whose offset is applied to the timestamps of signed requests. `None` to use the local clock
+        :type clock_sync_interval: float.
+        :param rate_limiter: optional - the rate limiter to queue rest api requests according to their weights, whose limits are updated with `get_exchange_info()`. `None` to send requests immediately
+        :type rate_limiter: RateLimiter.
+        :param response_cache: optional - the cache of the responses of slow-moving endpoints, such as `get_exchange_info()`. `None` to request every time
+        :type response_cache: ResponseCache.
+        :param coalesce_requests: optional - whether concurrent unsigned GET requests of the same url and params share a single request and its response
+        :type coalesce_requests: bool.
+        :param recorder: optional - the recorder to record the raw messages of all stream connections to segment files, which should be closed by `await recorder.close()`
+        :type recorder: Recorder.
+        :param metrics: optional - the metrics to collect the latencies of stream messages, handlers and rest api requests, such as `HistogramMetrics`. `None` to collect nothing
+        :type metrics: Metrics.
 
         """
 
         self._api_key = None
         self._api_secret = None
+        self._signer = None
 
         self.key(api_key)
         self.secret(api_secret)
 
+        if signer is not None:
+            self._signer = signer
+
         self._request_params = request_params
         self._api_host = api_host
 
+        self._clock = Clock()
+        self._clock_sync_interval = clock_sync_interval
+        self._clock_synced = None
+        self._clock_sync_task = None
+
+        self._rate_limiter = rate_limiter
+        self._response_cache = response_cache
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._exchange_info = None
+        self._symbol_filters = {}
+
+        self._session = None
+        self._pool_size = pool_size
+        self._pool_size_per_host = pool_size_per_host
+        self._dns_cache_ttl = dns_cache_ttl
+        self._json_codec = get_json_codec(json_codec)
+
         self._stream_host = stream_host
         self._stream_retry_policy = stream_retry_policy
         self._stream_timeout = stream_timeout
+        self._stream_queue_size = stream_queue_size
+        self._stream_overflow_policy = stream_overflow_policy
+        self._recorder = recorder
+        self._metrics = metrics
 
         self._receiving = True
         self._handler_ctx = None
-        self._data_stream = None
-        self._subscribed = set()
+        self._data_streams = [None] * stream_shards
+        self._stream_shard_strategy = stream_shard_strategy
+        self._subscribed = {}
+        self._handler_processes = handler_processes
 
     def key(self, key):
         """Defines or changes api key. This method is unnecessary if we only request APIs of `SecurityType.NONE`
@@ -91,4 +197,49 @@ class Client(
 
         if secret:
             self._api_secret = secret
+            self._signer = HMACSigner(secret)
         return self
+
+    def _on_orderbook(self, orderbook: dict, params: dict) -> None:
+        if self._recorder is None:
+            return
+
+        # Snapshots are recorded along with stream messages,
+        #   from which orderbooks could be replayed
+        self._recorder.record(
+            snapshot_stream(params['symbol']),
+            self._json_codec.dumps(orderbook)
+        )
+
+    def _get_worker_kwargs(self) -> dict:
+        # The arguments to create the client of a handler worker process
+        return dict(
+            api_key=self._api_key,
+            api_secret=self._api_secret,
+            signer=self._signer,
+            clock_sync_interval=self._clock_sync_interval,
+            coalesce_requests=self._single_flight is not None,
+            request_params=self._request_params,
+            api_host=self._api_host,
+            pool_size=self._pool_size,
+            pool_size_per_host=self._pool_size_per_host,
+            dns_cache_ttl=self._dns_cache_ttl,
+            json_codec=self._json_codec
+        )
+
+    async def close(
+        self,
+        code: int = DEFAULT_STREAM_CLOSE_CODE
+    ) -> None:
+        """Closes stream connection, clear all stream subscriptions and clear all handlers, stops syncing the server clock, and then closes the pooled http session.
+
+        The client could still be used after closed, and new connections will be created on demand.
+
+        Args:
+            code (:obj:`int`, optional): the close code for python library websockets. Defaults to 4999, and it should be in the range 4000 - 4999
+        """
+
+        await SubscriptionManager.close(self, code)
+
+        self._stop_clock_sync()
+        await self._close_api_session()
@@ -1,21 +1,27 @@
 import asyncio
-import hashlib
-import hmac
+import logging
 import time
 from operator import itemgetter
+from urllib.parse import (
+    urlencode,
+    quote
+)
 
 from typing import (
-    List,
+    Callable,
     Dict,
     Awaitable,
     Optional,
+    Tuple,
     Any
 )
 
 from aiohttp import (
     ClientSession,
-    ClientResponse
+    ClientResponse,
+    TCPConnector
 )
+from yarl import URL
 
 from binance.common.exceptions import (
     APIKeyNotDefinedException,
@@ -25,79 +31,271 @@ from binance.common.exceptions import (
 )
 
 from binance.common.constants import (
+    CLOCK_SYNC_BURST,
     HEADER_API_KEY,
+    METRIC_REST_LATENCY,
+    METRIC_REST_WEIGHT,
     SecurityType,
     RequestMethod
 )
 
 from binance.common.types import APIResponse
+from binance.common.codec import JSONCodec
+from binance.common.metrics import Metrics
+from binance.common.utils import (
+    format_msg,
+    repr_exception
+)
 
-# pylint: disable=no-member
-
+from .signer import Signer
+from .rate_limiter import RateLimiter
+from .cache import ResponseCache
+from .single_flight import SingleFlight
+from .exchange_info import (
+    SymbolFilters,
+    index_symbol_filters
+)
+from .clock import (
+    Clock,
+    now_ms
+)
 
-def sort_params(data: dict) -> List[str]:
-    """
-    Convert params to list with signature as last element
-    """
-    has_signature = False
-    params = []
+# pylint: disable=no-member
 
-    for key, value in data.items():
-        if key == 'signature':
-            has_signature = True
-        else:
-            params.append((key, str(value)))
+logger = logging.getLogger(__name__)
 
-    # sort parameters by key
-    params.sort(key=itemgetter(0))
 
-    if has_signature:
-        params.append(('signature', data['signature']))
+def encode_params(data: dict) -> str:
+    """Encodes params into the canonical query string sorted by keys
+    """
 
-    return params
+    return urlencode(sorted(
+        [(key, str(value)) for key, value in data.items()],
+        key=itemgetter(0)
+    ))
 
 
 KEY_REQUEST_PARAMS = 'request_params'
 KEY_FORCE_PARAMS = 'force_params'
 
 
-def get_headers(
-    api_key: Optional[str]
-) -> Dict[str, str]:
-    headers = {
+def get_headers() -> Dict[str, str]:
+    return {
         'Accept': 'application/json',
         'User-Agent': 'binance-sdk'
     }
 
-    if api_key is not None:
-        headers[HEADER_API_KEY] = api_key
-
-    return headers
-
 
 class ClientBase:
     _api_key: Optional[str]
     _api_secret: Optional[str]
+    _signer: Optional[Signer]
     _request_params: Optional[dict]
+    _session: Optional[ClientSession]
+    _pool_size: int
+    _pool_size_per_host: int
+    _dns_cache_ttl: Optional[int]
+    _json_codec: JSONCodec
+    _clock: Clock
+    _clock_sync_interval: Optional[float]
+    _clock_synced: Optional[asyncio.Future]
+    _clock_sync_task: Optional[asyncio.Task]
+    _rate_limiter: Optional[RateLimiter]
+    _response_cache: Optional[ResponseCache]
+    _single_flight: Optional[SingleFlight]
+    _exchange_info: Optional[dict]
+    _symbol_filters: SymbolFilters
+    _metrics: Optional[Metrics]
+
+    def _get_api_session(self) -> ClientSession:
+        """Gets the long-lived http session, the session will be created
+        on demand and be reused by all following requests so that
+        the underlying connections could be kept alive.
+        """
 
-    def _init_api_session(
-        self,
-        api_key: Optional[str]
-    ) -> ClientSession:
-        loop = asyncio.get_event_loop()
+        session = self._session
+
+        if session is None or session.closed:
+            connector = TCPConnector(
+                limit=self._pool_size,
+                limit_per_host=self._pool_size_per_host,
+                ttl_dns_cache=self._dns_cache_ttl
+            )
+
+            session = ClientSession(
+                connector=connector,
+                headers=get_headers()
+            )
+
+            self._session = session
 
-        session = ClientSession(
-            loop=loop,
-            headers=get_headers(api_key)
-        )
         return session
 
+    async def _close_api_session(self) -> None:
+        session = self._session
+
+        if session is None:
+            return
+
+        self._session = None
+
+        if not session.closed:
+            await session.close()
+
+    @property
+    def clock(self) -> Clock:
+        """Clock: the estimation of the server clock, whose `offset` in milliseconds is applied to the timestamps of signed requests, and `uncertainty` is the max error of the offset
+        """
+
+        return self._clock
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """RateLimiter: the client-side rate limiter, or `None` if requests are not limited
+        """
+
+        return self._rate_limiter
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """ResponseCache: the cache of rest api responses, or `None` if responses are not cached
+        """
+
+        return self._response_cache
+
+    @property
+    def symbol_filters(self) -> SymbolFilters:
+        """SymbolFilters: symbol -> filterType -> filter of the latest exchange info, which is empty until the exchange info is requested
+        """
+
+        return self._symbol_filters
+
+    async def get_symbol_filters(self, symbol: str) -> Optional[Dict[str, dict]]:
+        """Gets the filters of a symbol from the exchange info. The exchange info is only requested if the symbol is not found in the latest one, and the request could be served by the response cache
+
+        Args:
+            symbol (str): the symbol name, such as `'BTCUSDT'`
+
+        Returns:
+            Optional[dict]: filterType -> filter, or `None` if the symbol does not exist. For example::
+
+                {
+                    'PRICE_FILTER': {
+                        'filterType': 'PRICE_FILTER',
+                        'minPrice': '0.01000000',
+                        'maxPrice': '1000000.00000000',
+                        'tickSize': '0.01000000'
+                    },
+                    'LOT_SIZE': {...},
+                    'MIN_NOTIONAL': {...}
+                }
+        """
+
+        filters = self._symbol_filters.get(symbol)
+
+        if filters is not None:
+            return filters
+
+        # The symbol might be listed after the latest exchange info
+        await self.get_exchange_info()
+        return self._symbol_filters.get(symbol)
+
+    def _request_cached(
+        self,
+        name: str,
+        params: dict,
+        cache_ttl: Optional[float],
+        request: Callable[[], Awaitable[APIResponse]]
+    ) -> Awaitable[APIResponse]:
+        cache = self._response_cache
+
+        if cache is None:
+            return request()
+
+        return cache.get(name, params, cache_ttl, request)
+
+    def _on_exchange_info(self, exchange_info: dict, params: dict) -> None:
+        if exchange_info is self._exchange_info:
+            # A cached response
+            return
+
+        self._exchange_info = exchange_info
+        self._symbol_filters = index_symbol_filters(exchange_info)
+
+        rate_limits = exchange_info.get('rateLimits')
+
+        if self._rate_limiter is not None and rate_limits:
+            self._rate_limiter.set_rate_limits(rate_limits)
+
+    def _on_orderbook(self, orderbook: dict, params: dict) -> None:
+        # Overridden by the client to record snapshots
+        pass
+
+    async def sync_clock(
+        self,
+        samples: int = 1
+    ) -> None:
+        """Measures the offset of the server clock by requesting the server time
+
+        Args:
+            samples (:obj:`int`, optional): the number of round trips to measure. Defaults to `1`
+        """
+
+        for _ in range(samples):
+            sent = now_ms()
+            response = await self.get_server_time()
+            received = now_ms()
+
+            self._clock.add_sample(sent, response['serverTime'], received)
+
+    async def _keep_clock_synced(self) -> None:
+        samples = CLOCK_SYNC_BURST
+
+        while True:
+            try:
+                await self.sync_clock(samples)
+            except Exception as e:
+                logger.error(
+                    format_msg('fails to sync clock: %s', repr_exception(e))
+                )
+
+            if not self._clock_synced.done():
+                # Signed requests will not wait for the clock
+                #   even if the first sync fails
+                self._clock_synced.set_result(None)
+
+            samples = 1
+            await asyncio.sleep(self._clock_sync_interval)
+
+    async def _wait_clock_synced(self) -> None:
+        if self._clock_sync_task is None:
+            self._clock_synced = asyncio.Future()
+            self._clock_sync_task = asyncio.create_task(
+                self._keep_clock_synced()
+            )
+
+        await self._clock_synced
+
+    def _stop_clock_sync(self) -> None:
+        if self._clock_sync_task is not None:
+            self._clock_sync_task.cancel()
+            self._clock_sync_task = None
+
+            if not self._clock_synced.done():
+                # Otherwise, signed requests waiting for the first sync
+                #   will hang forever
+                self._clock_synced.cancel()
+
+            self._clock_synced = None
+
     def _get_request_kwargs(
         self,
         method: RequestMethod,
+        uri: str,
+        api_key: Optional[str],
         need_signed: bool,
         **data
-    ) -> Dict[str, Any]:
+    ) -> Tuple[Any, Dict[str, Any]]:
         # Usually, `data` is the data param for aiohttp
 
         kwargs: Dict[str, Any] = dict(
@@ -121,37 +319,51 @@ class ClientBase:
             force_params = True
             del data[KEY_FORCE_PARAMS]
 
+        headers = kwargs.get('headers', {})
+
+        if api_key is not None:
+            # The api key is applied per request rather than baked into
+            #   the session, so that the session could be shared
+            headers = {
+                **headers,
+                HEADER_API_KEY: api_key
+            }
+
         if need_signed:
-            # generate signature
-            data['timestamp'] = int(time.time() * 1000)
-            data['signature'] = self._generate_signature(data)
+            data['timestamp'] = self._clock.now()
 
-        sorted_data = sort_params(data)
+        # The query string is built only once,
+        #   which is signed and then sent as it is
+        query = encode_params(data)
 
-        param_key = 'params' \
-            if force_params or method == RequestMethod.GET else 'data'
+        if need_signed:
+            query = self._sign_query(query)
 
-        kwargs[param_key] = sorted_data
+        if query:
+            if force_params or method == RequestMethod.GET:
+                separator = '&' if '?' in uri else '?'
 
-        return kwargs
+                # The query is already encoded, and should not be changed
+                #   by aiohttp, otherwise the signature will be invalid
+                uri = URL(uri + separator + query, encoded=True)
+            else:
+                kwargs['data'] = query
+                headers = {
+                    **headers,
+                    'Content-Type': 'application/x-www-form-urlencoded'
+                }
 
-    def _generate_signature(
-        self,
-        data: dict
-    ) -> str:
-        ordered_data = sort_params(data)
+        if headers:
+            kwargs['headers'] = headers
 
-        query_string = '&'.join([
-            f'{key}={value}'
-            for key, value in ordered_data
-        ])
+        return uri, kwargs
 
-        m = hmac.new(
-            self._api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256)
+    def _sign_query(self, query: str) -> str:
+        signature = self._signer.sign(query.encode('utf-8'))
 
-        return m.hexdigest()
+        # Signatures of asymmetric keys are base64 strings
+        #   which need to be url-encoded
+        return f'{query}&signature={quote(signature, safe="")}'
 
     async def _handle_response(
         self,
@@ -159,8 +371,11 @@ class ClientBase:
     ) -> APIResponse:
         if not str(response.status).startswith('2'):
             raise StatusException(response, await response.text())
+
+        body = await response.read()
+
         try:
-            return await response.json()
+            return self._json_codec.loads(body)
         except ValueError:
             raise InvalidResponseException(response, await response.text())
 
@@ -170,6 +385,8 @@ class ClientBase:
         method: RequestMethod,
         uri: str,
         security_type: SecurityType = SecurityType.NONE,
+        weight: int = 1,
+        orders: int = 0,
         **kwargs
     ) -> APIResponse:
         need_api_key, need_signed = security_type.value
@@ -182,17 +399,96 @@ class ClientBase:
         else:
             api_key = None
 
-        if need_signed and self._api_secret is None:
+        if need_signed and self._signer is None:
             raise APISecretNotDefinedException(uri)
 
-        req_kwargs = self._get_request_kwargs(
-            method, need_signed, **kwargs)
+        if need_signed and self._clock_sync_interval is not None:
+            await self._wait_clock_synced()
+
+        # Signed requests wait for the rate limiter before they are
+        #   timestamped, otherwise the timestamp could be older than
+        #   `recvWindow` after waiting, and the request will be rejected
+        acquire = not need_signed
+
+        if not acquire and weight and self._rate_limiter is not None:
+            await self._rate_limiter.acquire(weight, orders)
+
+        url, req_kwargs = self._get_request_kwargs(
+            method, uri, api_key, need_signed, **kwargs)
+
+        coalesced = self._single_flight is not None and \
+            method == RequestMethod.GET and \
+            not need_signed and \
+            KEY_REQUEST_PARAMS not in kwargs
+
+        if coalesced:
+            # The url contains the canonical query string sorted by keys
+            return await self._single_flight.do(
+                str(url),
+                lambda: self._send(
+                    method, uri, url, req_kwargs, weight, orders, acquire
+                )
+            )
+
+        return await self._send(
+            method, uri, url, req_kwargs, weight, orders, acquire
+        )
+
+    async def _send(
+        self,
+        method: RequestMethod,
+        uri: str,
+        url: Any,
+        req_kwargs: Dict[str, Any],
+        weight: int,
+        orders: int,
+        acquire: bool = True
+    ) -> APIResponse:
+        session = self._get_api_session()
+
+        # Requests of zero weight are not limited, such as wapi requests
+        rate_limiter = self._rate_limiter if weight else None
+
+        if acquire and rate_limiter is not None:
+            await rate_limiter.acquire(weight, orders)
+
+        metrics = self._metrics
+
+        if metrics is None:
+            return await self._fetch(
+                session, method, url, req_kwargs, rate_limiter
+            )
+
+        # Tagged by the uri without the query string
+        metrics.increment(METRIC_REST_WEIGHT, uri, weight)
+        start = time.perf_counter_ns()
+
+        try:
+            return await self._fetch(
+                session, method, url, req_kwargs, rate_limiter
+            )
+        finally:
+            metrics.observe(
+                METRIC_REST_LATENCY,
+                uri,
+                time.perf_counter_ns() - start
+            )
+
+    async def _fetch(
+        self,
+        session: ClientSession,
+        method: RequestMethod,
+        url: Any,
+        req_kwargs: Dict[str, Any],
+        rate_limiter: Optional[RateLimiter]
+    ) -> APIResponse:
+        async with getattr(
+            session, method.value
+        )(url, **req_kwargs) as response:
+            if rate_limiter is not None:
+                rate_limiter.update(response.status, response.headers)
 
-        async with self._init_api_session(api_key) as session:
-            async with getattr(
-                session, method.value
-            )(uri, **req_kwargs) as response:
-                return await self._handle_response(response)
+            return await self._handle_response(response)
 
     def get(self, uri, **kwargs) -> Awaitable[APIResponse]:
         """Sends a GET request.
@@ -0,0 +1,121 @@
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple
+)
+
+from binance.common.types import APIResponse
+
+from .single_flight import SingleFlight
+
+
+def params_key(params: dict) -> Tuple[Tuple[str, str], ...]:
+    """Returns a hashable key of params which is irrelevant to the order of params
+    """
+
+    return tuple(sorted(
+        (key, str(value)) for key, value in params.items()
+    ))
+
+
+class ResponseCache:
+    """Caches the responses of slow-moving rest api endpoints, such as `get_exchange_info()`.
+
+    Concurrent requests of the same endpoint and params share a single request. Cached responses are shared by all callers, so they should not be modified.
+
+    Args:
+        ttls (:obj:`Dict[str, float]`, optional): the name of an api method -> seconds to cache its responses, which overrides the default ttl of the endpoint. `0` to disable the cache of the endpoint
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None
+    ) -> None:
+        self._ttls = {} if ttls is None else ttls
+
+        # key -> (expires_at, response)
+        self._entries: Dict[Hashable, Tuple[float, APIResponse]] = {}
+        self._flights = SingleFlight()
+
+        # Increased on invalidation, so that the responses of requests
+        #   sent before invalidation are not cached
+        self._generation = 0
+
+    def ttl(
+        self,
+        name: str,
+        default: Optional[float] = None
+    ) -> Optional[float]:
+        return self._ttls.get(name, default)
+
+    async def get(
+        self,
+        name: str,
+        params: dict,
+        default_ttl: Optional[float],
+        request: Callable[[], Awaitable[APIResponse]]
+    ) -> APIResponse:
+        """Gets the cached response or requests a new one
+
+        Args:
+            name (str): the name of the api method
+            params (dict): the params of the request
+            default_ttl (:obj:`float`, optional): the default ttl of the endpoint
+            request (Callable): the function to send the request
+        """
+
+        ttl = self.ttl(name, default_ttl)
+
+        if not ttl:
+            return await request()
+
+        key = (name, params_key(params))
+        entry = self._entries.get(key)
+
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        return await self._flights.do(
+            (self._generation, key),
+            lambda: self._fetch(key, ttl, request)
+        )
+
+    async def _fetch(
+        self,
+        key: Hashable,
+        ttl: float,
+        request: Callable[[], Awaitable[APIResponse]]
+    ) -> APIResponse:
+        generation = self._generation
+        response = await request()
+
+        if generation == self._generation:
+            # The ttl starts when the response arrives
+            self._entries[key] = (time.monotonic() + ttl, response)
+
+        return response
+
+    def invalidate(
+        self,
+        name: Optional[str] = None
+    ) -> None:
+        """Removes the cached responses
+
+        Args:
+            name (:obj:`str`, optional): the name of the api method. Defaults to all methods
+        """
+
+        self._generation += 1
+
+        if name is None:
+            self._entries.clear()
+            return
+
+        for key in [
+            key for key in self._entries if key[0] == name
+        ]:
+            del self._entries[key]
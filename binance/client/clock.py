@@ -0,0 +1,79 @@
+import time
+from collections import deque
+from typing import (
+    Deque,
+    Optional,
+    Tuple
+)
+
+from binance.common.constants import DEFAULT_CLOCK_SAMPLES
+
+
+def now_ms() -> float:
+    return time.time() * 1000
+
+
+class Clock:
+    """Estimates the offset of the server clock relative to the local clock.
+
+    Each sample is a round trip of `get_server_time`, in which the server time is assumed to be at the middle of the round trip. The error of a sample is at most half of its round-trip time, so the sample with the minimum round-trip time among the recent ones is used.
+
+    Args:
+        samples (:obj:`int`, optional): the max number of recent samples to keep
+    """
+
+    def __init__(
+        self,
+        samples: int = DEFAULT_CLOCK_SAMPLES
+    ) -> None:
+        # (round_trip_time, offset) in milliseconds
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=samples)
+
+        self._offset = 0.
+        self._uncertainty = None
+
+    @property
+    def synced(self) -> bool:
+        return self._uncertainty is not None
+
+    @property
+    def offset(self) -> float:
+        """float: milliseconds to add to the local time to get the server time. Defaults to `0` if not synced
+        """
+
+        return self._offset
+
+    @property
+    def uncertainty(self) -> Optional[float]:
+        """float: the max error of the offset in milliseconds, or `None` if not synced
+        """
+
+        return self._uncertainty
+
+    def add_sample(
+        self,
+        sent: float,
+        server_time: float,
+        received: float
+    ) -> None:
+        """Adds a sample of a round trip
+
+        Args:
+            sent (float): the local time in milliseconds when the request is sent
+            server_time (float): the server time in milliseconds of the response
+            received (float): the local time in milliseconds when the response is received
+        """
+
+        round_trip_time = received - sent
+        offset = server_time - (sent + received) / 2
+
+        self._samples.append((round_trip_time, offset))
+
+        round_trip_time, self._offset = min(self._samples)
+        self._uncertainty = round_trip_time / 2
+
+    def now(self) -> int:
+        """Returns the estimated server time in milliseconds
+        """
+
+        return int(now_ms() + self._offset)
@@ -0,0 +1,29 @@
+from typing import Dict
+
+# symbol -> filterType -> filter, such as
+# {
+#     'BTCUSDT': {
+#         'PRICE_FILTER': {
+#             'filterType': 'PRICE_FILTER',
+#             'minPrice': '0.01000000',
+#             'maxPrice': '1000000.00000000',
+#             'tickSize': '0.01000000'
+#         },
+#         'LOT_SIZE': {...},
+#         'MIN_NOTIONAL': {...}
+#     }
+# }
+SymbolFilters = Dict[str, Dict[str, dict]]
+
+
+def index_symbol_filters(exchange_info: dict) -> SymbolFilters:
+    """Indexes the filters of the exchange info by symbol and filter type
+    """
+
+    return {
+        info['symbol']: {
+            f['filterType']: f
+            for f in info.get('filters', ())
+        }
+        for info in exchange_info.get('symbols', ())
+    }
@@ -0,0 +1,234 @@
+import asyncio
+import time
+from typing import (
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple
+)
+
+from binance.common.constants import (
+    RateLimitType,
+    DEFAULT_RATE_LIMITS,
+    HEADER_USED_WEIGHT_PREFIX,
+    HEADER_ORDER_COUNT_PREFIX,
+    HEADER_RETRY_AFTER,
+    STATUS_TOO_MANY_REQUESTS,
+    STATUS_IP_BANNED
+)
+
+# rateLimits[].interval -> (the unit of header intervals, seconds)
+INTERVALS = {
+    'SECOND': ('S', 1),
+    'MINUTE': ('M', 60),
+    'HOUR': ('H', 60 * 60),
+    'DAY': ('D', 60 * 60 * 24)
+}
+
+# Seconds to wait if 429 or 418 is received without Retry-After
+DEFAULT_RETRY_AFTER = 60
+
+# (RateLimitType, interval), e.g. (RateLimitType.REQUEST_WEIGHT, '1M')
+BucketKey = Tuple[RateLimitType, str]
+
+
+class TokenBucket:
+    """The token bucket of a rate limit, which is refilled continuously at the rate of `limit` per `interval` seconds.
+
+    Args:
+        limit (int): the capacity of the bucket
+        interval (float): seconds to refill the whole bucket
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        interval: float
+    ) -> None:
+        self.limit = limit
+        self.interval = interval
+
+        self._rate = limit / interval
+        self._tokens = float(limit)
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+
+        self._tokens = min(
+            self.limit,
+            self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def delay(self, amount: int) -> float:
+        """Returns seconds to wait until there are enough tokens
+        """
+
+        self._refill()
+
+        # A request heavier than the limit could be sent
+        #   only if the bucket is full
+        amount = min(amount, self.limit)
+
+        if self._tokens >= amount:
+            return 0
+
+        return (amount - self._tokens) / self._rate
+
+    def consume(self, amount: int) -> None:
+        self._refill()
+        self._tokens -= amount
+
+    def reconcile(self, used: int) -> None:
+        """Reconciles the bucket with the usage reported by the server
+        """
+
+        self._refill()
+        self._tokens = min(self._tokens, self.limit - used)
+
+
+class RateLimiter:
+    """The client-side rate limiter which queues requests to avoid exceeding the rate limits of Binance, which would lead to 429 and then IP bans (418).
+
+    Requests are scheduled in order, each of which consumes its weight from the `REQUEST_WEIGHT` buckets, one from the `RAW_REQUESTS` buckets, and the number of orders it creates from the `ORDERS` buckets. The buckets are reconciled with the `X-MBX-USED-WEIGHT-*` and `X-MBX-ORDER-COUNT-*` headers of responses.
+
+    Args:
+        rate_limits (:obj:`list`, optional): `rateLimits` in the format of the response of `client.get_exchange_info()`. Defaults to the documented limits, and will be updated every time the exchange info is requested by the client
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[Iterable[dict]] = None
+    ) -> None:
+        self._buckets: Dict[BucketKey, TokenBucket] = {}
+        self._banned_until = 0.
+        self._lock = asyncio.Lock()
+
+        self.set_rate_limits(
+            DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits
+        )
+
+    def set_rate_limits(
+        self,
+        rate_limits: Iterable[dict]
+    ) -> None:
+        """Sets the rate limits. The tokens of existing buckets are kept
+
+        Args:
+            rate_limits (list): `rateLimits` of the exchange info
+        """
+
+        buckets = {}
+
+        for rate_limit in rate_limits:
+            unit, seconds = INTERVALS[rate_limit['interval']]
+            interval_num = rate_limit['intervalNum']
+
+            key = (
+                RateLimitType(rate_limit['rateLimitType']),
+                f'{interval_num}{unit}'
+            )
+
+            bucket = TokenBucket(
+                rate_limit['limit'],
+                interval_num * seconds
+            )
+
+            old = self._buckets.get(key)
+
+            if old is not None:
+                bucket.reconcile(old.limit - old.tokens)
+
+            buckets[key] = bucket
+
+        self._buckets = buckets
+
+    def _costs(
+        self,
+        weight: int,
+        orders: int
+    ) -> Iterable[Tuple[TokenBucket, int]]:
+        for (limit_type, _), bucket in self._buckets.items():
+            if limit_type == RateLimitType.REQUEST_WEIGHT:
+                cost = weight
+            elif limit_type == RateLimitType.ORDERS:
+                cost = orders
+            else:
+                cost = 1
+
+            if cost:
+                yield bucket, cost
+
+    async def acquire(
+        self,
+        weight: int = 1,
+        orders: int = 0
+    ) -> None:
+        """Waits until the request could be sent without exceeding any limit
+
+        Args:
+            weight (:obj:`int`, optional): the request weight. Defaults to `1`
+            orders (:obj:`int`, optional): the number of orders the request creates. Defaults to `0`
+        """
+
+        # The lock is fair, so that requests are sent in order
+        async with self._lock:
+            while True:
+                delay = self._banned_until - time.monotonic()
+
+                for bucket, cost in self._costs(weight, orders):
+                    delay = max(delay, bucket.delay(cost))
+
+                if delay <= 0:
+                    break
+
+                await asyncio.sleep(delay)
+
+            for bucket, cost in self._costs(weight, orders):
+                bucket.consume(cost)
+
+    def update(
+        self,
+        status: int,
+        headers: Mapping[str, str]
+    ) -> None:
+        """Updates the rate limiter with the response of a request
+
+        Args:
+            status (int): the response status
+            headers (Mapping): the response headers
+        """
+
+        for name, value in headers.items():
+            name = name.upper()
+
+            if name.startswith(HEADER_USED_WEIGHT_PREFIX):
+                limit_type = RateLimitType.REQUEST_WEIGHT
+                interval = name[len(HEADER_USED_WEIGHT_PREFIX):]
+            elif name.startswith(HEADER_ORDER_COUNT_PREFIX):
+                limit_type = RateLimitType.ORDERS
+                interval = name[len(HEADER_ORDER_COUNT_PREFIX):]
+            else:
+                continue
+
+            bucket = self._buckets.get((limit_type, interval))
+
+            if bucket is not None:
+                bucket.reconcile(int(value))
+
+        if status in (STATUS_TOO_MANY_REQUESTS, STATUS_IP_BANNED):
+            retry_after = headers.get(HEADER_RETRY_AFTER)
+            retry_after = DEFAULT_RETRY_AFTER if retry_after is None \
+                else int(retry_after)
+
+            self._banned_until = max(
+                self._banned_until,
+                time.monotonic() + retry_after
+            )
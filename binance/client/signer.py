@@ -0,0 +1,157 @@
+import base64
+import hashlib
+import hmac
+from typing import (
+    Optional,
+    Union
+)
+
+from binance.common.utils import format_msg
+
+
+KeyData = Union[str, bytes]
+
+
+def _to_bytes(data: KeyData) -> bytes:
+    return data.encode('utf-8') if isinstance(data, str) else data
+
+
+class Signer:
+    """The base class of signers which sign the query strings of `SecurityType.TRADE` and `SecurityType.USER_DATA` requests.
+
+    A signer should be picklable so that it could be used by handler worker processes.
+    """
+
+    def sign(self, payload: bytes) -> str:
+        """Signs the canonical query string of a request
+
+        Args:
+            payload (bytes): the encoded query string
+
+        Returns:
+            str: the signature which is not url-encoded yet
+        """
+        ...  # pragma: no cover
+
+
+class HMACSigner(Signer):
+    """Signs requests with HMAC SHA256 of the api secret, which is the default signer if `api_secret` is specified.
+
+    Args:
+        secret (str): the api secret
+    """
+
+    def __init__(self, secret: str) -> None:
+        self._secret = secret
+
+        # The key is processed only once,
+        #   and the keyed hmac object is copied for each request
+        self._hmac = hmac.new(
+            secret.encode('utf-8'),
+            digestmod=hashlib.sha256
+        )
+
+    def sign(self, payload: bytes) -> str:
+        m = self._hmac.copy()
+        m.update(payload)
+
+        return m.hexdigest()
+
+    def __reduce__(self):
+        return type(self), (self._secret,)
+
+
+class PrivateKeySigner(Signer):
+    """The base class of signers with an asymmetric private key, which requires the `cryptography` package.
+
+    Args:
+        private_key (Union[str, bytes]): the PEM encoded private key
+        password (:obj:`Union[str, bytes]`, optional): the password of the private key if it is encrypted
+    """
+
+    KEY_TYPE_NAME = None
+
+    def __init__(
+        self,
+        private_key: KeyData,
+        password: Optional[KeyData] = None
+    ) -> None:
+        try:
+            from cryptography.hazmat.primitives.serialization import (
+                load_pem_private_key
+            )
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                format_msg(
+                    '`cryptography` is required for `%s`',
+                    type(self).__name__
+                )
+            )
+
+        self._private_key = private_key
+        self._password = password
+
+        key = load_pem_private_key(
+            _to_bytes(private_key),
+            None if password is None else _to_bytes(password)
+        )
+
+        if not self._is_key_type(key):
+            raise ValueError(
+                format_msg(
+                    '%s private key expected, but got `%s`',
+                    self.KEY_TYPE_NAME,
+                    type(key).__name__
+                )
+            )
+
+        self._key = key
+
+    def _is_key_type(self, key) -> bool:
+        ...  # pragma: no cover
+
+    def _sign(self, payload: bytes) -> bytes:
+        ...  # pragma: no cover
+
+    def sign(self, payload: bytes) -> str:
+        return base64.b64encode(self._sign(payload)).decode('ascii')
+
+    def __reduce__(self):
+        return type(self), (self._private_key, self._password)
+
+
+class RSASigner(PrivateKeySigner):
+    """Signs requests with RSASSA-PKCS1-v1_5 SHA256 of an RSA private key.
+    """
+
+    KEY_TYPE_NAME = 'RSA'
+
+    def _is_key_type(self, key) -> bool:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import (
+            padding,
+            rsa
+        )
+
+        self._padding = padding.PKCS1v15()
+        self._algorithm = hashes.SHA256()
+
+        return isinstance(key, rsa.RSAPrivateKey)
+
+    def _sign(self, payload: bytes) -> bytes:
+        return self._key.sign(payload, self._padding, self._algorithm)
+
+
+class Ed25519Signer(PrivateKeySigner):
+    """Signs requests with an Ed25519 private key.
+    """
+
+    KEY_TYPE_NAME = 'Ed25519'
+
+    def _is_key_type(self, key) -> bool:
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+
+        return isinstance(key, ed25519.Ed25519PrivateKey)
+
+    def _sign(self, payload: bytes) -> bytes:
+        return self._key.sign(payload)
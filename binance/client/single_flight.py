@@ -0,0 +1,79 @@
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    TypeVar
+)
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single call, whose result is shared by all callers.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Calls `call()`, or waits for the ongoing call of the same key
+
+        Args:
+            key (Hashable): the key of the call
+            call (Callable): the function to call if there is no ongoing call of the key
+
+        Returns:
+            the result of the call
+        """
+
+        while True:
+            future = self._flights.get(key)
+
+            if future is None:
+                return await self._lead(key, call)
+
+            try:
+                # A cancelled follower should not cancel the call of others
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # The follower itself is cancelled
+                    raise
+
+                # The leading caller is cancelled, so try again
+
+    async def _lead(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]]
+    ) -> T:
+        # The leading caller runs the call by itself,
+        #   so that there is no overhead if the call is not shared
+        future = asyncio.get_running_loop().create_future()
+        self._flights[key] = future
+
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+
+            # Mark the exception as retrieved in case there is no follower
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
@@ -0,0 +1,318 @@
+import bisect
+from array import array
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union
+)
+
+from .constants import LevelFormat
+from .sequenced_list import Pair
+
+
+# Batches with at least so many levels are merged in a single sorted-merge
+#   pass, otherwise level by level, because the fixed cost of a vectorized
+#   merge outweighs the cost of memmoves for small depth updates.
+#
+# Merging random batches into books of 1000 / 5000 levels with numpy:
+#
+#   levels   level by level     numpy merge
+#   16       12.7 / 20.0 us     34.0 / 54.8 us
+#   32       24.8 / 42.2 us     44.5 / 69.1 us
+#   64       50.8 / 105.0 us    60.9 / 82.6 us
+#   128      167.0 / 163.9 us   86.8 / 112.8 us
+#   256      205.9 / 389.6 us   146.8 / 189.0 us
+BATCH_MERGE_THRESHOLD = 64
+
+
+class ArraySequencedList:
+    """Sequenced list to maintain asks or bids, which has the same behavior as `SequencedList` but stores ascending prices and their quantities in two contiguous float64 arrays.
+
+    Prices and quantities are converted to floats when merged, so that orderbooks backed by it only support `LevelFormat.FLOAT`. Large batches, such as depth snapshots, are applied in a single sorted-merge pass which is vectorized if numpy is installed.
+    """
+
+    # The level formats of orderbooks which the list could store
+    LEVEL_FORMATS = (LevelFormat.FLOAT,)
+
+    def __init__(
+        self,
+        pairs: Iterable[Pair] = ()
+    ) -> None:
+        self._prices = array('d')
+        self._quantities = array('d')
+        self.merge(pairs)
+
+    @property
+    def prices(self):
+        """numpy.ndarray or memoryview: the read-only view of the prices without copying. The view reflects the list until the list is changed next time.
+        """
+
+        return _readonly_view(self._prices)
+
+    @property
+    def quantities(self):
+        """numpy.ndarray or memoryview: the read-only view of the quantities without copying. The view reflects the list until the list is changed next time.
+        """
+
+        return _readonly_view(self._quantities)
+
+    def clear(self) -> None:
+        self._prices = array('d')
+        self._quantities = array('d')
+
+    def _detach(self) -> None:
+        # An array could not be resized if any views of it are still alive,
+        #   in which situation, we leave the views to the old arrays
+        try:
+            self._prices.append(0.)
+            self._prices.pop()
+        except BufferError:
+            self._prices = array('d', self._prices)
+            self._quantities = array('d', self._quantities)
+            return
+
+        try:
+            self._quantities.append(0.)
+            self._quantities.pop()
+        except BufferError:
+            self._quantities = array('d', self._quantities)
+
+    def add(
+        self,
+        subject: Pair
+    ) -> Tuple[int, bool]:
+        """Adds a new level into the list and maintains order.
+
+        Returns:
+            Tuple[int, bool]: the insert index, and whether the price already exists
+        """
+
+        self._detach()
+        return self._add(float(subject[0]), float(subject[1]))
+
+    def _add(
+        self,
+        price: float,
+        quantity: float
+    ) -> Tuple[int, bool]:
+        prices = self._prices
+        index = bisect.bisect_left(prices, price)
+
+        if index < len(prices) and prices[index] == price:
+            if quantity == 0:
+                del prices[index]
+                del self._quantities[index]
+            else:
+                self._quantities[index] = quantity
+
+            return index, True
+
+        if quantity != 0:
+            prices.insert(index, price)
+            self._quantities.insert(index, quantity)
+
+        return index, False
+
+    def bisect_left(self, price: float) -> int:
+        """Returns the index of the first level whose price is not less than `price`
+        """
+
+        return bisect.bisect_left(self._prices, price)
+
+    def bisect_right(self, price: float) -> int:
+        """Returns the index of the first level whose price is greater than `price`
+        """
+
+        return bisect.bisect_right(self._prices, price)
+
+    def merge(
+        self,
+        levels: Iterable[Pair]
+    ) -> None:
+        """Merges a batch of levels into the list. Levels with zero quantity remove the corresponding prices.
+        """
+
+        if not isinstance(levels, (list, tuple)):
+            levels = list(levels)
+
+        count = len(levels)
+
+        if count >= BATCH_MERGE_THRESHOLD and \
+                count >= len(self._prices) * _MERGE_BOOK_RATIO:
+            self._prices, self._quantities = _merge(
+                self._prices,
+                self._quantities,
+                levels
+            )
+            return
+
+        self._detach()
+
+        for price, quantity in levels:
+            self._add(float(price), float(quantity))
+
+    # -------------------------------------------------
+    # Sequence methods
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def __iter__(self) -> Iterator[Pair]:
+        return zip(self._prices, self._quantities)
+
+    def __getitem__(
+        self,
+        index: Union[int, slice]
+    ) -> Union[Pair, List[Pair]]:
+        if isinstance(index, slice):
+            return list(zip(self._prices[index], self._quantities[index]))
+
+        return self._prices[index], self._quantities[index]
+
+    def __eq__(self, other: Any) -> bool:
+        try:
+            if len(other) != len(self):
+                return False
+
+            return all(
+                a[0] == b[0] and a[1] == b[1]
+                for a, b in zip(self, other)
+            )
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)})'
+
+
+def _array_merge(
+    prices: array,
+    quantities: array,
+    batch: List[Pair]
+) -> Tuple[array, array]:
+    # The latter one wins if there are duplicate prices
+    levels = sorted({
+        float(price): float(quantity)
+        for price, quantity in batch
+    }.items())
+
+    merged_prices = array('d')
+    merged_quantities = array('d')
+
+    length = len(prices)
+    i = 0
+
+    for price, quantity in levels:
+        while i < length and prices[i] < price:
+            merged_prices.append(prices[i])
+            merged_quantities.append(quantities[i])
+            i += 1
+
+        if i < length and prices[i] == price:
+            # Override or remove the existing level
+            i += 1
+
+        if quantity != 0:
+            merged_prices.append(price)
+            merged_quantities.append(quantity)
+
+    merged_prices.extend(prices[i:])
+    merged_quantities.extend(quantities[i:])
+
+    return merged_prices, merged_quantities
+
+
+try:
+    import numpy as np
+
+    def _readonly_view(arr: array):
+        view = np.frombuffer(arr, dtype=np.float64)
+        view.flags.writeable = False
+        return view
+
+    def _numpy_merge(
+        prices: array,
+        quantities: array,
+        batch: List[Pair]
+    ) -> Tuple[array, array]:
+        count = len(batch)
+
+        pairs = np.fromiter(
+            (float(x) for level in batch for x in level),
+            dtype=np.float64,
+            count=count * 2
+        ).reshape(-1, 2)
+
+        order = np.argsort(pairs[:, 0], kind='stable')
+        new_prices = pairs[order, 0]
+        new_quantities = pairs[order, 1]
+
+        # Keep the last one of duplicate prices
+        last = np.empty(count, dtype=bool)
+        np.not_equal(new_prices[1:], new_prices[:-1], out=last[:-1])
+        last[-1] = True
+        new_prices = new_prices[last]
+        new_quantities = new_quantities[last]
+
+        old_prices = np.frombuffer(prices, dtype=np.float64)
+        old_quantities = np.frombuffer(quantities, dtype=np.float64)
+
+        length = len(old_prices)
+        index = np.searchsorted(old_prices, new_prices)
+
+        if length:
+            exists = old_prices.take(index, mode='clip') == new_prices
+            exists &= index < length
+        else:
+            exists = np.zeros(len(new_prices), dtype=bool)
+
+        nonzero = new_quantities != 0
+
+        # Levels to keep
+        keep = np.ones(length, dtype=bool)
+        keep[index[exists]] = False
+        keep_prices = old_prices[keep]
+        keep_quantities = old_quantities[keep]
+
+        # Levels to override or to insert
+        upsert = nonzero
+        upsert_prices = new_prices[upsert]
+        position = np.searchsorted(keep_prices, upsert_prices)
+        position += np.arange(len(position))
+
+        size = len(keep_prices) + len(upsert_prices)
+        is_kept = np.ones(size, dtype=bool)
+        is_kept[position] = False
+
+        merged_prices = np.empty(size, dtype=np.float64)
+        merged_prices[position] = upsert_prices
+        merged_prices[is_kept] = keep_prices
+
+        merged_quantities = np.empty(size, dtype=np.float64)
+        merged_quantities[position] = new_quantities[upsert]
+        merged_quantities[is_kept] = keep_quantities
+
+        return (
+            array('d', merged_prices.tobytes()),
+            array('d', merged_quantities.tobytes())
+        )
+
+    _merge = _numpy_merge
+    _MERGE_BOOK_RATIO = 0
+
+except ModuleNotFoundError:  # pragma: no cover
+    # If numpy is not installed
+    def _readonly_view(arr: array):
+        return memoryview(arr).toreadonly()
+
+    _merge = _array_merge
+
+    # The pure python merge copies the whole book, which is only faster
+    #   than memmoves for batches about as large as the book, such as
+    #   snapshots. For 1000 / 5000 levels, batches of 1000 levels take
+    #   0.9 / 1.9 ms level by level and 1.1 / 2.8 ms merged, and batches of
+    #   5000 levels take 6.4 / 8.9 ms level by level and 3.0 / 3.9 ms merged
+    _MERGE_BOOK_RATIO = 1
@@ -0,0 +1,176 @@
+import json
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union
+)
+
+from .exceptions import UnsupportedJSONCodecException
+
+
+JSONText = Union[str, bytes]
+
+
+class JSONCodec:
+    """The base class of json codecs which are used to decode stream messages and rest api responses, and to encode outbound stream messages.
+
+    A codec should raise a `ValueError` if it fails to decode a JSON text.
+    """
+
+    NAME = None
+
+    def loads(self, s: JSONText) -> Any:
+        ...  # pragma: no cover
+
+    def dumps(self, obj: Any) -> str:
+        ...  # pragma: no cover
+
+    def __reduce_ex__(self, protocol):
+        # Built-in codecs hold functions or encoders of json libraries
+        #   which might not be picklable, so they are re-created by name
+        #   in other processes, such as handler worker processes
+        if type(self) in JSON_CODECS:
+            return get_json_codec, (self.NAME,)
+
+        return super().__reduce_ex__(protocol)
+
+
+class StdJSONCodec(JSONCodec):
+    NAME = 'json'
+
+    def __init__(self) -> None:
+        self.loads = json.loads
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+
+class OrjsonCodec(JSONCodec):
+    NAME = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        # orjson.JSONDecodeError is a subclass of ValueError
+        self.loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj).decode()
+
+
+class UjsonCodec(JSONCodec):
+    NAME = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+
+        self.loads = ujson.loads
+        self._dumps = ujson.dumps
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj, ensure_ascii=False)
+
+
+class MsgspecCodec(JSONCodec):
+    NAME = 'msgspec'
+
+    def __init__(self) -> None:
+        from msgspec import (
+            DecodeError,
+            json as msgspec_json
+        )
+
+        self._decode = msgspec_json.Decoder().decode
+        self._encode = msgspec_json.Encoder().encode
+        self._decode_error = DecodeError
+
+    def loads(self, s: JSONText) -> Any:
+        try:
+            return self._decode(s)
+        except self._decode_error as e:
+            # msgspec.DecodeError is not a subclass of ValueError
+            raise ValueError(str(e))
+
+    def dumps(self, obj: Any) -> str:
+        return self._encode(obj).decode()
+
+
+# Codecs ordered by preference, the first available one will be used
+#   if the codec is not specified
+JSON_CODECS = [
+    OrjsonCodec,
+    MsgspecCodec,
+    UjsonCodec,
+    StdJSONCodec
+]
+
+_codec_cache: Dict[str, JSONCodec] = {}
+
+
+def _create_codec(Codec: type) -> Optional[JSONCodec]:
+    codec = _codec_cache.get(Codec.NAME)
+
+    if codec is not None:
+        return codec
+
+    try:
+        codec = Codec()
+    except ImportError:
+        return None
+
+    _codec_cache[Codec.NAME] = codec
+    return codec
+
+
+def _get_default_codec() -> JSONCodec:
+    for Codec in JSON_CODECS:
+        codec = _create_codec(Codec)
+
+        if codec is not None:
+            return codec
+
+    # StdJSONCodec is always available
+    return StdJSONCodec()  # pragma: no cover
+
+
+def get_json_codec(
+    codec: Union[str, JSONCodec, None] = None
+) -> JSONCodec:
+    """Gets a json codec
+
+    Args:
+        codec (:obj:`Union[str, JSONCodec]`, optional): either the name of a codec which should be one of `'orjson'`, `'msgspec'`, `'ujson'` and `'json'`, or an instance of `JSONCodec`. Defaults to `None` which means the fastest installed codec.
+
+    Returns:
+        JSONCodec: the codec. If the specified codec is not installed, it will fallback to the fastest installed codec.
+
+    Raises:
+        UnsupportedJSONCodecException: If the name of the codec is unknown
+    """
+
+    if codec is None:
+        return _get_default_codec()
+
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    for Codec in JSON_CODECS:
+        if Codec.NAME == codec:
+            return _create_codec(Codec) or _get_default_codec()
+
+    raise UnsupportedJSONCodecException(codec)
+
+
+def json_stringify(
+    obj: Any,
+    codec: Union[str, JSONCodec, None] = None
+) -> str:
+    """Encodes `obj` into a compact JSON string
+
+    Args:
+        codec (:obj:`Union[str, JSONCodec]`, optional): the json codec to encode with, which should be the codec configured for the client or stream. Defaults to the fastest installed one
+    """
+
+    return get_json_codec(codec).dumps(obj)
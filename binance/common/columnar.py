@@ -0,0 +1,225 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+    Union
+)
+
+from .constants import ColumnarFormat
+from .utils import format_msg
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover
+    np = None
+
+try:
+    import pandas as pd
+except ModuleNotFoundError:  # pragma: no cover
+    pd = None
+
+
+# Kinds of columns
+INT = 'int'
+FLOAT = 'float'
+BOOL = 'bool'
+STR = 'str'
+
+# (key of the row, column name, kind)
+Field = Tuple[Union[int, str], str, str]
+
+# Rest api responses
+# ==================================================
+
+# Klines are lists, and the last item is ignored
+REST_KLINE_FIELDS: List[Field] = [
+    (0, 'open_time', INT),
+    (1, 'open', FLOAT),
+    (2, 'high', FLOAT),
+    (3, 'low', FLOAT),
+    (4, 'close', FLOAT),
+    (5, 'volume', FLOAT),
+    (6, 'close_time', INT),
+    (7, 'quote_volume', FLOAT),
+    (8, 'total_trades', INT),
+    (9, 'taker_volume', FLOAT),
+    (10, 'taker_quote_volume', FLOAT)
+]
+
+REST_TRADE_FIELDS: List[Field] = [
+    ('id', 'trade_id', INT),
+    ('price', 'price', FLOAT),
+    ('qty', 'quantity', FLOAT),
+    ('quoteQty', 'quote_quantity', FLOAT),
+    ('time', 'trade_time', INT),
+    ('isBuyerMaker', 'is_maker', BOOL),
+    ('isBestMatch', 'is_best_match', BOOL)
+]
+
+REST_AGG_TRADE_FIELDS: List[Field] = [
+    ('a', 'agg_trade_id', INT),
+    ('p', 'price', FLOAT),
+    ('q', 'quantity', FLOAT),
+    ('f', 'first_trade_id', INT),
+    ('l', 'last_trade_id', INT),
+    ('T', 'trade_time', INT),
+    ('m', 'is_maker', BOOL),
+    ('M', 'is_best_match', BOOL)
+]
+
+# Stream messages, whose columns are renamed by handlers
+# ==================================================
+
+# column name -> kind
+STREAM_TRADE_KINDS: Dict[str, str] = {
+    'type': STR,
+    'event_time': INT,
+    'symbol': STR,
+    'price': FLOAT,
+    'quantity': FLOAT,
+    'trade_time': INT,
+    'is_maker': BOOL,
+    'trade_id': INT,
+    'buyer_order_id': INT,
+    'seller_order_id': INT,
+    'agg_trade_id': INT,
+    'first_trade_id': INT,
+    'last_trade_id': INT
+}
+
+STREAM_KLINE_KINDS: Dict[str, str] = {
+    'type': STR,
+    'event_time': INT,
+    'open_time': INT,
+    'close_time': INT,
+    'symbol': STR,
+    'interval': STR,
+    'first_trade_id': INT,
+    'last_trade_id': INT,
+    'open': FLOAT,
+    'high': FLOAT,
+    'low': FLOAT,
+    'close': FLOAT,
+    'is_closed': BOOL,
+    'volume': FLOAT,
+    'quote_volume': FLOAT,
+    'taker_volume': FLOAT,
+    'taker_quote_volume': FLOAT,
+    'total_trades': INT
+}
+
+
+def check_columnar_format(columnar_format: ColumnarFormat) -> None:
+    if np is None:  # pragma: no cover
+        raise ValueError(
+            format_msg('numpy is required for `%s`', columnar_format)
+        )
+
+    if columnar_format == ColumnarFormat.DATAFRAME and pd is None:
+        raise ValueError(  # pragma: no cover
+            format_msg('pandas is required for `%s`', columnar_format)
+        )
+
+    if columnar_format == ColumnarFormat.ARROW:
+        _import_pyarrow()
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            format_msg('`pyarrow` is required for `%s`', ColumnarFormat.ARROW)
+        )
+
+    return pa
+
+
+if np is not None:
+    DTYPES = {
+        INT: np.int64,
+        FLOAT: np.float64,
+        BOOL: np.bool_
+    }
+
+
+def _to_array(values: Sequence, kind: str):
+    try:
+        # Decimal strings are parsed by numpy in bulk
+        return np.asarray(values, dtype=DTYPES.get(kind, object))
+    except (TypeError, ValueError):
+        # Missing values, which could not be converted to int64,
+        #   are kept as they are
+        return np.asarray(values, dtype=object)
+
+
+def to_columnar(
+    columns: Dict[str, Sequence],
+    kinds: Dict[str, str],
+    columnar_format: ColumnarFormat
+) -> Any:
+    """Converts columns of raw values into typed columnar data
+
+    Args:
+        columns (dict): column name -> values
+        kinds (dict): column name -> kind. Columns of unknown kinds are kept as python objects
+        columnar_format (ColumnarFormat): the output format
+
+    Returns:
+        numpy.ndarray, pandas.DataFrame or pyarrow.RecordBatch
+    """
+
+    arrays = {
+        name: _to_array(values, kinds.get(name, STR))
+        for name, values in columns.items()
+    }
+
+    if columnar_format == ColumnarFormat.DATAFRAME:
+        return pd.DataFrame(arrays, copy=False)
+
+    if columnar_format == ColumnarFormat.ARROW:
+        return _import_pyarrow().RecordBatch.from_pydict(arrays)
+
+    length = len(next(iter(arrays.values()))) if arrays else 0
+
+    array = np.empty(length, dtype=[
+        (name, values.dtype) for name, values in arrays.items()
+    ])
+
+    for name, values in arrays.items():
+        array[name] = values
+
+    return array
+
+
+def decode_rows(
+    rows: Sequence,
+    fields: List[Field],
+    columnar_format: ColumnarFormat
+) -> Any:
+    """Decodes the rows of a rest api response into typed columnar data in one pass
+
+    Args:
+        rows (list): the list of lists or dicts
+        fields (list): the fields to decode
+        columnar_format (ColumnarFormat): the output format
+    """
+
+    if rows and isinstance(rows[0], list):
+        # Transposed by zip in C
+        transposed = list(zip(*rows))
+        columns = {
+            name: transposed[key] for key, name, _ in fields
+        }
+    else:
+        columns = {
+            name: [row[key] for row in rows] for key, name, _ in fields
+        }
+
+    return to_columnar(
+        columns,
+        {name: kind for _, name, kind in fields},
+        columnar_format
+    )
@@ -26,6 +26,39 @@ class SubType(Enum):
     USER = 'user'
 
 
+class DepthFormat(Enum):
+    # The format of depth updates received by `OrderBookHandlerBase`
+    # (pandas.DataFrame, [pandas.DataFrame, pandas.DataFrame])
+    DATAFRAME = 'dataframe'
+    # The same as DATAFRAME, but DataFrames are created only when accessed
+    LAZY_DATAFRAME = 'lazy_dataframe'
+    # (dict, [List[Tuple[float, float]], List[Tuple[float, float]]])
+    TUPLE = 'tuple'
+    # (dict, [numpy.ndarray, numpy.ndarray])
+    NUMPY = 'numpy'
+
+
+class LevelFormat(Enum):
+    # The numeric type of the price levels maintained by `OrderBook`
+    # Tuple[float, float]
+    FLOAT = 'float'
+    # Tuple[decimal.Decimal, decimal.Decimal]
+    DECIMAL = 'decimal'
+    # Tuple[int, int], integers scaled by the tick size and the step size
+    #   of the symbol from the exchange info
+    FIXED_POINT = 'fixed_point'
+
+
+class ColumnarFormat(Enum):
+    # The format of typed columnar klines and trades
+    # numpy structured array
+    NUMPY = 'numpy'
+    # pandas.DataFrame with numeric dtypes
+    DATAFRAME = 'dataframe'
+    # pyarrow.RecordBatch, which requires pyarrow
+    ARROW = 'arrow'
+
+
 class KlineInterval(Enum):
     M1 = '1m'
     M3 = '3m'
@@ -47,6 +80,33 @@ class KlineInterval(Enum):
     MONTH = '1M'
 
 
+MINUTE_MS = 60 * 1000
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+
+# The milliseconds of kline intervals of fixed length,
+#   `KlineInterval.MONTH` is not included
+KLINE_INTERVAL_MS = {
+    KlineInterval.M1: MINUTE_MS,
+    KlineInterval.M3: 3 * MINUTE_MS,
+    KlineInterval.M5: 5 * MINUTE_MS,
+    KlineInterval.M15: 15 * MINUTE_MS,
+    KlineInterval.M30: 30 * MINUTE_MS,
+
+    KlineInterval.H: HOUR_MS,
+    KlineInterval.H2: 2 * HOUR_MS,
+    KlineInterval.H4: 4 * HOUR_MS,
+    KlineInterval.H6: 6 * HOUR_MS,
+    KlineInterval.H8: 8 * HOUR_MS,
+    KlineInterval.H12: 12 * HOUR_MS,
+
+    KlineInterval.DAY: DAY_MS,
+    KlineInterval.DAY3: 3 * DAY_MS,
+
+    KlineInterval.WEEK: 7 * DAY_MS
+}
+
+
 MSG_PREFIX = '[BinanceSDK] '
 
 # RetryPolicy
@@ -82,6 +142,54 @@ DEFAULT_STREAM_CLOSE_CODE = 4999
 
 DEFAULT_DEPTH_LIMIT = 100
 
+DEFAULT_STREAM_SHARDS = 1
+
+# The snapshot requests of orderbooks use at most 300 of the weight
+#   (1200 per minute) of the client, and at most 4 of them are ongoing
+DEFAULT_SNAPSHOT_WEIGHT_BUDGET = 300
+DEFAULT_SNAPSHOT_INTERVAL = 60
+DEFAULT_SNAPSHOT_CONCURRENCY = 4
+
+# Recorded frames are collected into blocks of about 256KB, or those collected
+#   within a second, which are compressed and written by a writer thread
+DEFAULT_RECORDER_BLOCK_SIZE = 256 * 1024
+DEFAULT_RECORDER_FLUSH_INTERVAL = 1.
+# The zlib compression level of blocks, 0 for no compression
+DEFAULT_RECORDER_COMPRESSION = 6
+# The max number of blocks waiting for the writer thread,
+#   blocks beyond which are dropped rather than blocking the event loop
+DEFAULT_RECORDER_MAX_PENDING_BLOCKS = 64
+# A new segment file is created every 256MB or every hour
+DEFAULT_RECORDER_SEGMENT_SIZE = 256 * 1024 * 1024
+DEFAULT_RECORDER_SEGMENT_INTERVAL = 3600
+
+
+class ShardStrategy(Enum):
+    # The strategy to distribute subscriptions among stream connections
+    # Subscriptions of the same symbol always use the same connection
+    HASH = 'hash'
+    # Use the connection with the fewest subscriptions
+    LOAD = 'load'
+
+
+class OverflowPolicy(Enum):
+    # What to do if the message queue of a stream is full
+    # Wait for the handlers, and stop reading the socket in the meantime
+    BLOCK = 'block'
+    # Discard the oldest queued message
+    DROP_OLDEST = 'drop_oldest'
+    # Replace the queued ticker message of the same stream with the newer one,
+    #   and block for other messages
+    CONFLATE = 'conflate'
+
+
+# The payload types which represent the latest states rather than events,
+#   so that the older ones could be discarded by conflation
+CONFLATABLE_PAYLOAD_TYPES = (
+    '24hrTicker',
+    '24hrMiniTicker'
+)
+
 STREAM_TYPE_MAP = {
     'e': 'type'
 }
@@ -96,6 +204,12 @@ STREAM_OHLC_MAP = {
 KEY_PAYLOAD = 'data'
 KEY_PAYLOAD_TYPE = 'e'
 KEY_STREAM_TYPE = 'stream'
+# The pseudo stream type of the depth snapshots recorded by `Recorder`,
+#   such as `btcusdt@depthSnapshot`
+SNAPSHOT_STREAM_TYPE = 'depthSnapshot'
+KEY_SYMBOL = 's'
+KEY_EVENT_TIME = 'E'
+KEY_TRADE_TIME = 'T'
 
 ATOM = {}
 
@@ -148,6 +262,78 @@ class TimeInForce(Enum):
 
 HEADER_API_KEY = 'X-MBX-APIKEY'
 
+
+# Rate limits
+# ==================================================
+
+class RateLimitType(Enum):
+    REQUEST_WEIGHT = 'REQUEST_WEIGHT'
+    ORDERS = 'ORDERS'
+    RAW_REQUESTS = 'RAW_REQUESTS'
+
+
+# The documented rate limits, which are used
+#   until the exchange info is requested
+DEFAULT_RATE_LIMITS = [
+    dict(
+        rateLimitType='REQUEST_WEIGHT',
+        interval='MINUTE',
+        intervalNum=1,
+        limit=1200
+    ),
+    dict(
+        rateLimitType='ORDERS',
+        interval='SECOND',
+        intervalNum=10,
+        limit=50
+    ),
+    dict(
+        rateLimitType='ORDERS',
+        interval='DAY',
+        intervalNum=1,
+        limit=160000
+    ),
+    dict(
+        rateLimitType='RAW_REQUESTS',
+        interval='MINUTE',
+        intervalNum=5,
+        limit=6100
+    )
+]
+
+# Followed by the interval, such as `1M`
+HEADER_USED_WEIGHT_PREFIX = 'X-MBX-USED-WEIGHT-'
+HEADER_ORDER_COUNT_PREFIX = 'X-MBX-ORDER-COUNT-'
+HEADER_RETRY_AFTER = 'Retry-After'
+
+STATUS_TOO_MANY_REQUESTS = 429
+STATUS_IP_BANNED = 418
+
+# Connection pool of the http session
+# 100 is the same as the default limit of aiohttp
+DEFAULT_POOL_SIZE = 100
+# 0 means no limit
+DEFAULT_POOL_SIZE_PER_HOST = 0
+DEFAULT_DNS_CACHE_TTL = 10
+
+# The number of recent samples kept to estimate the server clock offset
+DEFAULT_CLOCK_SAMPLES = 10
+# The number of samples to take when the clock is synced for the first time
+CLOCK_SYNC_BURST = 3
+
+# Default seconds to cache the responses of slow-moving endpoints
+#   if the client has a response cache
+EXCHANGE_INFO_CACHE_TTL = 60
+ASSET_INFO_CACHE_TTL = 300
+
+# The max number of rows of a page of history endpoints
+MAX_HISTORY_PAGE_LIMIT = 1000
+# The number of pages requested concurrently by history iterators
+DEFAULT_HISTORY_CONCURRENCY = 4
+# The max time window of aggregate trades if both startTime and endTime
+#   are specified
+AGG_TRADES_MAX_WINDOW = HOUR_MS
+
 REST_API_VERSION = 'v3'
 REST_API_HOST = 'https://api.binance.com'
 
@@ -156,3 +342,35 @@ STREAM_KEY_RESULT = 'result'
 STREAM_KEY_ERROR = 'error'
 ERROR_KEY_CODE = 'code'
 ERROR_KEY_MESSAGE = 'msg'
+
+# Metrics
+# ==================================================
+
+# The names of metrics collected by `Metrics`,
+#   durations and latencies are in nanoseconds
+
+# Decoding a stream message, tagged by the stream name
+METRIC_STREAM_DECODE = 'stream.decode'
+# From the event time of the payload to the local receive time,
+#   tagged by the stream name
+METRIC_STREAM_LATENCY = 'stream.latency'
+# The count of messages, tagged by the stream name
+METRIC_STREAM_MESSAGES = 'stream.messages'
+# The count of reconnects, tagged by the stream uri
+METRIC_STREAM_RECONNECTS = 'stream.reconnects'
+# Routing a message to its processor
+METRIC_STREAM_ROUTE = 'stream.route'
+# Dispatching a payload to all handlers of a processor,
+#   tagged by the processor class
+METRIC_STREAM_DISPATCH = 'stream.dispatch'
+# `receiveDispatch` of a handler, tagged by the handler class
+METRIC_HANDLER_RECEIVE = 'handler.receive'
+# A rest api request, tagged by the endpoint uri
+METRIC_REST_LATENCY = 'rest.latency'
+# The total weight of rest api requests, tagged by the endpoint uri
+METRIC_REST_WEIGHT = 'rest.weight'
+
+# Histograms keep 7 significant bits of values,
+#   i.e. the relative error is less than 1/64
+DEFAULT_HISTOGRAM_SIGNIFICANT_BITS = 7
+DEFAULT_PERCENTILES = (50, 90, 99, 99.9)
@@ -0,0 +1,296 @@
+import bisect
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+from .sequenced_list import Pair
+
+
+# The number of levels of each bucket when buckets are built
+DEFAULT_BUCKET_SIZE = 32
+
+
+def _build_tree(values: list) -> list:
+    # Fenwick tree, `tree[i]` is the sum of the values of
+    #   `(i - lowbit(i), i]`, and `tree[0]` is not used
+    tree = [0]
+    tree.extend(values)
+    size = len(tree)
+
+    for i in range(1, size):
+        parent = i + (i & -i)
+        if parent < size:
+            tree[parent] += tree[i]
+
+    return tree
+
+
+def _tree_add(tree: list, index: int, delta) -> None:
+    index += 1
+    size = len(tree)
+
+    while index < size:
+        tree[index] += delta
+        index += index & -index
+
+
+def _tree_sum(tree: list, count: int):
+    # The sum of the first `count` values
+    total = 0
+
+    while count:
+        total += tree[count]
+        count &= count - 1
+
+    return total
+
+
+class CumulativeDepth:
+    """Cumulative quantities and notionals of one side of an orderbook.
+
+    Levels are grouped into buckets by price, and the sums of buckets are maintained in Fenwick trees, so that each changed level costs O(log n) and each query costs O(log n) plus a scan within a bucket. Buckets are built lazily by the first query, and are rebuilt if a bucket grows too large or a large batch, such as a snapshot, is merged.
+
+    Args:
+        levels (SequencedList | ArraySequencedList): the asks or the bids in ascending order
+        best_first (bool): `True` for asks whose best level is the first one, and `False` for bids whose best level is the last one
+        bucket_size (:obj:`int`, optional): the number of levels of each bucket when buckets are built
+    """
+
+    def __init__(
+        self,
+        levels,
+        best_first: bool,
+        bucket_size: int = DEFAULT_BUCKET_SIZE
+    ) -> None:
+        self._levels = levels
+        self._best_first = best_first
+        self._bucket_size = bucket_size
+
+        # The lowest prices of buckets except the first one
+        self._bounds = []
+        # The number of levels of each bucket
+        self._counts = []
+        # `None` indicates that buckets should be built before queries
+        self._quantities = None
+        self._notionals = None
+
+    def clear(self) -> None:
+        self._quantities = None
+        self._notionals = None
+
+    def update(
+        self,
+        levels: List[Pair]
+    ) -> None:
+        """Applies the changes of levels to the sums. This method should be called before the levels are merged, because it compares them with the existing ones.
+
+        Args:
+            levels (list): the parsed levels to merge
+        """
+
+        if self._quantities is None:
+            return
+
+        if len(levels) > self._bucket_size * 4:
+            # It is cheaper to rebuild buckets
+            self.clear()
+            return
+
+        existing = self._levels
+        length = len(existing)
+        bounds = self._bounds
+        counts = self._counts
+        max_count = self._bucket_size * 2
+
+        # The latter one wins if there are duplicate prices
+        for price, quantity in dict(levels).items():
+            index = existing.bisect_left(price)
+
+            if index < length and existing[index][0] == price:
+                old_quantity = existing[index][1]
+            else:
+                old_quantity = 0
+
+            if quantity == old_quantity:
+                continue
+
+            bucket = bisect.bisect_right(bounds, price)
+
+            _tree_add(self._quantities, bucket, quantity - old_quantity)
+            _tree_add(
+                self._notionals,
+                bucket,
+                price * quantity - price * old_quantity
+            )
+
+            if not old_quantity:
+                counts[bucket] += 1
+
+                if counts[bucket] > max_count:
+                    self.clear()
+                    return
+
+            elif not quantity:
+                counts[bucket] -= 1
+
+    def _build(self) -> None:
+        levels = list(self._levels)
+        length = len(levels)
+        size = self._bucket_size
+
+        self._bounds = [
+            levels[start][0]
+            for start in range(size, length, size)
+        ]
+
+        quantities = []
+        notionals = []
+        counts = []
+
+        for start in range(0, max(length, 1), size):
+            bucket = levels[start:start + size]
+
+            quantities.append(sum(quantity for _, quantity in bucket))
+            notionals.append(sum(price * quantity for price, quantity in bucket))
+            counts.append(len(bucket))
+
+        self._counts = counts
+        self._quantities = _build_tree(quantities)
+        self._notionals = _build_tree(notionals)
+
+    def _ensure(self) -> None:
+        if self._quantities is None:
+            self._build()
+
+    def _bucket_start(self, bucket: int) -> int:
+        # The index of the first level of the bucket
+        return self._levels.bisect_left(self._bounds[bucket - 1]) \
+            if bucket else 0
+
+    @property
+    def total(self):
+        """The total quantity of all levels"""
+
+        self._ensure()
+        return _tree_sum(self._quantities, len(self._counts))
+
+    def _quantity_below(self, price, inclusive: bool):
+        # The total quantity of the levels whose prices are less than
+        #   (or equal to) `price`
+        bucket = bisect.bisect_right(self._bounds, price)
+        levels = self._levels
+
+        end = levels.bisect_right(price) if inclusive \
+            else levels.bisect_left(price)
+
+        quantity = _tree_sum(self._quantities, bucket)
+
+        for i in range(self._bucket_start(bucket), end):
+            quantity += levels[i][1]
+
+        return quantity
+
+    def quantity_to(self, price):
+        """Gets the total quantity of the levels whose prices are not worse than `price`, i.e. not greater than `price` for asks, or not less than `price` for bids
+
+        Args:
+            price: the limit price
+
+        Returns:
+            the quantity
+        """
+
+        self._ensure()
+
+        if self._best_first:
+            return self._quantity_below(price, True)
+
+        return self.total - self._quantity_below(price, False)
+
+    def _search(
+        self,
+        target,
+        inclusive: bool
+    ) -> Optional[Tuple[Pair, object, object]]:
+        # Finds the first level in ascending order at which the cumulative
+        #   quantity reaches (`inclusive`) or exceeds `target`, and returns
+        #   the level and the sums of quantities and notionals below it
+        tree = self._quantities
+        count = len(tree) - 1
+        bucket = 0
+        below = 0
+        step = 1 << count.bit_length()
+
+        # Descend the tree to skip the buckets that could not reach
+        while step:
+            next_bucket = bucket + step
+
+            if next_bucket <= count:
+                next_below = below + tree[next_bucket]
+
+                if next_below < target or \
+                        not inclusive and next_below == target:
+                    bucket = next_bucket
+                    below = next_below
+
+            step >>= 1
+
+        notional = _tree_sum(self._notionals, bucket)
+        levels = self._levels
+
+        for i in range(self._bucket_start(bucket), len(levels)):
+            level = levels[i]
+            quantity = below + level[1]
+
+            if quantity > target or inclusive and quantity == target:
+                return level, below, notional
+
+            below = quantity
+            notional += level[0] * level[1]
+
+        return None
+
+    def fill(self, quantity) -> Optional[Tuple[float, float]]:
+        """Gets the prices to fill `quantity` by taking levels from the best one
+
+        Args:
+            quantity: the quantity to fill
+
+        Returns:
+            Optional[tuple]: the price of the worst level to take and the volume weighted average price, or `None` if the quantity is not positive or exceeds the total quantity
+        """
+
+        self._ensure()
+
+        total = self.total
+
+        if quantity <= 0 or quantity > total:
+            return None
+
+        if self._best_first:
+            # Asks are taken from the lowest price
+            found = self._search(quantity, True)
+
+            if found is None:
+                return None
+
+            (price, _), below, notional = found
+            notional += price * (quantity - below)
+
+        else:
+            # Bids are taken from the highest price, so the worst level is
+            #   where the quantity below exceeds the quantity left
+            found = self._search(total - quantity, False)
+
+            if found is None:
+                return None
+
+            (price, level_quantity), below, notional_below = found
+            above = total - below - level_quantity
+            notional = _tree_sum(self._notionals, len(self._counts)) - \
+                notional_below - price * level_quantity + \
+                price * (quantity - above)
+
+        return price, notional / quantity
@@ -77,6 +77,7 @@ class StatusException(Exception):
         text: str
     ) -> None:
         self.code = 0
+        self.message = text
         status = response.status
 
         if not str(status).startswith('5'):
@@ -161,6 +162,17 @@ class InvalidSubTypeParamException(Exception):
         )
 
 
+class UnsupportedJSONCodecException(Exception):
+    def __init__(
+        self,
+        codec: Any
+    ) -> None:
+        self.codec = codec
+
+    def __str__(self) -> str:
+        return format_msg('json codec "%s" is not supported', self.codec)
+
+
 class InvalidHandlerException(Exception):
     def __init__(
         self,
@@ -201,3 +213,20 @@ class OrderBookFetchAbandonedException(Exception):
             self.symbol,
             self.exception
         )
+
+
+class ReplaySnapshotNotFoundException(Exception):
+    def __init__(
+        self,
+        symbol: str,
+        position: int
+    ) -> None:
+        self.symbol = symbol
+        self.position = position
+
+    def __str__(self) -> str:
+        return format_msg(
+            'no depth snapshot of `%s` is recorded after %s',
+            self.symbol,
+            self.position
+        )
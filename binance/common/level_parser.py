@@ -0,0 +1,160 @@
+from decimal import Decimal
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union
+)
+
+from .constants import LevelFormat
+from .sequenced_list import Pair
+from .utils import format_msg
+
+# The raw level of depth snapshots and depth updates,
+#   such as `['0.00240000', '10.00000000']`
+RawLevel = Sequence[Union[str, float]]
+
+FILTER_PRICE = 'PRICE_FILTER'
+FILTER_LOT_SIZE = 'LOT_SIZE'
+
+KEY_TICK_SIZE = 'tickSize'
+KEY_STEP_SIZE = 'stepSize'
+
+
+class LevelParser:
+    """Parses raw levels into `(price, quantity)` tuples of floats. Levels are parsed only once when merged into an orderbook, so that the orderbook compares numbers instead of strings and consumers need not parse them again.
+    """
+
+    def parse(
+        self,
+        levels: Iterable[RawLevel]
+    ) -> List[Pair]:
+        return [
+            (float(price), float(quantity))
+            for price, quantity in levels
+        ]
+
+    def number(self, value):
+        """Converts a number, such as a price distance or a quantity of the orderbook queries, into the numeric type of parsed levels
+        """
+
+        return float(value)
+
+    def price(self, value) -> float:
+        """Converts a parsed price back to float
+        """
+
+        return float(value)
+
+    def quantity(self, value) -> float:
+        """Converts a parsed quantity back to float
+        """
+
+        return float(value)
+
+
+class DecimalLevelParser(LevelParser):
+    """Parses raw levels into `(price, quantity)` tuples of `decimal.Decimal`s without any loss of precision.
+    """
+
+    def parse(
+        self,
+        levels: Iterable[RawLevel]
+    ) -> List[Pair]:
+        return [
+            (Decimal(str(price)), Decimal(str(quantity)))
+            for price, quantity in levels
+        ]
+
+    def number(self, value) -> Decimal:
+        return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+class FixedPointLevelParser(LevelParser):
+    """Parses raw levels into `(price, quantity)` tuples of integers, i.e. the price in ticks and the quantity in steps, which are the cheapest to compare.
+
+    Args:
+        tick_size (str | float): the tick size of prices, `PRICE_FILTER.tickSize` of the symbol
+        step_size (str | float): the step size of quantities, `LOT_SIZE.stepSize` of the symbol
+    """
+
+    def __init__(
+        self,
+        tick_size: Union[str, float],
+        step_size: Union[str, float]
+    ) -> None:
+        self.tick_size = float(tick_size)
+        self.step_size = float(step_size)
+
+        if self.tick_size <= 0 or self.step_size <= 0:
+            raise ValueError(format_msg(
+                'tick_size and step_size must be positive, but got %s and %s',
+                tick_size,
+                step_size
+            ))
+
+        # Scales are calculated in decimal so that they are exact for
+        #   sizes such as 0.00001, and dividing integers by exact scales
+        #   results in the nearest floats of the decimal prices
+        self._price_scale = float(1 / Decimal(str(tick_size)))
+        self._quantity_scale = float(1 / Decimal(str(step_size)))
+
+    def parse(
+        self,
+        levels: Iterable[RawLevel]
+    ) -> List[Pair]:
+        price_scale = self._price_scale
+        quantity_scale = self._quantity_scale
+
+        return [
+            (
+                round(float(price) * price_scale),
+                round(float(quantity) * quantity_scale)
+            )
+            for price, quantity in levels
+        ]
+
+    def number(self, value):
+        # Numbers are in ticks or steps, which are kept as integers
+        return value if isinstance(value, int) else float(value)
+
+    def price(self, value) -> float:
+        return value / self._price_scale
+
+    def quantity(self, value) -> float:
+        return value / self._quantity_scale
+
+
+def create_level_parser(
+    level_format: LevelFormat,
+    filters: Optional[dict] = None
+) -> LevelParser:
+    """Creates the level parser of `level_format`
+
+    Args:
+        level_format (LevelFormat): the numeric type of levels
+        filters (:obj:`dict`, optional): filterType -> filter of the symbol, which is required by `LevelFormat.FIXED_POINT`
+
+    Returns:
+        LevelParser: the parser
+    """
+
+    if level_format == LevelFormat.DECIMAL:
+        return DecimalLevelParser()
+
+    if level_format == LevelFormat.FIXED_POINT:
+        try:
+            return FixedPointLevelParser(
+                filters[FILTER_PRICE][KEY_TICK_SIZE],
+                filters[FILTER_LOT_SIZE][KEY_STEP_SIZE]
+            )
+        except (KeyError, TypeError):
+            raise ValueError(format_msg(
+                '`%s` requires the %s and %s filters of the symbol',
+                level_format,
+                FILTER_PRICE,
+                FILTER_LOT_SIZE
+            ))
+
+    return LevelParser()
@@ -0,0 +1,339 @@
+import math
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple
+)
+
+from .constants import (
+    DEFAULT_HISTOGRAM_SIGNIFICANT_BITS,
+    DEFAULT_PERCENTILES
+)
+from .utils import (
+    format_msg,
+    wrap_coroutine
+)
+
+
+# (name, tag)
+MetricKey = Tuple[str, Optional[str]]
+
+# An exporter receives the report of `HistogramMetrics`
+Exporter = Callable[[Dict[str, List[dict]]], Any]
+
+
+class Metrics:
+    """The hooks to collect the metrics of the client, which are invoked on the hot paths of streams, handlers and rest apis if the metrics is passed to `Client(metrics=metrics)`. The names of metrics are the `METRIC_*` constants of `binance.common.constants`.
+
+    The methods do nothing by default. Subclass it to forward metrics to another monitor system, or use `HistogramMetrics`::
+
+        class StatsdMetrics(Metrics):
+            def observe(self, name, tag, value):
+                statsd.timing(name, value / 1e6, tags=[tag])
+
+            def increment(self, name, tag, amount=1):
+                statsd.increment(name, amount, tags=[tag])
+
+    Methods should be fast and should not raise.
+    """
+
+    def observe(
+        self,
+        name: str,
+        tag: Optional[str],
+        value: int
+    ) -> None:
+        """Records a value, such as a duration in nanoseconds
+
+        Args:
+            name (str): the name of the metric, such as `'stream.latency'`
+            tag (:obj:`str`, optional): the tag of the metric, such as the stream name
+            value (int): the value
+        """
+
+        ...  # pragma: no cover
+
+    def increment(
+        self,
+        name: str,
+        tag: Optional[str],
+        amount: int = 1
+    ) -> None:
+        """Increases a counter
+
+        Args:
+            name (str): the name of the metric, such as `'stream.messages'`
+            tag (:obj:`str`, optional): the tag of the metric
+            amount (:obj:`int`, optional): Defaults to `1`
+        """
+
+        ...  # pragma: no cover
+
+
+class Histogram:
+    """A histogram of non-negative integers with log-linear buckets like HdrHistogram, which records a value in O(1) with bounded relative error and memory
+
+    Args:
+        significant_bits (:obj:`int`, optional): the number of significant bits of recorded values, i.e. the relative error is less than `2 ** (1 - significant_bits)`. Defaults to `7`
+    """
+
+    def __init__(
+        self,
+        significant_bits: int = DEFAULT_HISTOGRAM_SIGNIFICANT_BITS
+    ) -> None:
+        if significant_bits < 1:
+            raise ValueError(
+                format_msg(
+                    'significant_bits should be positive, but got `%s`',
+                    significant_bits
+                )
+            )
+
+        self._bits = significant_bits
+        self._half = 1 << (significant_bits - 1)
+        # Values less than it are counted exactly
+        self._linear = 1 << significant_bits
+
+        # bucket index -> count
+        self._counts: Dict[int, int] = {}
+
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._linear:
+            return value
+
+        # Keep the highest `significant_bits` bits of the value
+        shift = value.bit_length() - self._bits
+        return shift * self._half + (value >> shift)
+
+    def _highest(self, index: int) -> int:
+        # The highest value of the bucket
+        if index < self._linear:
+            return index
+
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Records a value. Negative values are recorded as `0`
+        """
+
+        value = int(value)
+
+        if value < 0:
+            value = 0
+
+        index = self._index(value)
+        counts = self._counts
+        counts[index] = counts.get(index, 0) + 1
+
+        if self.count == 0 or value < self.min:
+            self.min = value
+
+        if value > self.max:
+            self.max = value
+
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        """float: the mean of recorded values
+        """
+
+        return self.total / self.count if self.count else 0.
+
+    def percentiles(
+        self,
+        percentiles: Iterable[float] = DEFAULT_PERCENTILES
+    ) -> Dict[float, int]:
+        """Gets the values at percentiles
+
+        Args:
+            percentiles (:obj:`Iterable[float]`, optional): the percentiles in (0, 100]. Defaults to `(50, 90, 99, 99.9)`
+
+        Returns:
+            Dict[float, int]: percentile -> value, which is the highest value of the bucket and no greater than the max value
+        """
+
+        percentiles = sorted(percentiles)
+        result = dict.fromkeys(percentiles, 0)
+
+        if not self.count:
+            return result
+
+        indexes = iter(sorted(self._counts))
+        seen = 0
+        index = None
+
+        for percentile in percentiles:
+            rank = max(1, math.ceil(percentile / 100 * self.count))
+
+            while seen < rank:
+                index = next(indexes)
+                seen += self._counts[index]
+
+            result[percentile] = min(self._highest(index), self.max)
+
+        return result
+
+    def percentile(self, percentile: float) -> int:
+        """Gets the value at a percentile, such as `99`
+        """
+
+        return self.percentiles((percentile,))[percentile]
+
+
+class HistogramMetrics(Metrics):
+    """Aggregates observed values into histograms and counters in memory, whose reports could be exported periodically::
+
+        metrics = HistogramMetrics(exporters=[print])
+        client = Client(metrics=metrics)
+
+        while True:
+            await asyncio.sleep(60)
+            await metrics.export(reset=True)
+
+    Args:
+        significant_bits (:obj:`int`, optional): see `Histogram`
+        exporters (:obj:`Iterable[Callable]`, optional): either sync or async callables which receive the reports
+    """
+
+    def __init__(
+        self,
+        significant_bits: int = DEFAULT_HISTOGRAM_SIGNIFICANT_BITS,
+        exporters: Iterable[Exporter] = ()
+    ) -> None:
+        self._bits = significant_bits
+        self._exporters = list(exporters)
+
+        self._histograms: Dict[MetricKey, Histogram] = {}
+        self._counters: Dict[MetricKey, int] = {}
+
+    def observe(
+        self,
+        name: str,
+        tag: Optional[str],
+        value: int
+    ) -> None:
+        key = (name, tag)
+        histogram = self._histograms.get(key)
+
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(self._bits)
+
+        histogram.record(value)
+
+    def increment(
+        self,
+        name: str,
+        tag: Optional[str],
+        amount: int = 1
+    ) -> None:
+        key = (name, tag)
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def histogram(
+        self,
+        name: str,
+        tag: Optional[str] = None
+    ) -> Optional[Histogram]:
+        """Gets the histogram of a metric, or `None` if nothing is observed
+        """
+
+        return self._histograms.get((name, tag))
+
+    def counter(
+        self,
+        name: str,
+        tag: Optional[str] = None
+    ) -> int:
+        """Gets the value of a counter
+        """
+
+        return self._counters.get((name, tag), 0)
+
+    def add_exporter(self, exporter: Exporter) -> None:
+        self._exporters.append(exporter)
+
+    def report(
+        self,
+        percentiles: Iterable[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, List[dict]]:
+        """Gets the report of all metrics
+
+        Returns:
+            dict: for example::
+
+                {
+                    'histograms': [
+                        {
+                            'name': 'rest.latency',
+                            'tag': 'https://api.binance.com/api/v3/depth',
+                            'count': 10,
+                            'min': 12000000,
+                            'max': 83000000,
+                            'mean': 21000000.,
+                            'percentiles': {50: 15990783, 99: 83000000}
+                        }
+                    ],
+                    'counters': [
+                        {
+                            'name': 'rest.weight',
+                            'tag': 'https://api.binance.com/api/v3/depth',
+                            'value': 100
+                        }
+                    ]
+                }
+        """
+
+        return dict(
+            histograms=[
+                dict(
+                    name=name,
+                    tag=tag,
+                    count=histogram.count,
+                    min=histogram.min,
+                    max=histogram.max,
+                    mean=histogram.mean,
+                    percentiles=histogram.percentiles(percentiles)
+                )
+                for (name, tag), histogram in self._histograms.items()
+            ],
+            counters=[
+                dict(name=name, tag=tag, value=value)
+                for (name, tag), value in self._counters.items()
+            ]
+        )
+
+    async def export(self, reset: bool = False) -> None:
+        """Sends the report to all exporters
+
+        Args:
+            reset (:obj:`bool`, optional): whether to reset all metrics after exported. Defaults to `False`
+        """
+
+        report = self.report()
+
+        if reset:
+            self.reset()
+
+        for exporter in self._exporters:
+            await wrap_coroutine(exporter(report))
+
+    def reset(self) -> None:
+        """Clears all histograms and counters
+        """
+
+        self._histograms.clear()
+        self._counters.clear()
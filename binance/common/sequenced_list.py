@@ -101,6 +101,18 @@ class SequencedList(List[Pair]):
 
         return index, False
 
+    def bisect_left(self, price: float) -> int:
+        """Returns the index of the first level whose price is not less than `price`
+        """
+
+        return bisect.bisect_left(self._key_list, price)
+
+    def bisect_right(self, price: float) -> int:
+        """Returns the index of the first level whose price is greater than `price`
+        """
+
+        return bisect.bisect_right(self._key_list, price)
+
     # Merge a list into the current one and maintain order
     def merge(
         self,
@@ -1,4 +1,3 @@
-import json
 import inspect
 import warnings
 from typing import (
@@ -21,10 +20,6 @@ def format_msg(string, *args) -> str:
     return MSG_PREFIX + string % args
 
 
-def json_stringify(obj) -> str:
-    return json.dumps(obj, separators=(',', ':'))
-
-
 def normalize_symbol(symbol: str, upper: bool = False) -> str:
     symbol = symbol.replace('_', '')
     return symbol.upper() if upper else symbol.lower()
@@ -1,7 +1,32 @@
-from typing import List
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Iterable,
+    Optional
+)
 
+from binance.common.constants import (
+    KEY_SYMBOL,
+    ColumnarFormat
+)
+from binance.common.columnar import (
+    check_columnar_format,
+    to_columnar
+)
 from binance.common.exceptions import ReuseHandlerException
 from binance.common.types import Payload
+from binance.common.utils import (
+    wrap_coroutine,
+    format_msg
+)
+
+from .batch import (
+    BatchBuffer,
+    create_batch
+)
 
 
 class Handler:
@@ -12,20 +37,96 @@ class Handler:
         class MyTickerHandler(TickerHandlerBase):
             def receive(self, msg):
                 print('ticker', msg)
+
+    If `batch_size` or `batch_interval` is specified, messages will be collected column-wise and delivered to the `receive_batch()` method at one time, instead of `receive()`::
+
+        class MyTradeHandler(TradeHandlerBase):
+            def receive_batch(self, df):
+                print('trades', df)
+
+        MyTradeHandler(batch_size=100, batch_interval=0.5)
+
+    If `columnar` is specified, klines and trades are decoded into typed columns, i.e. numeric strings are parsed into float64 and int64, which is much more efficient for large batches::
+
+        class MyKlineHandler(KlineHandlerBase):
+            def receive_batch(self, klines):
+                # klines is a numpy structured array
+                print(klines['close'].mean())
+
+        MyKlineHandler(batch_size=1000, columnar=ColumnarFormat.NUMPY)
+
+    If `conflate` is `True`, messages which arrive while `receive()` is still running are coalesced by symbol, so that the handler only receives the newest state of each symbol when it falls behind. Only ticker handlers and `OrderBookHandlerBase` support conflation.
+
+    Args:
+        batch_size (:obj:`int`, optional): the max number of rows of a batch
+        batch_interval (:obj:`float`, optional): the max seconds to wait before a batch is delivered
+        conflate (:obj:`bool`, optional): whether to conflate messages. Defaults to `False`
+        columnar (:obj:`ColumnarFormat`, optional): the format of typed columns to decode messages into. Only kline and trade handlers support it
     """
 
     COLUMNS = None
     COLUMNS_MAP = None
 
+    # The map of column name -> kind for typed columnar decoding
+    COLUMN_KINDS = None
+
+    # Whether the messages represent the latest states which could be conflated
+    CONFLATABLE = False
+
     def _receive(self, *args):
         ...  # pragma: no cover
 
     def receive(self, msg):
         ...  # pragma: no cover
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        batch_interval: Optional[float] = None,
+        conflate: bool = False,
+        columnar: Optional[ColumnarFormat] = None
+    ) -> None:
         self._client = None
 
+        if columnar is not None:
+            if self.COLUMN_KINDS is None:
+                raise ValueError(
+                    format_msg(
+                        '`%s` does not support columnar decoding',
+                        type(self).__name__
+                    )
+                )
+
+            columnar = ColumnarFormat(columnar)
+            check_columnar_format(columnar)
+
+        self._columnar = columnar
+
+        if conflate and not self.CONFLATABLE:
+            raise ValueError(
+                format_msg('`%s` does not support conflation', type(self).__name__)
+            )
+
+        if conflate and (batch_size is not None or batch_interval is not None):
+            raise ValueError(
+                format_msg('conflation could not be used with batches')
+            )
+
+        self._conflate = conflate
+        self._conflated: Dict[Hashable, Any] = {}
+        self._drain_task = None
+
+        self._batch = None
+        self._batch_interval = batch_interval
+        self._batch_timer = None
+
+        if batch_size is not None or batch_interval is not None:
+            self._batch = BatchBuffer(
+                self.COLUMNS,
+                self.COLUMNS_MAP,
+                batch_size
+            )
+
     def set_client(self, client) -> None:
         if self._client:
             # If a handler used in more than one client,
@@ -34,10 +135,167 @@ class Handler:
 
         self._client = client
 
+    def __getstate__(self) -> dict:
+        # Handlers are pickled to be sent to worker processes
+        #   if `handler_processes` is specified
+        state = self.__dict__.copy()
+        state['_client'] = None
+        state['_batch_timer'] = None
+        state['_drain_task'] = None
+
+        return state
+
     # The real method to receive payload which dispatched from processor
     def receiveDispatch(self, payload):
+        if self._batch is not None:
+            return self._collect(payload)
+
+        if self._conflate:
+            return self._collect_conflated(payload)
+
         return self.receive(payload)
 
+    def receive_result(self, result):
+        """Receives the non-None return value of `receive()` or `receive_batch()` if the client runs handlers in worker processes, i.e. `handler_processes` is specified. This method is invoked in the parent process and could be overridden::
+
+            class MyTickerHandler(TickerHandlerBase):
+                def receive(self, msg):
+                    # Invoked in a worker process
+                    return compute_signal(super().receive(msg))
+
+                def receive_result(self, signal):
+                    # Invoked in the parent process
+                    print('signal', signal)
+
+        Args:
+            result (Any): the return value
+        """
+        ...  # pragma: no cover
+
+    def receive_batch(self, batch):
+        """Receives a batch of messages if `batch_size` or `batch_interval` is specified. This method should be overridden.
+
+        Args:
+            batch (pandas.DataFrame or dict): the DataFrame of the batch with columns renamed, or a dict of column name -> values if pandas is not installed. If `columnar` is specified, it is the typed columnar data of the format instead.
+        """
+        ...  # pragma: no cover
+
+    def _rows(self, payload: Payload) -> Iterable[dict]:
+        """Returns the rows of a message to be collected into batches
+        """
+        return (payload,)
+
+    def _collect(self, payload: Payload):
+        batch = self._batch
+        batch.extend(self._rows(payload))
+
+        if batch.full:
+            return self._flush()
+
+        if self._batch_interval is not None and self._batch_timer is None:
+            self._batch_timer = asyncio.get_event_loop().call_later(
+                self._batch_interval,
+                self._flush_on_timer
+            )
+
+    def _flush(self):
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+
+        if len(self._batch) == 0:
+            return
+
+        if self._columnar is not None:
+            return self.receive_batch(to_columnar(
+                self._batch.columns(),
+                self.COLUMN_KINDS,
+                self._columnar
+            ))
+
+        return self.receive_batch(create_batch(self._batch))
+
+    def _receive_columnar(self, payload: Payload):
+        rows = payload if isinstance(payload, list) else (payload,)
+        columns_map = self.COLUMNS_MAP
+
+        return to_columnar(
+            {
+                columns_map.get(key, key): [row.get(key) for row in rows]
+                for key in self.COLUMNS
+            },
+            self.COLUMN_KINDS,
+            self._columnar
+        )
+
+    def _flush_on_timer(self) -> None:
+        self._batch_timer = None
+        asyncio.create_task(self._flush_in_background())
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            await self._handle_exception(e)
+
+    async def _handle_exception(self, e: Exception) -> None:
+        # Dispatches exceptions of background tasks to exception handlers
+        if self._client is None:
+            raise e
+
+        await self._client._handle_exception(e)
+
+    def _conflation_key(self, payload: Payload) -> Hashable:
+        """Returns the key to coalesce messages
+        """
+        return payload.get(KEY_SYMBOL)
+
+    def _merge_conflated(
+        self,
+        older: Payload,
+        newer: Payload
+    ) -> Payload:
+        """Merges two messages of the same conflation key, which returns the newer one by default
+        """
+        return newer
+
+    def _collect_conflated(self, payload: Payload) -> None:
+        conflated = self._conflated
+        key = self._conflation_key(payload)
+
+        older = conflated.get(key)
+        conflated[key] = payload if older is None \
+            else self._merge_conflated(older, payload)
+
+        if self._drain_task is None:
+            self._drain_task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        conflated = self._conflated
+
+        try:
+            while conflated:
+                key = next(iter(conflated))
+                payload = conflated.pop(key)
+
+                try:
+                    await wrap_coroutine(self.receive(payload))
+                except Exception as e:
+                    await self._handle_exception(e)
+        finally:
+            self._drain_task = None
+
+    async def flush(self) -> None:
+        """Delivers the collected messages to `receive_batch()` immediately
+        """
+
+        if self._batch is not None:
+            await wrap_coroutine(self._flush())
+
+    async def close(self) -> None:
+        """Called when the client is closed, which cancels the background tasks of the handler
+        """
+
 
 try:
     import pandas as pd
@@ -47,6 +305,9 @@ try:
         payload: Payload,
         index: List[int] = [0]
     ) -> pd.DataFrame:
+        if self._columnar is not None:
+            return self._receive_columnar(payload)
+
         return pd.DataFrame(
             payload, columns=self.COLUMNS, index=index
         ).rename(columns=self.COLUMNS_MAP)
@@ -73,7 +334,27 @@ try:
 
 except ModuleNotFoundError:  # pragma: no cover
     # If pandas is not installed
-    Handler.receive = lambda self, payload: payload
+    pd = None
+
+    def _receive(
+        self,
+        payload: Payload,
+        index: Optional[List[int]] = None
+    ):
+        if self._columnar is not None:
+            return self._receive_columnar(payload)
+
+        return payload
+
+    def receive(self, payload):
+        # Typed columnar decoding only depends on numpy or pyarrow
+        if self._columnar is not None:
+            return self._receive(payload)
+
+        return payload
+
+    Handler._receive = _receive
+    Handler.receive = receive
 
-    Handler.receive.__doc__ = """Most usually, you do not need to call this method.
+    Handler.receive.__doc__ = """Most usually, you do not need to call this method. It returns the typed columnar data if `columnar` is specified, otherwise the message as it is.
     """
@@ -0,0 +1,86 @@
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional
+)
+
+
+# The initial capacity of column buffers if batch size is not specified
+DEFAULT_BATCH_CAPACITY = 256
+
+
+class BatchBuffer:
+    """Column-wise buffers to collect stream payloads for a batch.
+
+    Args:
+        columns (Iterable[str]): the keys of payloads to collect
+        columns_map (dict): the map of payload keys to column names
+        size (:obj:`int`, optional): the max number of rows of a batch
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str],
+        columns_map: Dict[str, str],
+        size: Optional[int] = None
+    ) -> None:
+        self._keys = list(columns)
+
+        # Map column names only once
+        self._names = [columns_map.get(key, key) for key in self._keys]
+
+        capacity = size or DEFAULT_BATCH_CAPACITY
+        self._buffers = [[None] * capacity for _ in self._keys]
+
+        self._size = size
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        return self._size is not None and self._count >= self._size
+
+    def append(self, row: dict) -> None:
+        i = self._count
+
+        for key, buffer in zip(self._keys, self._buffers):
+            value = row.get(key)
+
+            if i < len(buffer):
+                buffer[i] = value
+            else:
+                buffer.append(value)
+
+        self._count = i + 1
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """Takes out the collected rows as a dict of column name -> values, and resets the buffers
+        """
+
+        count = self._count
+        self._count = 0
+
+        return {
+            name: buffer[:count]
+            for name, buffer in zip(self._names, self._buffers)
+        }
+
+
+try:
+    import pandas as pd
+
+    def create_batch(buffer: BatchBuffer) -> pd.DataFrame:
+        return pd.DataFrame(buffer.columns())
+
+except ModuleNotFoundError:  # pragma: no cover
+    # If pandas is not installed
+    def create_batch(buffer: BatchBuffer) -> Dict[str, List[Any]]:
+        return buffer.columns()
@@ -2,7 +2,8 @@ import traceback
 
 from binance.common.constants import (
     STREAM_TYPE_MAP,
-    STREAM_OHLC_MAP
+    STREAM_OHLC_MAP,
+    KEY_SYMBOL
 )
 
 from binance.common.types import (
@@ -10,6 +11,11 @@ from binance.common.types import (
     ListPayload
 )
 
+from binance.common.columnar import (
+    STREAM_TRADE_KINDS,
+    STREAM_KLINE_KINDS
+)
+
 from .base import Handler
 
 
@@ -42,6 +48,7 @@ TRADE_COLUMNS = TRADE_COLUMNS_MAP.keys()
 class TradeHandlerBase(Handler):
     COLUMNS_MAP = TRADE_COLUMNS_MAP
     COLUMNS = TRADE_COLUMNS
+    COLUMN_KINDS = STREAM_TRADE_KINDS
 
 
 AGG_TRADE_COLUMNS_MAP = {
@@ -57,6 +64,7 @@ AGG_TRADE_COLUMNS = AGG_TRADE_COLUMNS_MAP
 class AggTradeHandlerBase(Handler):
     COLUMNS_MAP = AGG_TRADE_COLUMNS_MAP
     COLUMNS = AGG_TRADE_COLUMNS
+    COLUMN_KINDS = STREAM_TRADE_KINDS
 
 
 KLINE_COLUMNS_MAP = {
@@ -83,16 +91,20 @@ KLINE_COLUMNS = KLINE_COLUMNS_MAP.keys()
 class KlineHandlerBase(Handler):
     COLUMNS_MAP = KLINE_COLUMNS_MAP
     COLUMNS = KLINE_COLUMNS
+    COLUMN_KINDS = STREAM_KLINE_KINDS
 
     def _receive(self, payload: DictPayload):
         """The payload of kline has unnecessary hierarchy,
         so just flatten it.
         """
 
+        return super()._receive(self._rows(payload)[0])
+
+    def _rows(self, payload: DictPayload):
         k = payload['k']
         k['E'] = payload['E']
 
-        return super()._receive(k)
+        return (k,)
 
 
 MINI_TICKER_COLUMNS_MAP = {
@@ -110,6 +122,7 @@ MINI_TICKER_COLUMNS = MINI_TICKER_COLUMNS_MAP.keys()
 class MiniTickerHandlerBase(Handler):
     COLUMNS_MAP = MINI_TICKER_COLUMNS_MAP
     COLUMNS = MINI_TICKER_COLUMNS
+    CONFLATABLE = True
 
 
 TICKER_COLUMNS_MAP = {
@@ -134,21 +147,58 @@ TICKER_COLUMNS = TICKER_COLUMNS_MAP.keys()
 class TickerHandlerBase(Handler):
     COLUMNS_MAP = TICKER_COLUMNS_MAP
     COLUMNS = TICKER_COLUMNS
+    CONFLATABLE = True
+
+
+def merge_tickers(
+    older: ListPayload,
+    newer: ListPayload
+) -> ListPayload:
+    """Merges two all market tickers messages, each of which only contains the tickers changed
+    """
+
+    tickers = {ticker[KEY_SYMBOL]: ticker for ticker in older}
+
+    for ticker in newer:
+        tickers[ticker[KEY_SYMBOL]] = ticker
+
+    return list(tickers.values())
 
 
 class AllMarketMiniTickersHandlerBase(Handler):
     COLUMNS_MAP = MINI_TICKER_COLUMNS_MAP
     COLUMNS = MINI_TICKER_COLUMNS
+    CONFLATABLE = True
 
     def _receive(self, payload: ListPayload):
         return super()._receive(
             payload, None)
 
+    def _rows(self, payload: ListPayload):
+        return payload
+
+    def _conflation_key(self, payload: ListPayload):
+        # There is only one all market stream for a handler
+        return None
+
+    def _merge_conflated(self, older, newer):
+        return merge_tickers(older, newer)
+
 
 class AllMarketTickersHandlerBase(Handler):
     COLUMNS_MAP = TICKER_COLUMNS_MAP
     COLUMNS = TICKER_COLUMNS
+    CONFLATABLE = True
 
     def _receive(self, payload: ListPayload):
         return super()._receive(
             payload, None)
+
+    def _rows(self, payload: ListPayload):
+        return payload
+
+    def _conflation_key(self, payload: ListPayload):
+        return None
+
+    def _merge_conflated(self, older, newer):
+        return merge_tickers(older, newer)
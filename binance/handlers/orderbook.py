@@ -1,7 +1,10 @@
 import asyncio
+from decimal import Decimal
 from typing import (
     Iterable,
-    Optional
+    Optional,
+    Tuple,
+    Union
 )
 
 from aioretry import (
@@ -13,13 +16,24 @@ from binance.common.sequenced_list import (
     SequencedList,
     Pair
 )
+from binance.common.cumulative_depth import CumulativeDepth
+from binance.common.level_parser import (
+    LevelParser,
+    RawLevel,
+    create_level_parser
+)
 from binance.common.constants import (
     DEFAULT_DEPTH_LIMIT,
     DEFAULT_RETRY_POLICY,
-    NO_RETRY_POLICY
+    NO_RETRY_POLICY,
+    LevelFormat,
+    OrderSide
 )
 
-from binance.common.utils import normalize_symbol
+from binance.common.utils import (
+    normalize_symbol,
+    format_msg
+)
 from binance.common.exceptions import OrderBookFetchAbandonedException
 
 KEY_FIRST_UPDATE_ID = 'U'
@@ -34,11 +48,25 @@ KEY_ASKS = 'a'
 
 
 class OrderBook:
+    """The local orderbook of a symbol
+
+    Subclass `OrderBook` and override `SEQUENCED_LIST` to change the way to store asks and bids, for example, `ArraySequencedList` which is faster for deep orderbooks::
+
+        class ArrayOrderBook(OrderBook):
+            SEQUENCED_LIST = ArraySequencedList
+
+    Prices and quantities are parsed into numbers according to `level_format` once they are merged into the orderbook. The cumulative quantities of both sides are maintained incrementally for the queries of depth, such as `quantity_within()` and `fill_price()`.
+    """
+
+    # The class to maintain asks or bids
+    SEQUENCED_LIST = SequencedList
+
     asks: SequencedList
     bids: SequencedList
     _retry_policy: RetryPolicy
     _limit: int
     _last_update_id: int
+    _level_parser: Optional[LevelParser]
 
     # We redundant define the default value of limit,
     #   because OrderBook is also a public class
@@ -47,10 +75,15 @@ class OrderBook:
         symbol: str,
         client=None,
         limit: int = DEFAULT_DEPTH_LIMIT,
-        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        snapshot_scheduler=None,
+        level_format: LevelFormat = LevelFormat.FLOAT
     ) -> None:
-        self.asks = SequencedList()
-        self.bids = SequencedList()
+        self.asks = self.SEQUENCED_LIST()
+        self.bids = self.SEQUENCED_LIST()
+
+        self._ask_depth = CumulativeDepth(self.asks, True)
+        self._bid_depth = CumulativeDepth(self.bids, False)
 
         self._symbol = normalize_symbol(symbol, True)
         self._client = None
@@ -64,6 +97,27 @@ class OrderBook:
         # Whether we are still fetching the depth snapshot
         self._fetching = False
 
+        # The scheduler of snapshot requests shared by orderbooks,
+        #   `None` to request snapshots immediately
+        self._snapshot_scheduler = snapshot_scheduler
+
+        supported = getattr(self.SEQUENCED_LIST, 'LEVEL_FORMATS', None)
+
+        if supported is not None and level_format not in supported:
+            raise ValueError(format_msg(
+                '`%s` does not support `%s`',
+                self.SEQUENCED_LIST.__name__,
+                level_format
+            ))
+
+        self._level_format = level_format
+        self._level_parser_exception = None
+        # Fixed-point levels depend on the filters of the symbol,
+        #   so the parser is created before the first snapshot is merged
+        self._level_parser = None \
+            if level_format == LevelFormat.FIXED_POINT \
+            else create_level_parser(level_format)
+
         self.set_retry_policy(retry_policy)
         self.set_limit(limit)
         self.set_client(client)
@@ -76,6 +130,120 @@ class OrderBook:
         """
         return not self._fetching and self._last_update_id != 0
 
+    @property
+    def level_parser(self) -> Optional[LevelParser]:
+        """LevelParser: the parser of levels, which could convert the prices and quantities of the orderbook back to floats. It is `None` if the level format is `LevelFormat.FIXED_POINT` and the filters of the symbol have not been fetched yet.
+        """
+        return self._level_parser
+
+    @property
+    def best_ask(self) -> Optional[Pair]:
+        """Optional[tuple]: the `(price, quantity)` of the lowest ask, or `None` if there is no ask
+        """
+        return self.asks[0] if len(self.asks) else None
+
+    @property
+    def best_bid(self) -> Optional[Pair]:
+        """Optional[tuple]: the `(price, quantity)` of the highest bid, or `None` if there is no bid
+        """
+        return self.bids[-1] if len(self.bids) else None
+
+    @property
+    def spread(self) -> Optional[float]:
+        """Optional[float]: the difference between the best ask price and the best bid price, or `None` if either side is empty
+        """
+        if not len(self.asks) or not len(self.bids):
+            return None
+
+        return self.asks[0][0] - self.bids[-1][0]
+
+    @property
+    def mid(self) -> Optional[float]:
+        """Optional[float]: the mid price of the best ask and the best bid, or `None` if either side is empty
+        """
+        if not len(self.asks) or not len(self.bids):
+            return None
+
+        return (self.asks[0][0] + self.bids[-1][0]) / 2
+
+    def quantity_within(
+        self,
+        distance: Union[float, Decimal, int]
+    ) -> Optional[Tuple[float, float]]:
+        """Gets the cumulative quantities of the levels whose prices are within `distance` of the mid price. For example, the depth within 10 bps::
+
+            bid_quantity, ask_quantity = orderbook.quantity_within(
+                orderbook.mid * 0.001
+            )
+
+        Args:
+            distance (float | Decimal | int): the distance to the mid price, in the same unit as prices of the levels, i.e. ticks for `LevelFormat.FIXED_POINT`. It is converted into the numeric type of the levels, such as a `Decimal` for `LevelFormat.DECIMAL`
+
+        Returns:
+            Optional[tuple]: the quantities of bids and asks, or `None` if either side is empty
+        """
+        mid = self.mid
+
+        if mid is None:
+            return None
+
+        distance = self._level_parser.number(distance)
+
+        return (
+            self._bid_depth.quantity_to(mid - distance),
+            self._ask_depth.quantity_to(mid + distance)
+        )
+
+    def imbalance(
+        self,
+        distance: Union[float, Decimal, int, None] = None
+    ) -> Optional[float]:
+        """Gets the imbalance of the orderbook, i.e. `(bid_quantity - ask_quantity) / (bid_quantity + ask_quantity)`, which ranges from -1 to 1
+
+        Args:
+            distance (:obj:`float | Decimal | int`, optional): the quantities within `distance` of the mid price are used, the same as `quantity_within()`. Defaults to `None` to use the quantities of the best levels
+
+        Returns:
+            Optional[float]: the imbalance, or `None` if either side is empty
+        """
+        if not len(self.asks) or not len(self.bids):
+            return None
+
+        if distance is None:
+            bid_quantity = self.bids[-1][1]
+            ask_quantity = self.asks[0][1]
+        else:
+            bid_quantity, ask_quantity = self.quantity_within(distance)
+
+        total = bid_quantity + ask_quantity
+
+        if not total:
+            return None
+
+        return (bid_quantity - ask_quantity) / total
+
+    def fill_price(
+        self,
+        side: OrderSide,
+        quantity: Union[float, Decimal, int]
+    ) -> Optional[Tuple[float, float]]:
+        """Gets the prices to fill `quantity` by a market order of `side`, which takes asks for `OrderSide.BUY` and bids for `OrderSide.SELL`
+
+        Args:
+            side (OrderSide): the side of the order
+            quantity (float | Decimal | int): the quantity to fill, in the same unit as quantities of the levels, i.e. steps for `LevelFormat.FIXED_POINT`. It is converted into the numeric type of the levels, such as a `Decimal` for `LevelFormat.DECIMAL`
+
+        Returns:
+            Optional[tuple]: the price of the worst level to take and the volume weighted average price, or `None` if the orderbook has not enough quantity
+        """
+        if self._level_parser is None:
+            # The filters of the symbol are not fetched,
+            #   so the orderbook is empty
+            return None
+
+        depth = self._ask_depth if side == OrderSide.BUY else self._bid_depth
+        return depth.fill(self._level_parser.number(quantity))
+
     async def updated(self) -> None:
         """Await for the next time when the orderbook is updated. Awaiting for this method is the recommended way to notify your program to do something when the orderbook changes::
 
@@ -123,15 +291,47 @@ class OrderBook:
         self._updated_future.set_exception(exc)
         self._updated_future = asyncio.Future()
 
+    @retry('_retry_policy')
+    async def _fetch_symbol_filters(self) -> Optional[dict]:
+        return await self._client.get_symbol_filters(self._symbol)
+
+    async def _create_level_parser(self) -> None:
+        if self._level_parser_exception is None:
+            # Fetched out of `_fetch_snapshot`, otherwise the retry policy
+            #   will keep on requesting the exchange info for a symbol
+            #   that does not exist
+            filters = await self._fetch_symbol_filters()
+
+            try:
+                self._level_parser = create_level_parser(
+                    self._level_format,
+                    filters
+                )
+                return
+            except ValueError as e:
+                # The filters will not be requested again
+                self._level_parser_exception = e
+
+        raise self._level_parser_exception
+
     @retry('_retry_policy')
     async def _fetch_snapshot(self):
-        snapshot = await self._client.get_orderbook(
-            symbol=self._symbol,
-            limit=self._limit
-        )
+        if self._snapshot_scheduler is None:
+            snapshot = await self._client.get_orderbook(
+                symbol=self._symbol,
+                limit=self._limit
+            )
+        else:
+            snapshot = await self._snapshot_scheduler.fetch(
+                self._client,
+                self._symbol,
+                self._limit
+            )
 
         self.asks.clear()
         self.bids.clear()
+        self._ask_depth.clear()
+        self._bid_depth.clear()
 
         self._merge(
             snapshot[KEY_REST_LAST_UPDATE_ID],
@@ -158,6 +358,9 @@ class OrderBook:
 
     async def _fetch(self) -> None:
         try:
+            if self._level_parser is None:
+                await self._create_level_parser()
+
             await self._fetch_snapshot()
         except Exception as e:
             exception = OrderBookFetchAbandonedException(
@@ -188,10 +391,18 @@ class OrderBook:
     def _merge(
         self,
         last_update_id: int,
-        asks: Iterable[Pair],
-        bids: Iterable[Pair]
+        asks: Iterable[RawLevel],
+        bids: Iterable[RawLevel]
     ) -> None:
+        parse = self._level_parser.parse
+        asks = parse(asks)
+        bids = parse(bids)
+
         self._last_update_id = last_update_id
+
+        self._ask_depth.update(asks)
+        self._bid_depth.update(bids)
+
         self.asks.merge(asks)
         self.bids.merge(bids)
 
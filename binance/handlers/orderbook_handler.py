@@ -1,14 +1,19 @@
+from typing import Optional
+
 from aioretry import RetryPolicy
 
 from binance.common.constants import (
     STREAM_TYPE_MAP,
     DEFAULT_DEPTH_LIMIT,
-    DEFAULT_RETRY_POLICY
+    DEFAULT_RETRY_POLICY,
+    DepthFormat,
+    LevelFormat
 )
 
 from binance.common.utils import (
     normalize_symbol,
-    wrap_coroutine
+    wrap_coroutine,
+    format_msg
 )
 
 from binance.common.types import DictPayload
@@ -18,6 +23,7 @@ from .base import (
     pd
 )
 
+from .snapshot_scheduler import SnapshotScheduler
 from .orderbook import (
     OrderBook,
     KEY_FIRST_UPDATE_ID,
@@ -39,41 +45,174 @@ ORDER_BOOK_COLUMNS_MAP = {
 ORDER_BOOK_COLUMNS = ORDER_BOOK_COLUMNS_MAP.keys()
 
 
-def create_depth_df(l):
+def create_depth_df(levels):
     return pd.DataFrame([
-        {'price': x[0], 'quantity': x[1]} for x in l
+        {'price': x[0], 'quantity': x[1]} for x in levels
     ])
 
 
-METHOD_NAME_RECEIVE = 'receive'
+def create_depth_tuples(levels):
+    return [
+        (float(price), float(quantity)) for price, quantity in levels
+    ]
+
+
+try:
+    import numpy as np
+
+    def create_depth_array(levels):
+        return np.array(levels, dtype=np.float64).reshape(-1, 2)
+
+except ModuleNotFoundError:  # pragma: no cover
+    np = None
+
+
+def merge_depth_updates(
+    older: DictPayload,
+    newer: DictPayload
+) -> DictPayload:
+    """Merges two consecutive depth updates of the same symbol into a single diff, in which the levels of the newer update override those of the same prices
+    """
+
+    bids = dict(older[KEY_BIDS])
+    bids.update(newer[KEY_BIDS])
+
+    asks = dict(older[KEY_ASKS])
+    asks.update(newer[KEY_ASKS])
+
+    return {
+        **newer,
+        KEY_FIRST_UPDATE_ID: older[KEY_FIRST_UPDATE_ID],
+        KEY_BIDS: [[price, quantity] for price, quantity in bids.items()],
+        KEY_ASKS: [[price, quantity] for price, quantity in asks.items()]
+    }
+
+
+class LazyDepth:
+    """The depth update whose DataFrames are created only when accessed.
+
+    It could also be unpacked the same as `DepthFormat.DATAFRAME`::
+
+        info, [bids, asks] = depth
+    """
+
+    def __init__(
+        self,
+        handler,
+        payload: DictPayload
+    ) -> None:
+        self.payload = payload
+
+        self._handler = handler
+        self._info = None
+        self._bids = None
+        self._asks = None
+
+    @property
+    def info(self):
+        """pandas.DataFrame: the information of the depth update"""
+        if self._info is None:
+            self._info = Handler._receive(self._handler, self.payload)
+
+        return self._info
+
+    @property
+    def bids(self):
+        """pandas.DataFrame: the bids of the depth update"""
+        if self._bids is None:
+            self._bids = create_depth_df(self.payload[KEY_BIDS])
+
+        return self._bids
+
+    @property
+    def asks(self):
+        """pandas.DataFrame: the asks of the depth update"""
+        if self._asks is None:
+            self._asks = create_depth_df(self.payload[KEY_ASKS])
+
+        return self._asks
+
+    def __iter__(self):
+        yield self.info
+        yield [self.bids, self.asks]
 
 
 class OrderBookHandlerBase(Handler):
+    """The handler to maintain orderbooks from depth updates.
+
+    The depth snapshot requests of the orderbooks are scheduled by a `SnapshotScheduler`, which is created for each handler unless `snapshot_scheduler` is specified. By default, at most 4 snapshot requests are ongoing at the same time. If the client has no `RateLimiter`, snapshot requests of the handler are also limited to 300 weight per minute. Otherwise they are only limited by the rate limiter of the client. Pass a `SnapshotScheduler` with other settings to change this.
+    """
+
     COLUMNS_MAP = ORDER_BOOK_COLUMNS_MAP
     COLUMNS = ORDER_BOOK_COLUMNS
 
+    CONFLATABLE = True
+
+    # The class of orderbooks maintained by the handler
+    ORDER_BOOK = OrderBook
+
     def __init__(
         self,
         limit: int = DEFAULT_DEPTH_LIMIT,
-        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        depth_format: DepthFormat = DepthFormat.DATAFRAME,
+        conflate: bool = False,
+        snapshot_scheduler: Optional[SnapshotScheduler] = None,
+        level_format: LevelFormat = LevelFormat.FLOAT
     ) -> None:
-        super().__init__()
+        super().__init__(conflate=conflate)
+
+        if depth_format == DepthFormat.NUMPY and np is None:
+            raise ValueError(
+                format_msg('numpy is required for `%s`', depth_format)
+            )
 
         self._limit = limit
         self._retry_policy = retry_policy
+        self._depth_format = depth_format
+        self._level_format = level_format
+
+        # Snapshot requests of all orderbooks of the handler are scheduled
+        #   together, and the scheduler could be shared with other handlers
+        self._own_snapshot_scheduler = snapshot_scheduler is None
+        self._snapshot_scheduler = SnapshotScheduler() \
+            if snapshot_scheduler is None else snapshot_scheduler
 
         self._orderbooks = {}
 
         self._uninit_orderbooks = []
 
-        # If the current class has no `receive` method,
-        #   the raw payload will not be dispatched to self.receive
-        self._has_receive = hasattr(self.__class__, METHOD_NAME_RECEIVE)
+        # If the current class does not override the `receive` method,
+        #   the raw payload will not be dispatched to self.receive,
+        #   so that we only maintain orderbooks
+        self._has_receive = \
+            type(self).receive is not OrderBookHandlerBase.receive
 
     def _receive(
         self,
         payload: DictPayload
     ):
+        depth_format = self._depth_format
+
+        if depth_format == DepthFormat.TUPLE:
+            return payload, [
+                create_depth_tuples(payload[KEY_BIDS]),
+                create_depth_tuples(payload[KEY_ASKS])
+            ]
+
+        if depth_format == DepthFormat.NUMPY:
+            return payload, [
+                create_depth_array(payload[KEY_BIDS]),
+                create_depth_array(payload[KEY_ASKS])
+            ]
+
+        if pd is None:  # pragma: no cover
+            # If pandas is not installed
+            return payload
+
+        if depth_format == DepthFormat.LAZY_DATAFRAME:
+            return LazyDepth(self, payload)
+
         info = super()._receive(payload)
 
         bids = create_depth_df(payload[KEY_BIDS])
@@ -81,6 +220,23 @@ class OrderBookHandlerBase(Handler):
 
         return info, [bids, asks]
 
+    def receive(self, payload):
+        """Receives a `depthUpdate` stream message and converts it according to the `depth_format` of the handler. Orderbooks are always maintained no matter whether this method is overridden.
+
+        If this method is not overridden, depth updates will not be converted at all::
+
+            class MyOrderBookHandler(OrderBookHandlerBase):
+                def receive(self, payload):
+                    info, [bids, asks] = super().receive(payload)
+
+        Args:
+            payload (dict): the message payload
+
+        Returns:
+            tuple: the information of the update, and its bids and asks in the format specified by `depth_format`
+        """
+        return self._receive(payload)
+
     def orderbook(
         self,
         symbol: str
@@ -100,10 +256,13 @@ class OrderBookHandlerBase(Handler):
         if symbol in self._orderbooks:
             return self._orderbooks[symbol]
 
-        orderbook = OrderBook(symbol,
-                              limit=self._limit,
-                              retry_policy=self._retry_policy
-                              )
+        orderbook = self.ORDER_BOOK(
+            symbol,
+            limit=self._limit,
+            retry_policy=self._retry_policy,
+            snapshot_scheduler=self._snapshot_scheduler,
+            level_format=self._level_format
+        )
 
         if self._client:
             orderbook.set_client(self._client)
@@ -133,13 +292,41 @@ class OrderBookHandlerBase(Handler):
 
         self._uninit_orderbooks.clear()
 
-    async def receiveDispatch(self, payload) -> None:
+    async def close(self) -> None:
+        # A scheduler specified by the user could be shared with other
+        #   handlers, so it is only closed by the user
+        if self._own_snapshot_scheduler:
+            await self._snapshot_scheduler.close()
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+
+        # Orderbooks are bound to the event loop,
+        #   they will be created again by the worker process on demand
+        state['_orderbooks'] = {}
+        state['_uninit_orderbooks'] = []
+
+        return state
+
+    async def receiveDispatch(self, payload):
         """Receives a `depthUpdate` stream message. Most usually, you should not call this method directly. This method is invoked by `OrderBookHandlerBase` internally.
 
         Args:
             payload: the message payload of the stream
         """
+        # Orderbooks are always updated by every depth update
         self.orderbook(payload[KEY_SYMBOL]).update(payload)
 
-        if self._has_receive:
-            await wrap_coroutine(self.receive(payload))
+        if not self._has_receive:
+            return
+
+        if self._conflate:
+            # Depth updates received while `receive` is running
+            #   are merged into one
+            self._collect_conflated(payload)
+            return
+
+        return await wrap_coroutine(self.receive(payload))
+
+    def _merge_conflated(self, older, newer):
+        return merge_depth_updates(older, newer)
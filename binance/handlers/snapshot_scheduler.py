@@ -0,0 +1,211 @@
+import asyncio
+import heapq
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+
+from binance.apis.rest import depth_weight
+from binance.client.rate_limiter import TokenBucket
+from binance.common.constants import (
+    DEFAULT_SNAPSHOT_WEIGHT_BUDGET,
+    DEFAULT_SNAPSHOT_INTERVAL,
+    DEFAULT_SNAPSHOT_CONCURRENCY
+)
+from binance.common.utils import normalize_symbol
+
+# (symbol, limit)
+SnapshotKey = Tuple[str, int]
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+
+class SnapshotScheduler:
+    """Schedules the depth snapshot requests of orderbooks, so that a reconnect with many orderbooks does not burn the whole request weight.
+
+    Snapshot requests are queued, and those of priority symbols are sent first. A request is sent only if the number of ongoing requests is less than `concurrency` and its weight fits in the budget. Concurrent requests of the same symbol and limit share a single request.
+
+    If the client has a `RateLimiter`, the weight of snapshot requests is only counted by the rate limiter of the client and the weight budget of the scheduler is not used.
+
+    Args:
+        weight_budget (:obj:`int`, optional): the max total weight of snapshot requests in every `interval` seconds, if the client has no rate limiter. Defaults to `300`
+        interval (:obj:`float`, optional): seconds to refill the weight budget. Defaults to `60`
+        concurrency (:obj:`int`, optional): the max number of ongoing snapshot requests. Defaults to `4`
+        priority_symbols (:obj:`Iterable[str]`, optional): the symbols whose snapshots are fetched before others
+    """
+
+    def __init__(
+        self,
+        weight_budget: int = DEFAULT_SNAPSHOT_WEIGHT_BUDGET,
+        interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+        concurrency: int = DEFAULT_SNAPSHOT_CONCURRENCY,
+        priority_symbols: Iterable[str] = ()
+    ) -> None:
+        self._weight_budget = weight_budget
+        self._interval = interval
+        self._concurrency = concurrency
+        self._priority_symbols = set(
+            normalize_symbol(symbol, True) for symbol in priority_symbols
+        )
+
+        self._budget = TokenBucket(weight_budget, interval)
+
+        # (priority, seq, key)
+        self._queue: List[Tuple[int, int, SnapshotKey]] = []
+        self._seq = 0
+
+        # key -> (client, future of the snapshot), either queued or ongoing
+        self._requests: Dict[SnapshotKey, Tuple[object, asyncio.Future]] = {}
+
+        self._ongoing = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def prioritize(self, *symbols: str) -> None:
+        """Adds symbols whose snapshots are fetched before others
+        """
+
+        self._priority_symbols.update(
+            normalize_symbol(symbol, True) for symbol in symbols
+        )
+
+    @property
+    def pending(self) -> int:
+        """int: the number of snapshot requests which are queued or ongoing
+        """
+
+        return len(self._requests)
+
+    async def fetch(
+        self,
+        client,
+        symbol: str,
+        limit: int
+    ) -> dict:
+        """Requests the depth snapshot of a symbol when the request is scheduled
+
+        Args:
+            client (Client): the client to send the request
+            symbol (str): the symbol name
+            limit (int): the limit of the snapshot
+
+        Returns:
+            dict: the response of `client.get_orderbook()`
+        """
+
+        key = (symbol, limit)
+        request = self._requests.get(key)
+
+        if request is None:
+            future = asyncio.get_running_loop().create_future()
+            self._requests[key] = (client, future)
+
+            priority = PRIORITY_HIGH if symbol in self._priority_symbols \
+                else PRIORITY_NORMAL
+
+            heapq.heappush(self._queue, (priority, self._seq, key))
+            self._seq += 1
+
+            self._schedule()
+        else:
+            future = request[1]
+
+        # One of the orderbooks sharing the request could be abandoned
+        return await asyncio.shield(future)
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._queue and self._ongoing < self._concurrency:
+            key = self._queue[0][2]
+            client = self._requests[key][0]
+
+            # The rate limiter of the client waits for the weight itself,
+            #   so that the weight is not counted twice
+            if getattr(client, 'rate_limiter', None) is None:
+                weight = depth_weight({'limit': key[1]})
+                delay = self._budget.delay(weight)
+
+                if delay > 0:
+                    self._timer = asyncio.get_running_loop().call_later(
+                        delay, self._schedule
+                    )
+                    return
+
+                self._budget.consume(weight)
+
+            heapq.heappop(self._queue)
+            self._ongoing += 1
+
+            task = asyncio.create_task(self._request(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _request(self, key: SnapshotKey) -> None:
+        client, future = self._requests[key]
+        symbol, limit = key
+
+        try:
+            snapshot = await client.get_orderbook(
+                symbol=symbol,
+                limit=limit
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+
+            # Mark the exception as retrieved
+            #   in case all orderbooks are abandoned
+            future.exception()
+        else:
+            future.set_result(snapshot)
+        finally:
+            del self._requests[key]
+            self._ongoing -= 1
+            self._schedule()
+
+    async def close(self) -> None:
+        """Cancels all queued and ongoing snapshot requests. The scheduler could still be used after closed
+        """
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # So that no queued request is sent when ongoing ones are cancelled
+        self._queue.clear()
+
+        tasks = [*self._tasks]
+
+        for task in tasks:
+            task.cancel()
+
+        if tasks:
+            await asyncio.wait(tasks)
+
+        # Queued requests, and tasks cancelled before they started
+        #   which never clean up their requests
+        for _, future in self._requests.values():
+            future.cancel()
+
+        self._requests.clear()
+        self._ongoing = 0
+
+    def __reduce__(self):
+        # Queued requests are bound to the event loop,
+        #   so only the settings are pickled
+        return type(self), (
+            self._weight_budget,
+            self._interval,
+            self._concurrency,
+            tuple(self._priority_symbols)
+        )
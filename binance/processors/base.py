@@ -1,20 +1,27 @@
 import asyncio
 import inspect
+import time
 from typing import (
     Optional,
     Set,
-    Awaitable
+    Awaitable,
+    Tuple
 )
 
 from binance.common.exceptions import (
     InvalidSubTypeParamException
 )
-from binance.common.utils import normalize_symbol
+from binance.common.utils import (
+    normalize_symbol,
+    wrap_coroutine
+)
 from binance.common.constants import (
     SubType,
     ATOM,
     KEY_PAYLOAD,
-    KEY_PAYLOAD_TYPE
+    KEY_PAYLOAD_TYPE,
+    KEY_SYMBOL,
+    METRIC_HANDLER_RECEIVE
 )
 from binance.handlers.base import Handler
 
@@ -31,6 +38,7 @@ class Processor:
 
     def __init__(self, client):
         self._client = client
+        self._metrics = getattr(client, '_metrics', None)
 
         self._handlers = set()
 
@@ -74,6 +82,24 @@ class Processor:
     ) -> bool:
         return isinstance(handler, self.HANDLER)
 
+    def payload_types(self) -> Tuple[str, ...]:
+        """Returns the payload['e']s which could be routed to the processor
+        """
+
+        return (self.PAYLOAD_TYPE,)
+
+    def stream_types(self) -> Tuple[str, ...]:
+        """Returns the stream names which could be routed to the processor, which is used for the messages whose payloads have no types
+        """
+
+        return ()
+
+    def partition_key(self, msg, payload) -> str:
+        """Returns the key to partition payloads among worker processes. Payloads with the same key are always handled by the same worker in order
+        """
+
+        return payload.get(KEY_SYMBOL, '')
+
     def is_message_type(self, msg):
         payload = msg.get(KEY_PAYLOAD)
 
@@ -100,11 +126,23 @@ class Processor:
     ) -> Awaitable[None]:
         return self._dispatch(payload, self._handlers)
 
+    async def close(self) -> None:
+        """Closes the handlers of the processor when the client is closed
+        """
+
+        await asyncio.gather(*[
+            handler.close() for handler in self._handlers
+        ])
+
     async def _dispatch(
         self,
         payload,
         handlers: Set[Handler]
     ):
+        if self._metrics is not None:
+            await self._measured_dispatch(payload, handlers)
+            return
+
         coro = []
 
         for handler in handlers:
@@ -114,3 +152,31 @@ class Processor:
 
         if len(coro) > 0:
             await asyncio.gather(*coro)
+
+    async def _measured_dispatch(
+        self,
+        payload,
+        handlers: Set[Handler]
+    ):
+        await asyncio.gather(*[
+            self._measured_receive(handler, payload)
+            for handler in handlers
+        ])
+
+    async def _measured_receive(
+        self,
+        handler: Handler,
+        payload
+    ) -> None:
+        # The time of a handler to receive a payload,
+        #   including the time awaited if `receive` is async
+        start = time.perf_counter_ns()
+
+        try:
+            await wrap_coroutine(handler.receiveDispatch(payload))
+        finally:
+            self._metrics.observe(
+                METRIC_HANDLER_RECEIVE,
+                type(handler).__name__,
+                time.perf_counter_ns() - start
+            )
@@ -92,6 +92,15 @@ class AllMarketMiniTickersProcessor(Processor):
 
         return True, msg.get(KEY_PAYLOAD)
 
+    def payload_types(self):
+        return ()
+
+    def stream_types(self):
+        return (self.STREAM_TYPE_PREFIX,)
+
+    def partition_key(self, msg, payload) -> str:
+        return msg.get(KEY_STREAM_TYPE)
+
     def subscribe_param(self, _, t, *args) -> str:
         if len(args) == 0:
             interval = 1000
@@ -108,6 +108,13 @@ class UserProcessor(Processor):
 
         return False, None
 
+    def payload_types(self):
+        return self.PAYLOAD_TYPES
+
+    def partition_key(self, msg, payload) -> str:
+        # Keep all events of the user stream in order
+        return ''
+
     def supports_handler(
         self,
         handler: Handler
@@ -1,10 +1,11 @@
 import asyncio
 import itertools
+import time
 from typing import (
     List,
     Iterable,
-    Set,
     Dict,
+    Optional,
     Tuple
 )
 
@@ -16,7 +17,12 @@ from binance.processors import (
 from binance.processors.base import Processor
 
 from binance.common.constants import (
-    SubType
+    SubType,
+    KEY_PAYLOAD,
+    KEY_PAYLOAD_TYPE,
+    KEY_STREAM_TYPE,
+    METRIC_STREAM_ROUTE,
+    METRIC_STREAM_DISPATCH
 )
 from binance.common.exceptions import (
     InvalidSubParamsException,
@@ -28,6 +34,8 @@ from binance.common.utils import (
     wrap_coroutine
 )
 
+from .process_pool import HandlerProcessPool
+
 
 class HandlerContext:
     PROCESSORS = PROCESSORS
@@ -35,32 +43,78 @@ class HandlerContext:
     # all supported processors
     _all_processors: List[Processor]
 
-    # processors that current used
-    _processors: Set[Processor]
-
-    # The map of payload_type -> processor
+    # The map of subtype -> processor
     _processor_cache: Dict[SubType, Processor]
 
+    # The routing table of msg['stream'] -> processor
+    _stream_routes: Dict[str, Processor]
+
+    # The routing table of payload['e'] -> processor
+    _payload_routes: Dict[str, Processor]
+
+    # The prefixes of msg['stream'] -> processor, for the streams whose
+    #   names are not subscribed by the client, such as
+    #   `!ticker@arr@3000ms` of other intervals
+    _stream_prefix_routes: Dict[str, Processor]
+
     def __init__(self, client) -> None:
+        self._client = client
         self._handler_table = {}
         self._all_processors = [Factory(client) for Factory in self.PROCESSORS]
-        self._processors = set()
         self._processor_cache = {}
+        self._stream_routes = {}
+        self._payload_routes = {}
+        self._stream_prefix_routes = {}
         self._exception_processor = ExceptionProcessor(client)
 
+        self._metrics = client._metrics
+        self._pool = None
+
+        # The map of processor -> the index of the processor
+        self._processor_indexes = {
+            processor: index
+            for index, processor in enumerate(self._all_processors)
+        }
+
+        if client._handler_processes:
+            self._pool = HandlerProcessPool(
+                client._handler_processes,
+                client._get_worker_kwargs(),
+                self.handle_exception
+            )
+
     def set_handler(self, handler) -> bool:
         if self._exception_processor.supports_handler(handler):
+            # Exception handlers always run in the current process
             self._exception_processor.add_handler(handler)
             return True
 
-        for processor in self._all_processors:
+        for index, processor in enumerate(self._all_processors):
             if processor.supports_handler(handler):
-                self._processors.add(processor)
-                processor.add_handler(handler)
+                if self._pool is None:
+                    processor.add_handler(handler)
+                elif not self._pool.has_handler(handler):
+                    # The same as `processor.add_handler()`, the handler in
+                    #   the current process is bound to the client, so that
+                    #   it could not be reused by other clients, and
+                    #   exceptions of its background tasks are dispatched
+                    #   to the exception handlers of the client
+                    handler.set_client(self._client)
+                    self._pool.add_handler(index, handler)
+
+                self._add_routes(processor)
                 return True
 
         return False
 
+    def _add_routes(self, processor: Processor) -> None:
+        for payload_type in processor.payload_types():
+            self._payload_routes[payload_type] = processor
+
+        for stream_type in processor.stream_types():
+            self._stream_routes[stream_type] = processor
+            self._stream_prefix_routes[stream_type] = processor
+
     # client.subscribe(subtype_needs_no_param_or_has_default_param)
     # -> client.subscribe(SubType.ALL_MARKET_MINI_TICKERS)
 
@@ -139,10 +193,20 @@ class HandlerContext:
         *args
     ) -> str:
         processor = self._get_processor(args[0])
-        return await wrap_coroutine(
+        param = await wrap_coroutine(
             processor.subscribe_param(subscribe, *args)
         )
 
+        # Messages of some streams, such as all market tickers,
+        #   could only be routed by stream names
+        if processor.stream_types():
+            if subscribe:
+                self._stream_routes[param] = processor
+            else:
+                self._stream_routes.pop(param, None)
+
+        return param
+
     def _get_processor(
         self,
         subtype: SubType
@@ -158,15 +222,98 @@ class HandlerContext:
 
         raise UnsupportedSubTypeException(subtype)
 
+    def _route(self, msg) -> Optional[Processor]:
+        stream = msg.get(KEY_STREAM_TYPE)
+        processor = self._stream_routes.get(stream)
+
+        if processor is not None:
+            return processor
+
+        payload = msg.get(KEY_PAYLOAD)
+
+        if type(payload) is dict:
+            processor = self._payload_routes.get(payload.get(KEY_PAYLOAD_TYPE))
+
+            if processor is not None:
+                return processor
+
+        return self._route_by_prefix(stream)
+
+    def _route_by_prefix(self, stream: Optional[str]) -> Optional[Processor]:
+        if stream is None:
+            return None
+
+        for prefix, processor in self._stream_prefix_routes.items():
+            if stream.startswith(prefix):
+                # Route the following messages of the stream directly
+                self._stream_routes[stream] = processor
+                return processor
+
+        return None
+
+    async def _measured_receive(self, msg) -> None:
+        metrics = self._metrics
+
+        start = time.perf_counter_ns()
+        processor = self._route(msg)
+        routed = time.perf_counter_ns()
+
+        if processor is None:
+            return
+
+        tag = type(processor).__name__
+        metrics.observe(METRIC_STREAM_ROUTE, tag, routed - start)
+
+        try:
+            await self._dispatch(processor, msg)
+        finally:
+            metrics.observe(
+                METRIC_STREAM_DISPATCH,
+                tag,
+                time.perf_counter_ns() - routed
+            )
+
+    async def _dispatch(self, processor: Processor, msg) -> None:
+        payload = msg.get(KEY_PAYLOAD)
+
+        if self._pool is None:
+            await processor.dispatch(payload)
+            return
+
+        self._pool.dispatch(
+            self._processor_indexes[processor],
+            processor.partition_key(msg, payload),
+            payload
+        )
+
     async def _receive(self, msg) -> None:
-        for processor in self._processors:
-            is_payload, payload = processor.is_message_type(msg)
+        if self._metrics is not None:
+            await self._measured_receive(msg)
+            return
 
-            if is_payload:
-                await processor.dispatch(payload)
+        processor = self._route(msg)
+
+        if processor is not None:
+            await self._dispatch(processor, msg)
 
     async def receive(self, msg) -> None:
         try:
             await self._receive(msg)
         except Exception as e:
-            await self._exception_processor.dispatch(e)
+            await self.handle_exception(e)
+
+    async def handle_exception(self, e: Exception) -> None:
+        """Dispatches an exception to exception handlers
+        """
+
+        await self._exception_processor.dispatch(e)
+
+    async def close(self) -> None:
+        for processor in self._all_processors:
+            try:
+                await processor.close()
+            except Exception as e:
+                await self.handle_exception(e)
+
+        if self._pool is not None:
+            await self._pool.close()
@@ -1,29 +1,56 @@
+import asyncio
+import zlib
 from typing import (
     List,
     Iterable,
-    Set,
+    Dict,
     Tuple,
     Optional
 )
 
 from aioretry import RetryPolicy
 
-from binance.common.constants import DEFAULT_STREAM_CLOSE_CODE
+from binance.common.constants import (
+    DEFAULT_STREAM_CLOSE_CODE,
+    ShardStrategy,
+    OverflowPolicy
+)
 from binance.common.exceptions import InvalidHandlerException
 from binance.common.types import Timeout
+from binance.common.codec import JSONCodec
+from binance.common.metrics import Metrics
 
 from .stream import Stream
+from .recorder import Recorder
 from .handler_context import HandlerContext
 
 # pylint: disable=no-member
 
 
+def get_shard_key(subscription: tuple) -> str:
+    # (SubType.TICKER, 'BTCUSDT') -> 'btcusdt'
+    # (SubType.ALL_MARKET_TICKERS,) -> 'allMarketTickers'
+    if len(subscription) > 1 and type(subscription[1]) is str:
+        return subscription[1].replace('_', '').lower()
+
+    return str(subscription[0])
+
+
 class SubscriptionManager:
-    _data_stream: Optional[Stream]
-    _subscribed: Set[tuple]
+    _data_streams: List[Optional[Stream]]
+
+    # subscription -> the index of the stream shard
+    _subscribed: Dict[tuple, int]
+
+    _stream_shard_strategy: ShardStrategy
     _stream_host: str
     _stream_retry_policy: RetryPolicy
     _stream_timeout: Timeout
+    _stream_queue_size: Optional[int]
+    _stream_overflow_policy: OverflowPolicy
+    _json_codec: JSONCodec
+    _recorder: Optional[Recorder]
+    _metrics: Optional[Metrics]
 
     def start(self):
         """Starts receiving messages.
@@ -53,7 +80,7 @@ class SubscriptionManager:
         self,
         code: int = DEFAULT_STREAM_CLOSE_CODE
     ) -> None:
-        """Closes stream connection, clear all stream subscriptions and clear all handlers.
+        """Closes stream connection, clear all stream subscriptions and clear all handlers, and stops handler worker processes if any.
 
         Args:
             code (:obj:`int`, optional): the close code for python library websockets. Defaults to 4999, and it should be in the range 4000 - 4999
@@ -61,9 +88,20 @@ class SubscriptionManager:
 
         self._receiving = False
 
-        if self._data_stream:
-            await self._data_stream.close(code)
-            self._data_stream = None
+        streams = [stream for stream in self._data_streams if stream]
+        self._data_streams = [None] * len(self._data_streams)
+
+        if streams:
+            await asyncio.gather(*[
+                stream.close(code) for stream in streams
+            ])
+
+        if self._recorder is not None:
+            # Hands the frames received so far over to the writer
+            self._recorder.flush()
+
+        if self._handler_ctx:
+            await self._handler_ctx.close()
 
         self._handler_ctx = None
 
@@ -71,35 +109,87 @@ class SubscriptionManager:
         if self._receiving:
             await self._handler_ctx.receive(msg)
 
+    async def _handle_exception(self, e: Exception) -> None:
+        await self._get_handler_ctx().handle_exception(e)
+
     def _get_handler_ctx(self) -> HandlerContext:
         if not self._handler_ctx:
             self._handler_ctx = HandlerContext(self)
 
         return self._handler_ctx
 
-    def _get_data_stream(self) -> Stream:
-        if self._data_stream is None:
-            self._data_stream = Stream(
+    def _get_data_stream(self, index: int = 0) -> Stream:
+        stream = self._data_streams[index]
+
+        if stream is None:
+            async def on_connected():
+                await self._resubscribe(index)
+
+            stream = Stream(
                 self._stream_host + '/stream',
                 on_message=self._receive,
-                on_connected=self._resubscribe,
+                on_connected=on_connected,
                 retry_policy=self._stream_retry_policy,
-                timeout=self._stream_timeout
+                timeout=self._stream_timeout,
+                json_codec=self._json_codec,
+                queue_size=self._stream_queue_size,
+                overflow_policy=self._stream_overflow_policy,
+                recorder=self._recorder,
+                metrics=self._metrics
             ).connect()
 
-        return self._data_stream
+            self._data_streams[index] = stream
+
+        return stream
+
+    def _get_shard(
+        self,
+        subscription: tuple,
+        loads: List[int]
+    ) -> int:
+        index = self._subscribed.get(subscription)
+
+        if index is not None:
+            return index
+
+        shards = len(self._data_streams)
+
+        if self._stream_shard_strategy == ShardStrategy.LOAD:
+            return loads.index(min(loads))
+
+        return zlib.crc32(get_shard_key(subscription).encode()) % shards
+
+    def _group_by_shard(
+        self,
+        subscriptions: Iterable[tuple]
+    ) -> Dict[int, List[tuple]]:
+        loads = [0] * len(self._data_streams)
+
+        for index in self._subscribed.values():
+            loads[index] += 1
+
+        groups = {}
+
+        for subscription in subscriptions:
+            index = self._get_shard(subscription, loads)
+            loads[index] += 1
+
+            groups.setdefault(index, []).append(subscription)
+
+        return groups
 
     async def _subscribe_only(
         self,
         subscribe: bool,
-        subscriptions: Iterable[tuple]
+        subscriptions: Iterable[tuple],
+        index: int = 0
     ) -> None:
         params = await self._get_handler_ctx().subscribe_params(
             subscribe,
             subscriptions
         )
 
-        stream = self._get_data_stream()
+        stream = self._get_data_stream(index)
 
         await stream.send({
             'method': 'SUBSCRIBE' if subscribe else 'UNSUBSCRIBE',
@@ -113,18 +203,29 @@ class SubscriptionManager:
         args: Tuple
     ):
         subscriptions = self._get_handler_ctx().overload_subscriptions(*args)
-
-        await self._subscribe_only(subscribe, subscriptions)
-
-        for param in subscriptions:
-            if subscribe:
-                self._subscribed.add(param)
-            else:
-                self._subscribed.discard(param)
-
-    async def _resubscribe(self) -> None:
-        if len(self._subscribed) > 0:
-            await self._subscribe_only(True, self._subscribed)
+        groups = self._group_by_shard(subscriptions)
+
+        await asyncio.gather(*[
+            self._subscribe_only(subscribe, group, index)
+            for index, group in groups.items()
+        ])
+
+        for index, group in groups.items():
+            for subscription in group:
+                if subscribe:
+                    self._subscribed[subscription] = index
+                else:
+                    self._subscribed.pop(subscription, None)
+
+    async def _resubscribe(self, index: int = 0) -> None:
+        subscriptions = [
+            subscription
+            for subscription, shard in self._subscribed.items()
+            if shard == index
+        ]
+
+        if len(subscriptions) > 0:
+            await self._subscribe_only(True, subscriptions, index)
 
     async def subscribe(self, *args):
         return await self._subscribe(True, args)
@@ -133,9 +234,39 @@ class SubscriptionManager:
         return await self._subscribe(False, args)
 
     async def list_subscriptions(self) -> List[str]:
-        return await self._get_data_stream().send({
-            'method': 'LIST_SUBSCRIPTIONS'
-        })
+        """Lists the subscriptions of all stream connections
+
+        Returns:
+            List[str]: the stream names
+        """
+
+        streams = [stream for stream in self._data_streams if stream] \
+            or [self._get_data_stream()]
+
+        results = await asyncio.gather(*[
+            stream.send({
+                'method': 'LIST_SUBSCRIPTIONS'
+            })
+            for stream in streams
+        ])
+
+        return [
+            param
+            for result in results
+            for param in result
+        ]
+
+    def stream_stats(self) -> List[Optional[dict]]:
+        """Gets the metrics of the message queue of each stream connection if `stream_queue_size` is specified. See `MessageQueue.stats()`
+
+        Returns:
+            List[Optional[dict]]: the metrics of each stream shard, or `None` if the connection of the shard is not created yet
+        """
+
+        return [
+            stream.queue.stats() if stream and stream.queue else None
+            for stream in self._data_streams
+        ]
 
     def handler(self, *handlers):
         """Sets the callback processing object to be used to handle websocket messages.
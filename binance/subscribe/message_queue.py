@@ -0,0 +1,167 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Optional
+)
+
+from binance.common.constants import (
+    OverflowPolicy,
+    CONFLATABLE_PAYLOAD_TYPES,
+    KEY_PAYLOAD,
+    KEY_PAYLOAD_TYPE,
+    KEY_STREAM_TYPE,
+    KEY_EVENT_TIME
+)
+from binance.common.utils import format_msg
+
+
+class MessageQueue:
+    """The bounded queue between the socket reader of a stream and the handlers, which also measures the depth of the queue and the lag of each stream.
+
+    Args:
+        size (int): the max number of queued messages
+        policy (:obj:`OverflowPolicy`, optional): what to do if the queue is full. Defaults to `OverflowPolicy.BLOCK`
+    """
+
+    def __init__(
+        self,
+        size: int,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK
+    ) -> None:
+        if size < 1:
+            raise ValueError(
+                format_msg('queue size should be positive, but got `%s`', size)
+            )
+
+        self._size = size
+        self._policy = policy
+
+        # Conflatable messages are keyed by stream names, and others are keyed
+        #   by sequence numbers, so that a newer ticker takes the place of the
+        #   older one in the queue
+        self._messages: Dict[Hashable, Any] = OrderedDict()
+        self._sequence = 0
+
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+        self._max_depth = 0
+        self._dropped = 0
+        self._conflated = 0
+
+        # stream name -> milliseconds
+        self._lags: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def _conflation_key(self, msg) -> Optional[str]:
+        if self._policy != OverflowPolicy.CONFLATE:
+            return
+
+        payload = msg.get(KEY_PAYLOAD)
+
+        # All market tickers
+        if type(payload) is list:
+            return msg.get(KEY_STREAM_TYPE)
+
+        if type(payload) is dict and \
+                payload.get(KEY_PAYLOAD_TYPE) in CONFLATABLE_PAYLOAD_TYPES:
+            return msg.get(KEY_STREAM_TYPE)
+
+    async def put(self, msg) -> None:
+        """Puts a message into the queue, which waits for a free slot if the queue is full and the policy is `OverflowPolicy.BLOCK` or `OverflowPolicy.CONFLATE`
+        """
+
+        messages = self._messages
+        key = self._conflation_key(msg)
+
+        if key is not None and key in messages:
+            messages[key] = msg
+            self._conflated += 1
+            return
+
+        while len(messages) >= self._size:
+            if self._policy == OverflowPolicy.DROP_OLDEST:
+                messages.popitem(last=False)
+                self._dropped += 1
+                continue
+
+            self._not_full.clear()
+            await self._not_full.wait()
+
+        if key is None:
+            key = self._sequence
+            self._sequence += 1
+
+        messages[key] = msg
+
+        depth = len(messages)
+        if depth > self._max_depth:
+            self._max_depth = depth
+
+        self._not_empty.set()
+
+    async def get(self) -> Any:
+        """Removes and returns the oldest message, which waits until there is a message
+        """
+
+        messages = self._messages
+
+        while not messages:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        _, msg = messages.popitem(last=False)
+        self._not_full.set()
+
+        self._measure_lag(msg)
+
+        return msg
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self._not_full.set()
+
+    def _measure_lag(self, msg) -> None:
+        payload = msg.get(KEY_PAYLOAD)
+
+        if type(payload) is list and payload:
+            payload = payload[0]
+
+        if type(payload) is not dict:
+            return
+
+        event_time = payload.get(KEY_EVENT_TIME)
+
+        if event_time is None:
+            return
+
+        self._lags[msg.get(KEY_STREAM_TYPE)] = \
+            time.time() * 1000 - event_time
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the metrics of the queue
+
+        Returns:
+            dict: with the following keys:
+
+            - depth (int): the number of queued messages
+            - max_depth (int): the max number of queued messages ever
+            - dropped (int): the number of messages dropped by `OverflowPolicy.DROP_OLDEST`
+            - conflated (int): the number of messages replaced by `OverflowPolicy.CONFLATE`
+            - lags (Dict[str, float]): stream name -> the milliseconds between the event time of the latest dequeued message and the time it is dequeued
+        """
+
+        return dict(
+            depth=len(self._messages),
+            max_depth=self._max_depth,
+            dropped=self._dropped,
+            conflated=self._conflated,
+            lags=dict(self._lags)
+        )
@@ -0,0 +1,310 @@
+import asyncio
+import multiprocessing
+import pickle
+import threading
+import zlib
+from typing import (
+    Any,
+    Callable,
+    Awaitable,
+    Dict,
+    List,
+    Optional
+)
+
+from binance.common.utils import (
+    wrap_coroutine,
+    repr_exception
+)
+from binance.handlers.base import Handler
+
+
+# Messages from the parent process to workers
+#   (KIND_HANDLER, handler_id, processor_index, pickled_handler)
+#   (KIND_PAYLOAD, processor_index, payload)
+KIND_HANDLER = 0
+KIND_PAYLOAD = 1
+
+# Messages from workers to the parent process
+#   (KIND_RESULT, handler_id, result)
+#   (KIND_EXCEPTION, exception)
+KIND_RESULT = 2
+KIND_EXCEPTION = 3
+
+# Seconds to wait for a worker to exit before it is terminated
+WORKER_JOIN_TIMEOUT = 5
+
+
+ExceptionCallback = Callable[[Exception], Awaitable[None]]
+
+
+class HandlerProcessPool:
+    """A pool of worker processes to run handlers out of the event loop of the client.
+
+    Each worker hosts the copies of all handlers. Stream payloads are partitioned among workers by their partition keys, i.e. symbols in most cases, so that payloads of the same symbol are always received in order by the same worker.
+
+    The non-None return values of `handler.receive()` in workers are delivered to `handler.receive_result()` of the original handlers in the parent process, and exceptions are forwarded to exception handlers.
+
+    Args:
+        processes (int): the number of worker processes
+        client_kwargs (dict): the keyworded arguments to create the client of each worker
+        handle_exception (Callable): the coroutine function to handle exceptions
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        client_kwargs: Dict[str, Any],
+        handle_exception: ExceptionCallback
+    ) -> None:
+        self._processes = processes
+        self._client_kwargs = client_kwargs
+        self._handle_exception = handle_exception
+
+        self._handlers: List[Handler] = []
+
+        # Handler messages to initialize new workers
+        self._registry: List[tuple] = []
+
+        self._workers = []
+        self._inboxes = []
+        self._outbox = None
+        self._reader = None
+        self._loop = None
+
+    @property
+    def started(self) -> bool:
+        return len(self._workers) > 0
+
+    def has_handler(
+        self,
+        handler: Handler
+    ) -> bool:
+        return any(h is handler for h in self._handlers)
+
+    def add_handler(
+        self,
+        processor_index: int,
+        handler: Handler
+    ) -> None:
+        # Pickle the handler right now so that unpicklable handlers
+        #   fail fast in `client.handler()`
+        message = (
+            KIND_HANDLER,
+            len(self._handlers),
+            processor_index,
+            pickle.dumps(handler)
+        )
+
+        self._handlers.append(handler)
+        self._registry.append(message)
+
+        for inbox in self._inboxes:
+            inbox.put(message)
+
+    def dispatch(
+        self,
+        processor_index: int,
+        key: str,
+        payload: Any
+    ) -> None:
+        if not self.started:
+            self._start()
+
+        index = zlib.crc32(key.encode()) % self._processes
+        self._inboxes[index].put((KIND_PAYLOAD, processor_index, payload))
+
+    def _start(self) -> None:
+        # Use spawn, because forking a process with a running event loop
+        #   and threads is unsafe
+        context = multiprocessing.get_context('spawn')
+
+        self._loop = asyncio.get_event_loop()
+        self._outbox = context.Queue()
+
+        for _ in range(self._processes):
+            inbox = context.Queue()
+            worker = context.Process(
+                target=run_worker,
+                args=(
+                    inbox,
+                    self._outbox,
+                    self._client_kwargs,
+                    self._registry
+                ),
+                daemon=True
+            )
+            worker.start()
+
+            self._inboxes.append(inbox)
+            self._workers.append(worker)
+
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self) -> None:
+        outbox = self._outbox
+        loop = self._loop
+
+        while True:
+            message = outbox.get()
+
+            if message is None:
+                return
+
+            loop.call_soon_threadsafe(self._on_message, message)
+
+    def _on_message(self, message: tuple) -> None:
+        if message[0] == KIND_RESULT:
+            handler = self._handlers[message[1]]
+            asyncio.create_task(self._deliver(handler, message[2]))
+        else:
+            asyncio.create_task(self._handle_exception(message[1]))
+
+    async def _deliver(
+        self,
+        handler: Handler,
+        result: Any
+    ) -> None:
+        try:
+            await wrap_coroutine(handler.receive_result(result))
+        except Exception as e:
+            await self._handle_exception(e)
+
+    def _join(self) -> None:
+        for worker in self._workers:
+            worker.join(WORKER_JOIN_TIMEOUT)
+
+            if worker.is_alive():  # pragma: no cover
+                worker.terminate()
+
+        # All workers exited, so there will be no more messages
+        self._outbox.put(None)
+        self._reader.join()
+
+    async def close(self) -> None:
+        """Stops all workers after they have received all pending payloads. Batched handlers in workers are flushed before exit.
+        """
+
+        if not self.started:
+            return
+
+        for inbox in self._inboxes:
+            inbox.put(None)
+
+        await self._loop.run_in_executor(None, self._join)
+
+        self._workers = []
+        self._inboxes = []
+        self._outbox = None
+        self._reader = None
+
+
+def _picklable_exception(e: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(e))
+        return e
+    except Exception:
+        # Some exceptions could not be restored from pickle,
+        #   such as those whose constructors have required arguments
+        return RuntimeError(repr_exception(e))
+
+
+def _capture_results(
+    handler: Handler,
+    handler_id: int,
+    outbox
+) -> None:
+    # Batches could also be delivered by timers or `handler.flush()`,
+    #   so capture the results of `receive_batch()` for batched handlers
+    name = 'receiveDispatch' if handler._batch is None else 'receive_batch'
+    method = getattr(handler, name)
+
+    async def capture(arg):
+        result = await wrap_coroutine(method(arg))
+
+        if result is not None:
+            outbox.put((KIND_RESULT, handler_id, result))
+
+    setattr(handler, name, capture)
+
+
+def _forward(
+    inbox,
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue
+) -> None:
+    while True:
+        message = inbox.get()
+        loop.call_soon_threadsafe(queue.put_nowait, message)
+
+        if message is None:
+            return
+
+
+async def _run_worker(
+    inbox,
+    outbox,
+    client_kwargs: Dict[str, Any],
+    registry: List[tuple]
+) -> None:
+    # Avoid circular imports
+    from binance.client import Client
+
+    client = Client(**client_kwargs)
+    processors = client._get_handler_ctx()._all_processors
+    handlers: List[Handler] = []
+
+    async def handle_exception(e: Exception) -> None:
+        outbox.put((KIND_EXCEPTION, _picklable_exception(e)))
+
+    # Exceptions of background tasks, such as batches flushed by timers,
+    #   are also sent back to the parent process
+    client._handle_exception = handle_exception
+
+    def add_handler(message: tuple) -> None:
+        _, handler_id, processor_index, data = message
+        handler = pickle.loads(data)
+
+        _capture_results(handler, handler_id, outbox)
+        processors[processor_index].add_handler(handler)
+        handlers.append(handler)
+
+    for message in registry:
+        add_handler(message)
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    threading.Thread(
+        target=_forward,
+        args=(inbox, loop, queue),
+        daemon=True
+    ).start()
+
+    while True:
+        message: Optional[tuple] = await queue.get()
+
+        if message is None:
+            break
+
+        if message[0] == KIND_HANDLER:
+            add_handler(message)
+            continue
+
+        try:
+            await processors[message[1]].dispatch(message[2])
+        except Exception as e:
+            await handle_exception(e)
+
+    for handler in handlers:
+        try:
+            await handler.flush()
+        except Exception as e:
+            await handle_exception(e)
+
+    await client.close()
+
+
+def run_worker(*args) -> None:
+    asyncio.run(_run_worker(*args))
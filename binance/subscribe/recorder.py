@@ -0,0 +1,591 @@
+import asyncio
+import json
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union
+)
+
+from binance.common.constants import (
+    SNAPSHOT_STREAM_TYPE,
+    DEFAULT_RECORDER_BLOCK_SIZE,
+    DEFAULT_RECORDER_FLUSH_INTERVAL,
+    DEFAULT_RECORDER_COMPRESSION,
+    DEFAULT_RECORDER_MAX_PENDING_BLOCKS,
+    DEFAULT_RECORDER_SEGMENT_SIZE,
+    DEFAULT_RECORDER_SEGMENT_INTERVAL
+)
+from binance.common.utils import (
+    format_msg,
+    normalize_symbol,
+    repr_exception
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Segment files are named by their sequence numbers, such as
+#   segment-00000001.seg, and its index file segment-00000001.idx
+SEGMENT_PREFIX = 'segment-'
+SEGMENT_NAME = SEGMENT_PREFIX + '%08d'
+SEGMENT_SUFFIX = '.seg'
+INDEX_SUFFIX = '.idx'
+
+# A segment file is a sequence of blocks, each of which is
+# - the header:
+#   magic, flags, number of frames, size of the body,
+#   received_at of the first and the last frame
+# - the body of frames, which is compressed by zlib if FLAG_ZLIB is set
+BLOCK_MAGIC = b'BNR1'
+BLOCK_HEADER = struct.Struct('<4sBIIqq')
+FLAG_ZLIB = 1
+
+# A frame is the header:
+#   received_at in nanoseconds, size of the stream name, size of the data
+# followed by the stream name and the raw text of the stream message
+FRAME_HEADER = struct.Struct('<qHI')
+
+MIN_TIME = - 1 << 63
+MAX_TIME = (1 << 63) - 1
+
+# (received_at, stream, data)
+RawFrame = Tuple[int, Optional[str], Union[str, bytes]]
+
+
+def snapshot_stream(symbol: str) -> str:
+    """Returns the pseudo stream name of the recorded depth snapshots of a symbol
+    """
+
+    return f'{normalize_symbol(symbol)}@{SNAPSHOT_STREAM_TYPE}'
+
+
+class Frame(NamedTuple):
+    # The local time in nanoseconds when the frame was received
+    received_at: int
+    # The stream name, such as `btcusdt@depth`,
+    #   or `None` for messages without streams, such as subscribe responses
+    stream: Optional[str]
+    # The raw text of the stream message
+    data: bytes
+
+
+class BlockInfo(NamedTuple):
+    offset: int
+    size: int
+    count: int
+    start: int
+    end: int
+    # `None` if the block is not indexed
+    streams: Optional[List[str]]
+
+
+def encode_block(
+    frames: List[RawFrame],
+    compression: int
+) -> Tuple[bytes, Set[str]]:
+    parts = []
+    streams = set()
+    pack = FRAME_HEADER.pack
+
+    for received_at, stream, data in frames:
+        if stream:
+            streams.add(stream)
+            name = stream.encode()
+        else:
+            name = b''
+
+        if type(data) is str:
+            data = data.encode()
+
+        parts.append(pack(received_at, len(name), len(data)))
+        parts.append(name)
+        parts.append(data)
+
+    body = b''.join(parts)
+    flags = 0
+
+    if compression:
+        body = zlib.compress(body, compression)
+        flags = FLAG_ZLIB
+
+    header = BLOCK_HEADER.pack(
+        BLOCK_MAGIC,
+        flags,
+        len(frames),
+        len(body),
+        frames[0][0],
+        frames[-1][0]
+    )
+
+    return header + body, streams
+
+
+def decode_block(
+    buffer: Any,
+    offset: int
+) -> Iterator[Frame]:
+    """Decodes the frames of the block at `offset` of `buffer`, which could be either bytes or mmap
+    """
+
+    _, flags, _, size, _, _ = BLOCK_HEADER.unpack_from(buffer, offset)
+
+    start = offset + BLOCK_HEADER.size
+    body = buffer[start:start + size]
+
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+
+    unpack = FRAME_HEADER.unpack_from
+    header_size = FRAME_HEADER.size
+    offset = 0
+    length = len(body)
+
+    while offset < length:
+        received_at, name_size, data_size = unpack(body, offset)
+        offset += header_size
+
+        stream = body[offset:offset + name_size].decode() or None
+        offset += name_size
+
+        yield Frame(received_at, stream, body[offset:offset + data_size])
+        offset += data_size
+
+
+class Recorder:
+    """Records raw stream messages with their receive timestamps into rotating, append-only segment files, which could be read by `RecordingReader`.
+
+    Messages are recorded before they are decoded by handlers. The depth snapshots requested by the client are also recorded as the messages of the pseudo stream `<symbol>@depthSnapshot`, such as `btcusdt@depthSnapshot`, so that orderbooks could be replayed. The event loop only appends frames to a buffer, and blocks of frames are compressed and written by a writer thread::
+
+        recorder = Recorder('./recordings')
+
+        client = Client(recorder=recorder)
+        await client.subscribe(SubType.ORDER_BOOK, 'BTCUSDT')
+
+        ...
+
+        await client.close()
+        await recorder.close()
+
+    Args:
+        path (str): the directory of segment files
+        block_size (:obj:`int`, optional): the bytes of frames to collect before a block is written. Defaults to 256KB
+        flush_interval (:obj:`float`, optional): the max seconds to wait before a block is written. Defaults to `1.`
+        compression (:obj:`int`, optional): the zlib compression level of blocks, `0` for no compression. Defaults to `6`
+        segment_size (:obj:`int`, optional): the bytes of a segment file before a new one is created. Defaults to 256MB
+        segment_interval (:obj:`float`, optional): the seconds of a segment file before a new one is created, `None` to rotate only by size. Defaults to 1 hour
+        max_pending_blocks (:obj:`int`, optional): the max number of blocks waiting for the writer thread. If the writer falls behind, further blocks are dropped rather than blocking the event loop. Defaults to `64`
+    """
+
+    def __init__(
+        self,
+        path: str,
+        block_size: int = DEFAULT_RECORDER_BLOCK_SIZE,
+        flush_interval: Optional[float] = DEFAULT_RECORDER_FLUSH_INTERVAL,
+        compression: int = DEFAULT_RECORDER_COMPRESSION,
+        segment_size: int = DEFAULT_RECORDER_SEGMENT_SIZE,
+        segment_interval: Optional[float] = DEFAULT_RECORDER_SEGMENT_INTERVAL,
+        max_pending_blocks: int = DEFAULT_RECORDER_MAX_PENDING_BLOCKS
+    ) -> None:
+        if max_pending_blocks < 1:
+            raise ValueError(
+                format_msg(
+                    'max_pending_blocks should be positive, but got `%s`',
+                    max_pending_blocks
+                )
+            )
+
+        self._path = path
+        self._block_size = block_size
+        self._flush_interval = flush_interval
+        self._compression = compression
+        self._segment_size = segment_size
+        self._segment_interval = None if segment_interval is None \
+            else int(segment_interval * 1e9)
+
+        self._frames: List[RawFrame] = []
+        self._buffered = 0
+        self._timer = None
+
+        self._queue = queue.Queue(max_pending_blocks)
+        self._thread = None
+
+        self._recorded = 0
+        self._dropped = 0
+        self._written = 0
+
+        # The states below are only accessed by the writer thread
+        self._segment = None
+        self._index = None
+        self._segment_bytes = 0
+        self._segment_start = 0
+
+    def record(
+        self,
+        stream: Optional[str],
+        data: Union[str, bytes],
+        received_at: Optional[int] = None
+    ) -> None:
+        """Records a raw stream message. Most usually, you should not call this method directly, which is invoked by `Stream` for every message.
+
+        Args:
+            stream (:obj:`str`, optional): the stream name of the message
+            data (str or bytes): the raw text of the message
+            received_at (:obj:`int`, optional): the local time in nanoseconds when the message was received. Defaults to now
+        """
+
+        if received_at is None:
+            received_at = time.time_ns()
+
+        self._frames.append((received_at, stream, data))
+        self._buffered += len(data)
+
+        if self._buffered >= self._block_size:
+            self.flush()
+            return
+
+        if self._timer is None and self._flush_interval is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Frames will be written by `flush()` or `close()`
+                return
+
+            self._timer = loop.call_later(self._flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Hands the buffered frames over to the writer thread
+        """
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        frames = self._frames
+
+        if not frames:
+            return
+
+        self._frames = []
+        self._buffered = 0
+
+        self._start_writer()
+
+        try:
+            self._queue.put_nowait(frames)
+        except queue.Full:
+            self._dropped += len(frames)
+
+            logger.warning(
+                format_msg(
+                    'the recorder writer falls behind, %s frames are dropped',
+                    len(frames)
+                )
+            )
+        else:
+            self._recorded += len(frames)
+
+    async def close(self) -> None:
+        """Writes all buffered frames, and stops the writer thread. The recorder could still be used after closed, and new frames will be written into a new segment file
+        """
+
+        self.flush()
+
+        if self._thread is None:
+            return
+
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._stop_writer
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Gets the metrics of the recorder
+
+        Returns:
+            dict: the metrics which contain
+
+            - recorded (int): the number of frames handed over to the writer
+            - dropped (int): the number of frames dropped because the writer fell behind
+            - written (int): the number of blocks written
+            - pending (int): the number of blocks waiting for the writer
+            - buffered (int): the number of frames not yet handed over
+        """
+
+        return dict(
+            recorded=self._recorded,
+            dropped=self._dropped,
+            written=self._written,
+            pending=self._queue.qsize(),
+            buffered=len(self._frames)
+        )
+
+    def _start_writer(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._write_blocks,
+            name='binance-recorder',
+            daemon=True
+        )
+        self._thread.start()
+
+    def _stop_writer(self) -> None:
+        thread = self._thread
+
+        self._queue.put(None)
+        thread.join()
+
+        self._thread = None
+
+    def _write_blocks(self) -> None:
+        while True:
+            frames = self._queue.get()
+
+            if frames is None:
+                break
+
+            try:
+                self._write_block(frames)
+            except Exception as e:
+                logger.error(
+                    format_msg(
+                        'fails to write %s recorded frames: %s',
+                        len(frames),
+                        repr_exception(e)
+                    )
+                )
+
+        self._close_segment()
+
+    def _write_block(self, frames: List[RawFrame]) -> None:
+        block, streams = encode_block(frames, self._compression)
+        start = frames[0][0]
+
+        if self._segment is not None and self._should_rotate(start):
+            self._close_segment()
+
+        if self._segment is None:
+            self._open_segment(start)
+
+        offset = self._segment_bytes
+
+        self._segment.write(block)
+        self._segment.flush()
+        self._segment_bytes += len(block)
+
+        # The index is written after the block,
+        #   so that it never points to the data which is not written
+        self._index.write(json.dumps(dict(
+            offset=offset,
+            size=len(block),
+            count=len(frames),
+            start=start,
+            end=frames[-1][0],
+            streams=sorted(streams)
+        )) + '\n')
+        self._index.flush()
+
+        self._written += 1
+
+    def _should_rotate(self, start: int) -> bool:
+        if self._segment_bytes >= self._segment_size:
+            return True
+
+        interval = self._segment_interval
+
+        return interval is not None and \
+            start - self._segment_start >= interval
+
+    def _open_segment(self, start: int) -> None:
+        os.makedirs(self._path, exist_ok=True)
+
+        names = list_segments(self._path)
+        seq = int(
+            os.path.basename(names[-1])[len(SEGMENT_PREFIX):]
+        ) + 1 if names else 1
+
+        name = os.path.join(self._path, SEGMENT_NAME % seq)
+
+        self._segment = open(name + SEGMENT_SUFFIX, 'ab')
+        self._index = open(name + INDEX_SUFFIX, 'a')
+        self._segment_bytes = 0
+        self._segment_start = start
+
+    def _close_segment(self) -> None:
+        if self._segment is None:
+            return
+
+        self._segment.close()
+        self._index.close()
+
+        self._segment = None
+        self._index = None
+
+
+def list_segments(path: str) -> List[str]:
+    """Lists the segment files of a directory in order, without suffixes
+    """
+
+    if not os.path.isdir(path):
+        return []
+
+    names = [
+        filename[:-len(SEGMENT_SUFFIX)]
+        for filename in os.listdir(path)
+        if filename.endswith(SEGMENT_SUFFIX)
+    ]
+
+    return sorted(
+        os.path.join(path, name)
+        for name in names
+        if name.startswith(SEGMENT_PREFIX)
+    )
+
+
+class RecordingReader:
+    """Reads the frames recorded by `Recorder` in the order they were received. Segment files are memory-mapped, and blocks out of the range of time or streams are skipped by the indexes without being decompressed::
+
+        reader = RecordingReader('./recordings')
+
+        for frame in reader.frames(streams=['btcusdt@depth']):
+            print(frame.received_at, json.loads(frame.data))
+
+    Args:
+        path (str): the directory of segment files
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    @property
+    def segments(self) -> List[str]:
+        """List[str]: the paths of segment files in order
+        """
+
+        return [
+            name + SEGMENT_SUFFIX for name in list_segments(self._path)
+        ]
+
+    def __iter__(self) -> Iterator[Frame]:
+        return self.frames()
+
+    def frames(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        streams: Optional[Iterable[str]] = None
+    ) -> Iterator[Frame]:
+        """Iterates the recorded frames
+
+        Args:
+            start (:obj:`int`, optional): the time in nanoseconds from which frames are received INCLUSIVE
+            end (:obj:`int`, optional): the time in nanoseconds until which frames are received INCLUSIVE
+            streams (:obj:`Iterable[str]`, optional): the stream names of frames. Defaults to all streams
+
+        Returns:
+            Iterator[Frame]
+        """
+
+        if start is None:
+            start = MIN_TIME
+
+        if end is None:
+            end = MAX_TIME
+
+        if streams is not None:
+            streams = set(streams)
+
+        for name in list_segments(self._path):
+            with open(name + SEGMENT_SUFFIX, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    continue
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for block in self._blocks(name, mm):
+                        if block.start > end:
+                            return
+
+                        if block.end < start or \
+                                not _has_streams(block, streams):
+                            continue
+
+                        for frame in decode_block(mm, block.offset):
+                            if start <= frame.received_at <= end and (
+                                streams is None or frame.stream in streams
+                            ):
+                                yield frame
+
+    def _blocks(
+        self,
+        name: str,
+        mm: mmap.mmap
+    ) -> Iterator[BlockInfo]:
+        offset = 0
+
+        try:
+            with open(name + INDEX_SUFFIX) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            lines = []
+
+        for line in lines:
+            try:
+                block = BlockInfo(**json.loads(line))
+            except (ValueError, TypeError):
+                # The last line is incomplete
+                break
+
+            yield block
+            offset = block.offset + block.size
+
+        # The blocks written after the index, if the recorder was not closed
+        yield from scan_blocks(mm, offset)
+
+
+def _has_streams(
+    block: BlockInfo,
+    streams: Optional[Set[str]]
+) -> bool:
+    # Blocks which are not indexed are always decoded
+    if streams is None or block.streams is None:
+        return True
+
+    return not streams.isdisjoint(block.streams)
+
+
+def scan_blocks(
+    buffer: Any,
+    offset: int = 0
+) -> Iterator[BlockInfo]:
+    """Scans the headers of blocks from `offset`, and stops at the first incomplete block
+    """
+
+    length = len(buffer)
+    header_size = BLOCK_HEADER.size
+
+    while offset + header_size <= length:
+        magic, _, count, size, start, end = BLOCK_HEADER.unpack_from(
+            buffer, offset
+        )
+
+        if magic != BLOCK_MAGIC or offset + header_size + size > length:
+            return
+
+        yield BlockInfo(offset, header_size + size, count, start, end, None)
+        offset += header_size + size
@@ -0,0 +1,154 @@
+import asyncio
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Set
+)
+
+from binance.client import Client
+from binance.common.constants import SNAPSHOT_STREAM_TYPE
+from binance.common.exceptions import ReplaySnapshotNotFoundException
+from binance.common.utils import normalize_symbol
+
+from .recorder import (
+    MIN_TIME,
+    RecordingReader,
+    snapshot_stream
+)
+
+SNAPSHOT_STREAM_SUFFIX = '@' + SNAPSHOT_STREAM_TYPE
+
+
+class ReplayClient(Client):
+    """A client which feeds the messages recorded by `Recorder` into handlers instead of connecting to streams. Messages go through the same path as the live ones, i.e. `HandlerContext`, processors and orderbooks, and depth snapshots are served from the recording, so that handlers could be tested and benchmarked reproducibly::
+
+        client = ReplayClient('./recordings')
+        client.handler(MyOrderBookHandler(), MyTradeHandler())
+
+        await client.subscribe(SubType.ORDER_BOOK, 'BTCUSDT')
+        await client.replay()
+
+    Subscriptions only set up the routes of messages, and no stream connection will be created. Other rest apis are still requested as usual.
+
+    Args:
+        path (str): the directory of recorded segment files
+        speed (:obj:`float`, optional): the multiple of the recorded pace to replay at, for example, `1.` for the recorded pace and `10.` for 10 times faster. Defaults to `None` which means as fast as possible
+        start (:obj:`int`, optional): the time in nanoseconds to replay from INCLUSIVE
+        end (:obj:`int`, optional): the time in nanoseconds to replay until INCLUSIVE
+        streams (:obj:`Iterable[str]`, optional): the stream names to replay. Defaults to all recorded streams
+        **kwargs: other arguments of `Client`
+    """
+
+    def __init__(
+        self,
+        path: str,
+        speed: Optional[float] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        streams: Optional[Iterable[str]] = None,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self._reader = RecordingReader(path)
+        self._speed = speed
+        self._start = start
+        self._end = end
+        self._streams = None if streams is None else set(streams)
+
+        # The receive time of the message being replayed
+        self._position = MIN_TIME if start is None else start
+
+        self._replay_params: Set[str] = set()
+
+    async def replay(self) -> int:
+        """Replays the recorded messages in order
+
+        Returns:
+            int: the number of replayed messages
+        """
+
+        loop = asyncio.get_running_loop()
+        loads = self._json_codec.loads
+
+        # The same as the messages of a `Stream`
+        on_message = self._receive
+        self._get_handler_ctx()
+
+        speed = self._speed
+        origin = None
+        count = 0
+
+        for frame in self._reader.frames(
+            self._start,
+            self._end,
+            self._streams
+        ):
+            stream = frame.stream
+
+            if stream is not None and stream.endswith(SNAPSHOT_STREAM_SUFFIX):
+                # Snapshots are served by `get_orderbook()`
+                continue
+
+            self._position = frame.received_at
+
+            if speed is None:
+                # Lets tasks, such as fetching snapshots, run between messages
+                await asyncio.sleep(0)
+            else:
+                if origin is None:
+                    origin = (loop.time(), frame.received_at)
+
+                delay = origin[0] - loop.time() + \
+                    (frame.received_at - origin[1]) / 1e9 / speed
+
+                # The sleep also yields when the delay is negative
+                await asyncio.sleep(delay)
+
+            await on_message(loads(frame.data))
+
+            count += 1
+
+        return count
+
+    async def get_orderbook(self, **kwargs) -> dict:
+        """Gets the depth snapshot of the symbol from the recording, which is the first snapshot recorded after the message being replayed, i.e. the snapshot which the live orderbook got
+
+        Args:
+            symbol (str): the symbol name
+            limit (:obj:`int`, optional): ignored, the recorded limit is used
+
+        Raises:
+            ReplaySnapshotNotFoundException: if there is no such snapshot
+        """
+
+        symbol = normalize_symbol(kwargs['symbol'])
+
+        for frame in self._reader.frames(
+            start=self._position,
+            streams=[snapshot_stream(symbol)]
+        ):
+            return self._json_codec.loads(frame.data)
+
+        raise ReplaySnapshotNotFoundException(symbol, self._position)
+
+    async def _subscribe_only(
+        self,
+        subscribe: bool,
+        subscriptions: Iterable[tuple],
+        index: int = 0
+    ) -> None:
+        # Only sets up the routes of messages
+        params = await self._get_handler_ctx().subscribe_params(
+            subscribe,
+            subscriptions
+        )
+
+        if subscribe:
+            self._replay_params.update(params)
+        else:
+            self._replay_params.difference_update(params)
+
+    async def list_subscriptions(self) -> List[str]:
+        return sorted(self._replay_params)
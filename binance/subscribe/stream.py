@@ -1,10 +1,11 @@
-import json
 import logging
 import asyncio
+import time
 from typing import (
     Optional,
     Dict,
-    Any
+    Any,
+    Union
 )
 
 from websockets import (
@@ -23,7 +24,6 @@ from aioretry import (
 )
 
 from binance.common.utils import (
-    json_stringify,
     format_msg,
     repr_exception,
     wrap_event_callback
@@ -42,7 +42,16 @@ from binance.common.constants import (
     STREAM_KEY_RESULT,
     STREAM_KEY_ERROR,
     ERROR_KEY_CODE,
-    ERROR_KEY_MESSAGE
+    ERROR_KEY_MESSAGE,
+    KEY_STREAM_TYPE,
+    KEY_PAYLOAD,
+    KEY_EVENT_TIME,
+    KEY_TRADE_TIME,
+    METRIC_STREAM_DECODE,
+    METRIC_STREAM_LATENCY,
+    METRIC_STREAM_MESSAGES,
+    METRIC_STREAM_RECONNECTS,
+    OverflowPolicy
 )
 
 from binance.common.types import (
@@ -50,6 +59,16 @@ from binance.common.types import (
     Timeout
 )
 
+from binance.common.codec import (
+    JSONCodec,
+    get_json_codec
+)
+
+from binance.common.metrics import Metrics
+
+from .message_queue import MessageQueue
+from .recorder import Recorder
+
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +85,11 @@ class Stream:
         on_connected (:obj:`Callable`, optional): invoked when the socket is connected
         retry_policy (RetryPolicy): see document
         timeout (float): timeout in seconds to receive the next websocket message
+        json_codec (:obj:`Union[str, JSONCodec]`, optional): the json codec to decode stream messages and encode outbound messages. Defaults to the fastest installed one
+        queue_size (:obj:`int`, optional): the max number of messages queued between the socket reader and `on_message`. Defaults to `None` which means `on_message` is awaited before reading the next message
+        overflow_policy (:obj:`OverflowPolicy`, optional): what to do if the queue is full. Defaults to `OverflowPolicy.BLOCK`
+        recorder (:obj:`Recorder`, optional): the recorder to record the raw text of every received message along with its receive time
+        metrics (:obj:`Metrics`, optional): the metrics to collect the decode time, the number, the latency of messages, and reconnections
     """
 
     _socket: Optional[WebSocketClientProtocol]
@@ -80,6 +104,11 @@ class Stream:
         #   because `binance.Stream` is also a public class
         retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
         timeout: Timeout = DEFAULT_STREAM_TIMEOUT,
+        json_codec: Union[str, JSONCodec, None] = None,
+        queue_size: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        recorder: Optional[Recorder] = None,
+        metrics: Optional[Metrics] = None
     ) -> None:
         self._on_message = wrap_event_callback(on_message, ON_MESSAGE, True)
         self._on_connected = wrap_event_callback(
@@ -90,6 +119,16 @@ class Stream:
 
         self._retry_policy = retry_policy
         self._timeout = timeout
+        self._json_codec = get_json_codec(json_codec)
+
+        self._queue = None
+        self._dispatch_task = None
+
+        if queue_size is not None:
+            self._queue = MessageQueue(queue_size, overflow_policy)
+
+        self._recorder = recorder
+        self._metrics = metrics
 
         self._socket = None
         self._conn_task = None
@@ -111,12 +150,32 @@ class Stream:
 
         self._socket = socket
 
+    @property
+    def queue(self) -> Optional[MessageQueue]:
+        """MessageQueue: the message queue if `queue_size` is specified, which provides the metrics of the queue via `stream.queue.stats()`
+        """
+
+        return self._queue
+
     def connect(self):
         self._before_connect()
 
         self._conn_task = asyncio.create_task(self._connect())
+
+        if self._queue is not None and self._dispatch_task is None:
+            self._dispatch_task = asyncio.create_task(self._dispatch())
+
         return self
 
+    async def _dispatch(self) -> None:
+        queue = self._queue
+
+        while True:
+            msg = await queue.get()
+
+            # Exceptions of `on_message` are handled by the wrapper
+            await self._emit(ON_MESSAGE, msg)
+
     async def _emit(
         self,
         event_name: str,
@@ -137,7 +196,11 @@ class Stream:
         ) or (
             msg[STREAM_KEY_ID] not in self._message_futures
         ):
-            await self._emit(ON_MESSAGE, msg)
+            if self._queue is None:
+                await self._emit(ON_MESSAGE, msg)
+            else:
+                await self._queue.put(msg)
+
             return
 
         message_id = msg[STREAM_KEY_ID]
@@ -176,8 +239,13 @@ class Stream:
         # which should be handled by self._connect()
 
         else:
+            received_at = time.time_ns()
+
+            if self._metrics is not None:
+                decode_start = time.perf_counter_ns()
+
             try:
-                parsed = json.loads(msg)
+                parsed = self._json_codec.loads(msg)
             except ValueError as e:
                 logger.error(
                     format_msg(
@@ -189,8 +257,58 @@ class Stream:
 
                 return
             else:
+                if self._metrics is not None:
+                    # Measured before recording, which is not decoding
+                    decode_time = time.perf_counter_ns() - decode_start
+
+                if self._recorder is not None:
+                    self._recorder.record(
+                        parsed.get(KEY_STREAM_TYPE)
+                        if type(parsed) is dict else None,
+                        msg,
+                        received_at
+                    )
+
+                if self._metrics is not None:
+                    self._observe(parsed, received_at, decode_time)
+
                 await self._handle_message(parsed)
 
+    def _observe(
+        self,
+        msg: Any,
+        received_at: int,
+        decode_time: int
+    ) -> None:
+        metrics = self._metrics
+
+        if type(msg) is not dict or KEY_STREAM_TYPE not in msg:
+            # Responses of subscriptions
+            metrics.observe(METRIC_STREAM_DECODE, None, decode_time)
+            return
+
+        stream = msg[KEY_STREAM_TYPE]
+
+        metrics.observe(METRIC_STREAM_DECODE, stream, decode_time)
+        metrics.increment(METRIC_STREAM_MESSAGES, stream)
+
+        payload = msg.get(KEY_PAYLOAD)
+
+        if type(payload) is not dict:
+            return
+
+        # Depth snapshots of partial book streams have no event time
+        event_time = payload.get(KEY_EVENT_TIME) or \
+            payload.get(KEY_TRADE_TIME)
+
+        if type(event_time) is int:
+            # The latency between the exchange and the receiving
+            metrics.observe(
+                METRIC_STREAM_LATENCY,
+                stream,
+                received_at - event_time * 1000000
+            )
+
     @retry(
         retry_policy='_retry_policy',
         after_failure='_reconnect'
@@ -232,6 +350,9 @@ class Stream:
             )
         )
 
+        if self._metrics is not None:
+            self._metrics.increment(METRIC_STREAM_RECONNECTS, self._uri)
+
         if self._connected_task is not None:
             self._connected_task.cancel()
 
@@ -276,6 +397,12 @@ class Stream:
 
         self._conn_task.cancel()
 
+        if self._dispatch_task is not None:
+            # Queued messages are discarded
+            self._dispatch_task.cancel()
+            self._dispatch_task = None
+            self._queue.clear()
+
         try:
             # Make sure:
             # - conn_task is cancelled
@@ -333,5 +460,5 @@ class Stream:
         msg[STREAM_KEY_ID] = message_id
         self._message_futures[message_id] = future
 
-        await socket.send(json_stringify(msg))
+        await socket.send(self._json_codec.dumps(msg))
         return await future
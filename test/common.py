@@ -2,7 +2,7 @@ import asyncio
 
 from aiohttp import web
 
-from binance.common.utils import json_stringify
+from binance.common.codec import json_stringify
 
 MAX_PRINT = 150
 
@@ -0,0 +1,2 @@
+from .market import MockMarket
+from .exchange import MockExchange
@@ -0,0 +1,956 @@
+import asyncio
+import secrets
+import random
+from urllib.parse import parse_qsl
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union
+)
+
+from aiohttp import (
+    web,
+    WSMsgType
+)
+
+from binance.apis.rest import APIS
+from binance.client.signer import HMACSigner
+from binance.common.constants import (
+    REST_API_VERSION,
+    DEFAULT_DEPTH_LIMIT,
+    DEFAULT_RATE_LIMITS,
+    HEADER_API_KEY,
+    HEADER_USED_WEIGHT_PREFIX,
+    HEADER_RETRY_AFTER,
+    STATUS_TOO_MANY_REQUESTS,
+    KLINE_TYPE_PREFIX,
+    KLINE_INTERVAL_MS,
+    STREAM_KEY_ID,
+    STREAM_KEY_RESULT,
+    STREAM_KEY_ERROR,
+    ERROR_KEY_CODE,
+    ERROR_KEY_MESSAGE,
+    KEY_PAYLOAD,
+    KEY_STREAM_TYPE,
+    KlineInterval,
+    RequestMethod,
+    SecurityType
+)
+from binance.common.codec import (
+    JSONCodec,
+    get_json_codec
+)
+from binance.common.utils import (
+    format_msg,
+    normalize_symbol
+)
+
+from .market import (
+    MockMarket,
+    MockOrderRejectedException,
+    format_order,
+    now_ms
+)
+
+# Market steps per second of each symbol, each of which generates
+#   a depth update and probably trades.
+# Binance pushes `@depth@100ms` at most 10 times per second
+DEFAULT_MOCK_RATE = 10.
+# Tickers and klines are pushed every second
+MOCK_PERIODIC_INTERVAL = 1.
+
+MINUTE_MS = 60 * 1000
+
+# The error codes of stream commands
+STREAM_ERROR_INVALID_VALUE = 1
+STREAM_ERROR_INVALID_REQUEST = 2
+
+# The error codes of rest apis
+ERROR_TOO_MANY_REQUESTS = -1003
+ERROR_UNAUTHORIZED = -2014
+ERROR_INVALID_SIGNATURE = -1022
+ERROR_MANDATORY_PARAM = -1102
+ERROR_INVALID_SYMBOL = -1121
+ERROR_INVALID_INTERVAL = -1120
+ERROR_INVALID_LISTEN_KEY = -1125
+
+ALL_MARKET_TICKERS_STREAM = '!ticker@arr'
+ALL_MARKET_MINI_TICKERS_STREAM = '!miniTicker@arr'
+
+# The stream types of depth updates
+DEPTH_STREAM_TYPES = ('depth', 'depth@100ms')
+
+
+class MockRequestError(Exception):
+    def __init__(
+        self,
+        code: int,
+        message: str,
+        status: int = 400
+    ) -> None:
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+def _index_apis() -> Dict[Tuple[str, str], dict]:
+    # (method, path) -> the setting of the api
+    return {
+        (
+            api.get('method', RequestMethod.GET).value.upper(),
+            f"/api/{api.get('version', REST_API_VERSION)}/{api['path']}"
+        ): api
+        for api in APIS
+    }
+
+
+API_SETTINGS = _index_apis()
+
+
+class _Connection:
+    def __init__(self, ws: web.WebSocketResponse, connected_at: float):
+        self.ws = ws
+        self.connected_at = connected_at
+        self.params: Set[str] = set()
+
+        # Frames to be sent in the next flush
+        self.frames: List[str] = []
+
+
+class MockExchange:
+    """A local stand-in of Binance for load testing, which serves the rest apis of market data, orders and listen keys, and the combined `/stream` websocket with `SUBSCRIBE`, `UNSUBSCRIBE` and `LIST_SUBSCRIPTIONS`. Each symbol is a `MockMarket` which generates depth updates and trades at the given rate, and matches orders against its orderbook::
+
+        async with MockExchange(['BTCUSDT'], rate=100) as exchange:
+            client = Client(
+                'api_key',
+                'api_secret',
+                api_host=exchange.rest_host,
+                stream_host=exchange.stream_host
+            )
+
+            await client.subscribe(SubType.ORDER_BOOK, 'BTCUSDT')
+
+    Args:
+        symbols (:obj:`Iterable[str]`, optional): the symbols to trade. Defaults to `['BTCUSDT']`
+        rate (:obj:`float`, optional): market steps per second of each symbol, each of which pushes a depth update and probably trades. Defaults to `10.`
+        gap_probability (:obj:`float`, optional): the probability to skip pushing a depth update, which makes a gap of update ids for orderbooks. Defaults to `0.`
+        disconnect_interval (:obj:`float`, optional): seconds after which each stream connection is closed by the server. Defaults to `None` which means never
+        api_secret (:obj:`str`, optional): if specified, the HMAC signatures of signed requests are verified, otherwise only the presence of signatures is checked
+        weight_limit (:obj:`int`, optional): the max request weight per minute, beyond which requests are responded with 429. Defaults to `None` which means no limit
+        depth (:obj:`int`, optional): the number of levels of each side of orderbooks. Defaults to `100`
+        seed (:obj:`int`, optional): the seed of random generators, so that the markets are reproducible
+        host (:obj:`str`, optional): Defaults to `'localhost'`
+        port (:obj:`int`, optional): Defaults to `0` which means an arbitrary unused port
+        json_codec (:obj:`Union[str, JSONCodec]`, optional): the json codec to decode stream commands and encode responses and stream messages, which could be the same one as the client. Defaults to the fastest installed one
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str] = ('BTCUSDT',),
+        rate: float = DEFAULT_MOCK_RATE,
+        gap_probability: float = 0.,
+        disconnect_interval: Optional[float] = None,
+        api_secret: Optional[str] = None,
+        weight_limit: Optional[int] = None,
+        depth: int = 100,
+        seed: Optional[int] = None,
+        host: str = 'localhost',
+        port: int = 0,
+        json_codec: Union[str, JSONCodec, None] = None
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(
+                format_msg('rate should be positive, but got `%s`', rate)
+            )
+
+        self._markets = {}
+
+        for i, symbol in enumerate(symbols):
+            market = MockMarket(
+                symbol,
+                depth=depth,
+                seed=None if seed is None else seed + i
+            )
+            self._markets[market.symbol] = market
+
+        self._rate = rate
+        self._gap_probability = gap_probability
+        self._disconnect_interval = disconnect_interval
+        self._signer = None if api_secret is None else HMACSigner(api_secret)
+        self._weight_limit = weight_limit
+        self._rand = random.Random(seed)
+        self._json_codec = get_json_codec(json_codec)
+
+        self._host = host
+        self._port = port
+        self._runner = None
+        self._task = None
+
+        self._connections: Set[_Connection] = set()
+
+        # stream name -> connections
+        self._subscribers: Dict[str, Set[_Connection]] = {}
+
+        self._listen_keys: Set[str] = set()
+
+        # (minute, used weight)
+        self._used_weight = (0, 0)
+
+        self._stats = dict(
+            requests=0,
+            messages=0,
+            gaps=0,
+            disconnects=0
+        )
+
+        self._app = web.Application()
+        self._app.add_routes([
+            web.get('/stream', self._stream_handler),
+            *self._rest_routes()
+        ])
+
+    # Lifecycle
+    # -----------------------------------------------
+
+    @property
+    def rest_host(self) -> str:
+        """str: the `api_host` for `Client`
+        """
+
+        return f'http://{self._host}:{self._port}'
+
+    @property
+    def stream_host(self) -> str:
+        """str: the `stream_host` for `Client`
+        """
+
+        return f'ws://{self._host}:{self._port}'
+
+    def market(self, symbol: str) -> MockMarket:
+        return self._markets[normalize_symbol(symbol, True)]
+
+    def stats(self) -> dict:
+        """Gets the statistics of the exchange
+
+        Returns:
+            dict: `connections`, `subscriptions`, `requests`, the number of rest api requests, `messages`, the number of pushed stream messages, `gaps`, the number of skipped depth updates, and `disconnects`
+        """
+
+        return dict(
+            connections=len(self._connections),
+            subscriptions=sum(len(c.params) for c in self._connections),
+            **self._stats
+        )
+
+    async def start(self) -> 'MockExchange':
+        """Starts serving and generating market data
+        """
+
+        self._runner = web.AppRunner(self._app)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+
+        if self._port == 0:
+            self._port = self._runner.addresses[0][1]
+
+        self._task = asyncio.create_task(self._run())
+
+        return self
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        for connection in list(self._connections):
+            await connection.ws.close()
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'MockExchange':
+        return await self.start()
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    # Streams
+    # -----------------------------------------------
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        steps = 0
+        periodic_at = start
+
+        while True:
+            now = loop.time()
+            due = int((now - start) * self._rate)
+
+            # Catches up if the loop falls behind,
+            #   but no more than a second of steps at once
+            for _ in range(min(due - steps, max(int(self._rate), 1))):
+                self._step()
+
+            steps = due
+
+            if now >= periodic_at:
+                self._push_periodic()
+                periodic_at += MOCK_PERIODIC_INTERVAL
+
+            self._push_reports()
+
+            await self._flush(now)
+
+            await asyncio.sleep(
+                max(start + (steps + 1) / self._rate - loop.time(), 0)
+            )
+
+    def _subscribed(self, stream: str) -> bool:
+        return bool(self._subscribers.get(stream))
+
+    def _push(self, stream: str, payload: Any) -> None:
+        connections = self._subscribers.get(stream)
+
+        if not connections:
+            return
+
+        frame = self._json_codec.dumps({
+            KEY_STREAM_TYPE: stream,
+            KEY_PAYLOAD: payload
+        })
+
+        for connection in connections:
+            connection.frames.append(frame)
+
+    def _step(self) -> None:
+        event_time = now_ms()
+
+        for market in self._markets.values():
+            depth_update, trades = market.step(event_time)
+            prefix = market.symbol.lower() + '@'
+
+            if self._rand.random() < self._gap_probability:
+                self._stats['gaps'] += 1
+            else:
+                for stream_type in DEPTH_STREAM_TYPES:
+                    self._push(prefix + stream_type, depth_update)
+
+            for trade in trades:
+                self._push(prefix + 'trade', trade)
+
+            agg_stream = prefix + 'aggTrade'
+
+            if trades and self._subscribed(agg_stream):
+                for trade in list(market.trades)[-len(trades):]:
+                    self._push(
+                        agg_stream,
+                        market.agg_trade_payload(trade, event_time)
+                    )
+
+    def _push_periodic(self) -> None:
+        event_time = now_ms()
+        tickers = []
+        mini_tickers = []
+
+        all_tickers = self._subscribed(ALL_MARKET_TICKERS_STREAM)
+        all_mini_tickers = self._subscribed(ALL_MARKET_MINI_TICKERS_STREAM)
+
+        for market in self._markets.values():
+            prefix = market.symbol.lower() + '@'
+
+            if all_tickers or self._subscribed(prefix + 'ticker'):
+                ticker = market.ticker_payload(event_time)
+                tickers.append(ticker)
+                self._push(prefix + 'ticker', ticker)
+
+            if all_mini_tickers or self._subscribed(prefix + 'miniTicker'):
+                ticker = market.ticker_payload(event_time, True)
+                mini_tickers.append(ticker)
+                self._push(prefix + 'miniTicker', ticker)
+
+            for interval in KLINE_INTERVAL_MS:
+                stream = f'{prefix}{KLINE_TYPE_PREFIX}{interval}'
+
+                if not self._subscribed(stream):
+                    continue
+
+                kline = market.kline_payload(
+                    interval.value,
+                    KLINE_INTERVAL_MS[interval],
+                    event_time
+                )
+
+                if kline is not None:
+                    self._push(stream, kline)
+
+        if tickers:
+            self._push(ALL_MARKET_TICKERS_STREAM, tickers)
+
+        if mini_tickers:
+            self._push(ALL_MARKET_MINI_TICKERS_STREAM, mini_tickers)
+
+    def _push_reports(self) -> None:
+        # The exchange has only one account,
+        #   so every listen key receives all execution reports
+        for market in self._markets.values():
+            for report in market.drain_reports():
+                for listen_key in self._listen_keys:
+                    self._push(listen_key, report)
+
+    async def _flush(self, now: float) -> None:
+        tasks = []
+
+        for connection in list(self._connections):
+            if self._disconnect_interval is not None and \
+                    now - connection.connected_at >= self._disconnect_interval:
+                self._stats['disconnects'] += 1
+                self._remove_connection(connection)
+                tasks.append(connection.ws.close())
+                continue
+
+            if connection.frames:
+                tasks.append(self._send_frames(connection))
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _send_frames(self, connection: _Connection) -> None:
+        frames = connection.frames
+        connection.frames = []
+
+        self._stats['messages'] += len(frames)
+
+        for frame in frames:
+            await connection.ws.send_str(frame)
+
+    def _remove_connection(self, connection: _Connection) -> None:
+        self._connections.discard(connection)
+
+        for param in connection.params:
+            self._subscribers.get(param, set()).discard(connection)
+
+        connection.params.clear()
+
+    async def _stream_handler(self, request: web.Request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        connection = _Connection(ws, asyncio.get_running_loop().time())
+        self._connections.add(connection)
+
+        # `/stream?streams=btcusdt@depth/btcusdt@trade`
+        streams = request.query.get('streams')
+
+        if streams:
+            self._subscribe(connection, streams.split('/'))
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    break
+
+                await ws.send_str(
+                    self._json_codec.dumps(
+                        self._handle_command(connection, msg.data)
+                    )
+                )
+        finally:
+            self._remove_connection(connection)
+
+        return ws
+
+    def _subscribe(self, connection: _Connection, params: List[str]) -> None:
+        for param in params:
+            connection.params.add(param)
+            self._subscribers.setdefault(param, set()).add(connection)
+
+    def _handle_command(self, connection: _Connection, data: str) -> dict:
+        try:
+            command = self._json_codec.loads(data)
+        except ValueError:
+            return self._stream_error(
+                STREAM_ERROR_INVALID_REQUEST,
+                'Invalid JSON',
+                None
+            )
+
+        if type(command) is not dict:
+            return self._stream_error(
+                STREAM_ERROR_INVALID_REQUEST,
+                'Invalid request',
+                None
+            )
+
+        message_id = command.get(STREAM_KEY_ID)
+        method = command.get('method')
+        params = command.get('params', [])
+
+        if type(params) is not list or \
+                not all(type(param) is str for param in params):
+            return self._stream_error(
+                STREAM_ERROR_INVALID_VALUE,
+                'Invalid value type: expected Array of String',
+                message_id
+            )
+
+        if method == 'SUBSCRIBE':
+            self._subscribe(connection, params)
+            result = None
+
+        elif method == 'UNSUBSCRIBE':
+            for param in params:
+                connection.params.discard(param)
+                self._subscribers.get(param, set()).discard(connection)
+
+            result = None
+
+        elif method == 'LIST_SUBSCRIPTIONS':
+            result = sorted(connection.params)
+
+        else:
+            return self._stream_error(
+                STREAM_ERROR_INVALID_REQUEST,
+                f'Unknown method {method}',
+                message_id
+            )
+
+        return {
+            STREAM_KEY_RESULT: result,
+            STREAM_KEY_ID: message_id
+        }
+
+    @staticmethod
+    def _stream_error(code: int, message: str, message_id) -> dict:
+        return {
+            STREAM_KEY_ERROR: {
+                ERROR_KEY_CODE: code,
+                ERROR_KEY_MESSAGE: message
+            },
+            STREAM_KEY_ID: message_id
+        }
+
+    # Rest apis
+    # -----------------------------------------------
+
+    def _rest_routes(self) -> list:
+        endpoints = [
+            ('GET', 'ping', self._ping),
+            ('GET', 'time', self._time),
+            ('GET', 'exchangeInfo', self._exchange_info),
+            ('GET', 'depth', self._depth),
+            ('GET', 'trades', self._trades),
+            ('GET', 'historicalTrades', self._trades),
+            ('GET', 'aggTrades', self._agg_trades),
+            ('GET', 'klines', self._klines),
+            ('GET', 'avgPrice', self._avg_price),
+            ('GET', 'ticker/24hr', self._ticker),
+            ('GET', 'ticker/price', self._ticker_price),
+            ('GET', 'ticker/bookTicker', self._book_ticker),
+            ('POST', 'order', self._create_order),
+            ('POST', 'order/test', self._create_test_order),
+            ('GET', 'order', self._get_order),
+            ('DELETE', 'order', self._cancel_order),
+            ('GET', 'openOrders', self._open_orders),
+            ('GET', 'allOrders', self._all_orders),
+            ('GET', 'account', self._account),
+            ('GET', 'myTrades', self._my_trades),
+            ('POST', 'userDataStream', self._create_listen_key),
+            ('PUT', 'userDataStream', self._keepalive_listen_key),
+            ('DELETE', 'userDataStream', self._close_listen_key)
+        ]
+
+        routes = []
+
+        for method, path, endpoint in endpoints:
+            uri = f'/api/{REST_API_VERSION}/{path}'
+            api = API_SETTINGS.get(
+                (method, uri),
+                # Listen key endpoints are not defined in `APIS`
+                dict(security_type=SecurityType.USER_STREAM)
+            )
+
+            routes.append(
+                web.route(method, uri, self._wrap_endpoint(endpoint, api))
+            )
+
+        return routes
+
+    def _wrap_endpoint(
+        self,
+        endpoint: Callable[[dict], Any],
+        api: dict
+    ):
+        security_type = api.get('security_type', SecurityType.NONE)
+        weight = api.get('weight', 1)
+
+        async def handler(request: web.Request):
+            self._stats['requests'] += 1
+
+            if request.method == RequestMethod.GET.value.upper():
+                raw = request.query_string
+            else:
+                raw = await request.text() or request.query_string
+
+            params = dict(parse_qsl(raw))
+            cost = weight(params) if callable(weight) else weight
+            used = self._consume_weight(cost)
+
+            headers = {
+                HEADER_USED_WEIGHT_PREFIX + '1M': str(used)
+            }
+
+            try:
+                if self._weight_limit is not None and \
+                        used > self._weight_limit:
+                    headers[HEADER_RETRY_AFTER] = str(
+                        (MINUTE_MS - now_ms() % MINUTE_MS) // 1000 + 1
+                    )
+
+                    raise MockRequestError(
+                        ERROR_TOO_MANY_REQUESTS,
+                        'Too many requests.',
+                        STATUS_TOO_MANY_REQUESTS
+                    )
+
+                self._check_security(request, security_type, raw)
+                result = endpoint(params)
+
+            except MockRequestError as e:
+                return self._rest_error(e.code, e.message, e.status, headers)
+
+            except MockOrderRejectedException as e:
+                return self._rest_error(e.code, e.message, 400, headers)
+
+            except KeyError as e:
+                return self._rest_error(
+                    ERROR_MANDATORY_PARAM,
+                    f'Mandatory parameter {e} was not sent, was empty/null, or malformed.',
+                    400,
+                    headers
+                )
+
+            return web.json_response(
+                result,
+                headers=headers,
+                dumps=self._json_codec.dumps
+            )
+
+        return handler
+
+    def _rest_error(
+        self,
+        code: int,
+        message: str,
+        status: int,
+        headers: dict
+    ) -> web.Response:
+        return web.json_response(
+            {ERROR_KEY_CODE: code, ERROR_KEY_MESSAGE: message},
+            status=status,
+            headers=headers,
+            dumps=self._json_codec.dumps
+        )
+
+    def _consume_weight(self, weight: int) -> int:
+        minute = now_ms() // MINUTE_MS
+        current, used = self._used_weight
+
+        if current != minute:
+            used = 0
+
+        used += weight
+        self._used_weight = (minute, used)
+
+        return used
+
+    def _check_security(
+        self,
+        request: web.Request,
+        security_type: SecurityType,
+        raw: str
+    ) -> None:
+        need_api_key, need_signed = security_type.value
+
+        if need_api_key and not request.headers.get(HEADER_API_KEY):
+            raise MockRequestError(
+                ERROR_UNAUTHORIZED,
+                'API-key format invalid.',
+                401
+            )
+
+        if not need_signed:
+            return
+
+        payload, separator, signature = raw.rpartition('&signature=')
+
+        if not separator or 'timestamp=' not in payload:
+            raise MockRequestError(
+                ERROR_INVALID_SIGNATURE,
+                'Signature for this request is not valid.'
+            )
+
+        if self._signer is not None and \
+                self._signer.sign(payload.encode('utf-8')) != signature:
+            raise MockRequestError(
+                ERROR_INVALID_SIGNATURE,
+                'Signature for this request is not valid.'
+            )
+
+    def _get_market(self, params: dict) -> MockMarket:
+        market = self._markets.get(params['symbol'])
+
+        if market is None:
+            raise MockRequestError(ERROR_INVALID_SYMBOL, 'Invalid symbol.')
+
+        return market
+
+    def _markets_of(self, params: dict) -> Tuple[bool, List[MockMarket]]:
+        # Endpoints which return the data of all symbols if `symbol` is omitted
+        if 'symbol' in params:
+            return True, [self._get_market(params)]
+
+        return False, list(self._markets.values())
+
+    def _ping(self, params: dict) -> dict:
+        return {}
+
+    def _time(self, params: dict) -> dict:
+        return {'serverTime': now_ms()}
+
+    def _exchange_info(self, params: dict) -> dict:
+        return {
+            'timezone': 'UTC',
+            'serverTime': now_ms(),
+            'rateLimits': DEFAULT_RATE_LIMITS,
+            'exchangeFilters': [],
+            'symbols': [
+                {
+                    'symbol': market.symbol,
+                    'status': 'TRADING',
+                    'baseAssetPrecision': 8,
+                    'quotePrecision': 8,
+                    'orderTypes': ['LIMIT', 'LIMIT_MAKER', 'MARKET'],
+                    'filters': [
+                        {
+                            'filterType': 'PRICE_FILTER',
+                            'minPrice': f'{market.tick_size:.8f}',
+                            'maxPrice': '1000000.00000000',
+                            'tickSize': f'{market.tick_size:.8f}'
+                        },
+                        {
+                            'filterType': 'LOT_SIZE',
+                            'minQty': '0.00100000',
+                            'maxQty': '9000.00000000',
+                            'stepSize': '0.00100000'
+                        }
+                    ]
+                }
+                for market in self._markets.values()
+            ]
+        }
+
+    def _depth(self, params: dict) -> dict:
+        market = self._get_market(params)
+        return market.snapshot(int(params.get('limit', DEFAULT_DEPTH_LIMIT)))
+
+    def _trades(self, params: dict) -> list:
+        market = self._get_market(params)
+        return market.recent_trades(int(params.get('limit', 500)))
+
+    def _agg_trades(self, params: dict) -> list:
+        market = self._get_market(params)
+        return market.aggregate_trades(int(params.get('limit', 500)))
+
+    def _klines(self, params: dict) -> list:
+        market = self._get_market(params)
+
+        try:
+            interval_ms = KLINE_INTERVAL_MS[KlineInterval(params['interval'])]
+        except (ValueError, KeyError):
+            if 'interval' not in params:
+                raise
+
+            raise MockRequestError(ERROR_INVALID_INTERVAL, 'Invalid interval.')
+
+        start_time = params.get('startTime')
+        end_time = params.get('endTime')
+
+        return market.klines(
+            interval_ms,
+            int(params.get('limit', 500)),
+            None if start_time is None else int(start_time),
+            None if end_time is None else int(end_time)
+        )
+
+    def _avg_price(self, params: dict) -> dict:
+        ticker = self._get_market(params).ticker()
+
+        return {
+            'mins': 5,
+            'price': ticker['weightedAvgPrice']
+        }
+
+    def _ticker(self, params: dict) -> Any:
+        single, markets = self._markets_of(params)
+        tickers = [market.ticker() for market in markets]
+
+        return tickers[0] if single else tickers
+
+    def _ticker_price(self, params: dict) -> Any:
+        single, markets = self._markets_of(params)
+        tickers = [
+            {'symbol': ticker['symbol'], 'price': ticker['lastPrice']}
+            for ticker in (market.ticker() for market in markets)
+        ]
+
+        return tickers[0] if single else tickers
+
+    def _book_ticker(self, params: dict) -> Any:
+        single, markets = self._markets_of(params)
+        tickers = [
+            {
+                key: ticker[key]
+                for key in (
+                    'symbol', 'bidPrice', 'bidQty', 'askPrice', 'askQty'
+                )
+            }
+            for ticker in (market.ticker() for market in markets)
+        ]
+
+        return tickers[0] if single else tickers
+
+    def _place_order(self, params: dict, test: bool) -> dict:
+        return self._get_market(params).place_order(
+            params['side'],
+            params['type'],
+            params['quantity'],
+            params.get('price'),
+            params.get('timeInForce', 'GTC'),
+            params.get('newClientOrderId'),
+            test
+        )
+
+    def _create_order(self, params: dict) -> dict:
+        order = self._place_order(params, False)
+        self._push_reports()
+
+        return format_order(order, True)
+
+    def _create_test_order(self, params: dict) -> dict:
+        return self._place_order(params, True)
+
+    @staticmethod
+    def _order_ids(params: dict) -> Tuple[Optional[int], Optional[str]]:
+        order_id = params.get('orderId')
+        client_order_id = params.get('origClientOrderId')
+
+        if order_id is None and client_order_id is None:
+            raise KeyError('orderId')
+
+        return (
+            None if order_id is None else int(order_id),
+            client_order_id
+        )
+
+    def _get_order(self, params: dict) -> dict:
+        market = self._get_market(params)
+        return format_order(market.get_order(*self._order_ids(params)))
+
+    def _cancel_order(self, params: dict) -> dict:
+        market = self._get_market(params)
+        order = market.cancel_order(*self._order_ids(params))
+
+        self._push_reports()
+
+        return format_order(order)
+
+    def _open_orders(self, params: dict) -> list:
+        _, markets = self._markets_of(params)
+
+        return [
+            format_order(order)
+            for market in markets
+            for order in market.open_orders()
+        ]
+
+    def _all_orders(self, params: dict) -> list:
+        market = self._get_market(params)
+        limit = int(params.get('limit', 500))
+
+        return [
+            format_order(order)
+            for order in market.all_orders()[-limit:]
+        ]
+
+    def _account(self, params: dict) -> dict:
+        # Balances are not tracked by the simple matching model
+        return {
+            'makerCommission': 0,
+            'takerCommission': 0,
+            'buyerCommission': 0,
+            'sellerCommission': 0,
+            'canTrade': True,
+            'canWithdraw': True,
+            'canDeposit': True,
+            'updateTime': now_ms(),
+            'accountType': 'SPOT',
+            'balances': [],
+            'permissions': ['SPOT']
+        }
+
+    def _my_trades(self, params: dict) -> list:
+        market = self._get_market(params)
+
+        return [
+            {
+                'symbol': market.symbol,
+                'id': fill['tradeId'],
+                'orderId': order['orderId'],
+                'orderListId': -1,
+                'price': fill['price'],
+                'qty': fill['qty'],
+                'commission': fill['commission'],
+                'commissionAsset': fill['commissionAsset'],
+                'time': order['updateTime'],
+                'isBuyer': order['side'] == 'BUY',
+                'isMaker': False,
+                'isBestMatch': True
+            }
+            for order in market.all_orders()
+            for fill in order['fills']
+        ]
+
+    def _create_listen_key(self, params: dict) -> dict:
+        listen_key = secrets.token_hex(30)
+        self._listen_keys.add(listen_key)
+
+        return {'listenKey': listen_key}
+
+    def _check_listen_key(self, params: dict) -> str:
+        listen_key = params['listenKey']
+
+        if listen_key not in self._listen_keys:
+            raise MockRequestError(
+                ERROR_INVALID_LISTEN_KEY,
+                'This listenKey does not exist.'
+            )
+
+        return listen_key
+
+    def _keepalive_listen_key(self, params: dict) -> dict:
+        self._check_listen_key(params)
+        return {}
+
+    def _close_listen_key(self, params: dict) -> dict:
+        self._listen_keys.discard(self._check_listen_key(params))
+        return {}
@@ -0,0 +1,944 @@
+import random
+import time
+from collections import deque
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from binance.common.constants import (
+    OrderSide,
+    OrderType,
+    TimeInForce,
+    DEFAULT_DEPTH_LIMIT
+)
+from binance.common.utils import (
+    format_msg,
+    normalize_symbol
+)
+
+
+class MockOrderRejectedException(Exception):
+    def __init__(
+        self,
+        code: int,
+        message: str
+    ) -> None:
+        self.code = code
+        self.message = message
+
+    def __str__(self) -> str:
+        return format_msg(
+            'order rejected by the mock exchange, code: %s, reason: %s',
+            self.code,
+            self.message
+        )
+
+
+# The max number of trades kept for rest apis and klines
+MAX_TRADES = 100000
+
+STATUS_NEW = 'NEW'
+STATUS_PARTIALLY_FILLED = 'PARTIALLY_FILLED'
+STATUS_FILLED = 'FILLED'
+STATUS_CANCELED = 'CANCELED'
+STATUS_EXPIRED = 'EXPIRED'
+
+# Order statuses which could not be changed any more
+FINAL_STATUSES = (STATUS_FILLED, STATUS_CANCELED, STATUS_EXPIRED)
+
+ERROR_ORDER_REJECTED = -2010
+ERROR_ORDER_NOT_FOUND = -2013
+ERROR_INVALID_PARAM = -1100
+
+
+def now_ms() -> int:
+    return time.time_ns() // 1000000
+
+
+def format_number(value: float) -> str:
+    return f'{value:.8f}'
+
+
+def format_order(order: dict, fills: bool = False) -> dict:
+    """Removes the private fields of an order for responses
+    """
+
+    return {
+        key: value for key, value in order.items()
+        if not key.startswith('_') and (fills or key != 'fills')
+    }
+
+
+class MockMarket:
+    """The synthetic market of a symbol used by `MockExchange`, which maintains an orderbook of random levels around the price, generates depth updates and trades, and matches orders against the orderbook.
+
+    Prices are kept as integer ticks so that levels are exact.
+
+    Args:
+        symbol (str): the symbol name, such as `'BTCUSDT'`
+        price (:obj:`float`, optional): the initial mid price. Defaults to `10000.`
+        tick_size (:obj:`float`, optional): Defaults to `0.01`
+        depth (:obj:`int`, optional): the number of levels of each side to keep at least. Defaults to `100`
+        seed (:obj:`int`, optional): the seed of the random generator, so that the market is reproducible
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        price: float = 10000.,
+        tick_size: float = 0.01,
+        depth: int = 100,
+        seed: Optional[int] = None
+    ) -> None:
+        self.symbol = normalize_symbol(symbol, True)
+        self.tick_size = tick_size
+
+        self._rand = random.Random(seed)
+        self._depth = depth
+
+        # price ticks -> quantity
+        self._asks: Dict[int, float] = {}
+        self._bids: Dict[int, float] = {}
+
+        mid = round(price / tick_size)
+
+        for i in range(depth):
+            self._asks[mid + 1 + i] = self._random_quantity()
+            self._bids[mid - 1 - i] = self._random_quantity()
+
+        self.update_id = 1
+
+        self._trade_id = 0
+        self.trades = deque(maxlen=MAX_TRADES)
+
+        self._order_id = 0
+        self._orders: Dict[int, dict] = {}
+
+        # The changed levels since the last depth update,
+        #   which are keyed by (is_ask, price)
+        self._changes: Dict[Tuple[bool, int], float] = {}
+
+        # The pending payloads of user data streams
+        self._reports: List[dict] = []
+
+    # Market data
+    # -----------------------------------------------
+
+    def _random_quantity(self) -> float:
+        return round(self._rand.uniform(0.001, 10), 3)
+
+    def _format_price(self, price: int) -> str:
+        return format_number(price * self.tick_size)
+
+    def _to_ticks(self, price) -> int:
+        return round(float(price) / self.tick_size)
+
+    def _levels(self, is_ask: bool) -> Dict[int, float]:
+        return self._asks if is_ask else self._bids
+
+    def best(self, is_ask: bool) -> Optional[int]:
+        """Gets the best price ticks of a side
+        """
+
+        levels = self._levels(is_ask)
+
+        if not levels:
+            return None
+
+        return min(levels) if is_ask else max(levels)
+
+    def _set_level(self, is_ask: bool, price: int, quantity: float) -> None:
+        levels = self._levels(is_ask)
+
+        if quantity > 0:
+            levels[price] = quantity
+        else:
+            levels.pop(price, None)
+            quantity = 0.
+
+        self._changes[(is_ask, price)] = quantity
+
+    def _refill(self, is_ask: bool) -> None:
+        # Keeps the depth of the orderbook
+        levels = self._levels(is_ask)
+        other = self.best(not is_ask)
+
+        while len(levels) < self._depth:
+            if levels:
+                worst = max(levels) + 1 if is_ask else min(levels) - 1
+            else:
+                worst = other + 1 if is_ask else other - 1
+
+            self._set_level(is_ask, worst, self._random_quantity())
+
+    def snapshot(self, limit: int = DEFAULT_DEPTH_LIMIT) -> dict:
+        """Gets the depth snapshot in the format of `GET /api/v3/depth`
+        """
+
+        return {
+            'lastUpdateId': self.update_id,
+            'asks': [
+                [self._format_price(p), format_number(self._asks[p])]
+                for p in sorted(self._asks)[:limit]
+            ],
+            'bids': [
+                [self._format_price(p), format_number(self._bids[p])]
+                for p in sorted(self._bids, reverse=True)[:limit]
+            ]
+        }
+
+    def step(
+        self,
+        event_time: Optional[int] = None,
+        trade_probability: float = 0.3
+    ) -> Tuple[dict, List[dict]]:
+        """Moves the market a step forward with random changes of levels around the best prices and probably a market trade
+
+        Returns:
+            Tuple[dict, List[dict]]: the `depthUpdate` payload, and the `trade` payloads
+        """
+
+        if event_time is None:
+            event_time = now_ms()
+
+        rand = self._rand
+
+        for _ in range(rand.randint(1, 4)):
+            is_ask = rand.random() < 0.5
+            best = self.best(is_ask)
+            offset = int(rand.expovariate(0.3))
+            price = best + offset if is_ask else best - offset
+
+            quantity = 0. if rand.random() < 0.2 \
+                else self._random_quantity()
+
+            if self._has_open_orders(is_ask, price):
+                # Levels of resting orders are not removed
+                quantity = max(quantity, self._levels(is_ask).get(price, 0))
+
+            self._set_level(is_ask, price, quantity)
+
+        trade_start = self._trade_id
+
+        if rand.random() < trade_probability:
+            is_buyer_maker = rand.random() < 0.5
+
+            self._take(
+                # The taker sells to the bids if the buyer is the maker
+                not is_buyer_maker,
+                self._random_quantity() / 4,
+                None,
+                event_time
+            )
+
+        self._refill(True)
+        self._refill(False)
+
+        new_trades = self._trade_id - trade_start
+        trades = [
+            self.trade_payload(trade, event_time)
+            for trade in list(self.trades)[-new_trades:]
+        ] if new_trades else []
+
+        return self.depth_update(event_time), trades
+
+    def depth_update(self, event_time: Optional[int] = None) -> dict:
+        """Collects the changed levels since the last depth update into a `depthUpdate` payload
+        """
+
+        changes = self._changes
+        self._changes = {}
+
+        first = self.update_id + 1
+        self.update_id += max(len(changes), 1)
+
+        asks = []
+        bids = []
+
+        for (is_ask, price), quantity in changes.items():
+            (asks if is_ask else bids).append(
+                [self._format_price(price), format_number(quantity)]
+            )
+
+        return {
+            'e': 'depthUpdate',
+            'E': now_ms() if event_time is None else event_time,
+            's': self.symbol,
+            'U': first,
+            'u': self.update_id,
+            'b': bids,
+            'a': asks
+        }
+
+    def trade_payload(self, trade: dict, event_time: int) -> dict:
+        return {
+            'e': 'trade',
+            'E': event_time,
+            's': self.symbol,
+            't': trade['id'],
+            'p': self._format_price(trade['price']),
+            'q': format_number(trade['qty']),
+            'b': 0,
+            'a': 0,
+            'T': trade['time'],
+            'm': trade['isBuyerMaker'],
+            'M': True
+        }
+
+    def agg_trade_payload(self, trade: dict, event_time: int) -> dict:
+        return {
+            'e': 'aggTrade',
+            'E': event_time,
+            's': self.symbol,
+            'a': trade['id'],
+            'p': self._format_price(trade['price']),
+            'q': format_number(trade['qty']),
+            'f': trade['id'],
+            'l': trade['id'],
+            'T': trade['time'],
+            'm': trade['isBuyerMaker'],
+            'M': True
+        }
+
+    def recent_trades(self, limit: int = 500) -> List[dict]:
+        """Gets the recent trades in the format of `GET /api/v3/trades`
+        """
+
+        return [
+            {
+                'id': trade['id'],
+                'price': self._format_price(trade['price']),
+                'qty': format_number(trade['qty']),
+                'quoteQty': format_number(
+                    trade['price'] * self.tick_size * trade['qty']
+                ),
+                'time': trade['time'],
+                'isBuyerMaker': trade['isBuyerMaker'],
+                'isBestMatch': True
+            }
+            for trade in list(self.trades)[-limit:]
+        ]
+
+    def aggregate_trades(self, limit: int = 500) -> List[dict]:
+        """Gets the recent trades in the format of `GET /api/v3/aggTrades`, each of which is an aggregate trade
+        """
+
+        return [
+            {
+                'a': trade['id'],
+                'p': self._format_price(trade['price']),
+                'q': format_number(trade['qty']),
+                'f': trade['id'],
+                'l': trade['id'],
+                'T': trade['time'],
+                'm': trade['isBuyerMaker'],
+                'M': True
+            }
+            for trade in list(self.trades)[-limit:]
+        ]
+
+    def _kline_rows(
+        self,
+        interval_ms: int,
+        end_time: Optional[int] = None
+    ) -> Dict[int, list]:
+        # open_time -> [open, high, low, close, volume, quote, count, first, last]
+        rows: Dict[int, list] = {}
+
+        for trade in self.trades:
+            if end_time is not None and trade['time'] > end_time:
+                break
+
+            open_time = trade['time'] // interval_ms * interval_ms
+            price = trade['price']
+            qty = trade['qty']
+            row = rows.get(open_time)
+
+            if row is None:
+                rows[open_time] = [
+                    price, price, price, price, qty,
+                    price * self.tick_size * qty, 1, trade['id'], trade['id']
+                ]
+                continue
+
+            row[1] = max(row[1], price)
+            row[2] = min(row[2], price)
+            row[3] = price
+            row[4] += qty
+            row[5] += price * self.tick_size * qty
+            row[6] += 1
+            row[8] = trade['id']
+
+        return rows
+
+    def klines(
+        self,
+        interval_ms: int,
+        limit: int = 500,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None
+    ) -> List[list]:
+        """Aggregates recorded trades into klines in the format of `GET /api/v3/klines`. Intervals without trades are omitted
+        """
+
+        rows = self._kline_rows(interval_ms, end_time)
+
+        return [
+            [
+                open_time,
+                self._format_price(row[0]),
+                self._format_price(row[1]),
+                self._format_price(row[2]),
+                self._format_price(row[3]),
+                format_number(row[4]),
+                open_time + interval_ms - 1,
+                format_number(row[5]),
+                row[6],
+                '0',
+                '0',
+                '0'
+            ]
+            for open_time, row in rows.items()
+            if start_time is None or open_time >= start_time
+        ][:limit]
+
+    def kline_payload(
+        self,
+        interval: str,
+        interval_ms: int,
+        event_time: int
+    ) -> Optional[dict]:
+        """Gets the `kline` payload of the current interval, or `None` if there is no trade in the interval
+        """
+
+        open_time = event_time // interval_ms * interval_ms
+        row = self._kline_rows(interval_ms).get(open_time)
+
+        if row is None:
+            return None
+
+        return {
+            'e': 'kline',
+            'E': event_time,
+            's': self.symbol,
+            'k': {
+                't': open_time,
+                'T': open_time + interval_ms - 1,
+                's': self.symbol,
+                'i': interval,
+                'f': row[7],
+                'L': row[8],
+                'o': self._format_price(row[0]),
+                'c': self._format_price(row[3]),
+                'h': self._format_price(row[1]),
+                'l': self._format_price(row[2]),
+                'v': format_number(row[4]),
+                'n': row[6],
+                'x': False,
+                'q': format_number(row[5]),
+                'V': '0',
+                'Q': '0',
+                'B': '0'
+            }
+        }
+
+    def ticker(self, event_time: Optional[int] = None) -> dict:
+        """Gets the statistics of recorded trades in the format of `GET /api/v3/ticker/24hr`
+        """
+
+        if event_time is None:
+            event_time = now_ms()
+
+        trades = list(self.trades)
+        last = self.best(True)
+
+        if trades:
+            first, last = trades[0]['price'], trades[-1]['price']
+            high = max(t['price'] for t in trades)
+            low = min(t['price'] for t in trades)
+            volume = sum(t['qty'] for t in trades)
+        else:
+            first = high = low = last
+            volume = 0.
+
+        bid = self.best(False)
+        ask = self.best(True)
+
+        return {
+            'symbol': self.symbol,
+            'priceChange': self._format_price(last - first),
+            'priceChangePercent': format_number(
+                (last - first) / first * 100
+            ),
+            'weightedAvgPrice': self._format_price(last),
+            'prevClosePrice': self._format_price(first),
+            'lastPrice': self._format_price(last),
+            'lastQty': format_number(trades[-1]['qty'] if trades else 0),
+            'bidPrice': self._format_price(bid),
+            'bidQty': format_number(self._bids[bid]),
+            'askPrice': self._format_price(ask),
+            'askQty': format_number(self._asks[ask]),
+            'openPrice': self._format_price(first),
+            'highPrice': self._format_price(high),
+            'lowPrice': self._format_price(low),
+            'volume': format_number(volume),
+            'quoteVolume': format_number(volume * last * self.tick_size),
+            'openTime': event_time - 24 * 60 * 60 * 1000,
+            'closeTime': event_time,
+            'firstId': trades[0]['id'] if trades else -1,
+            'lastId': trades[-1]['id'] if trades else -1,
+            'count': len(trades)
+        }
+
+    def ticker_payload(self, event_time: int, mini: bool = False) -> dict:
+        """Gets the `24hrTicker` or `24hrMiniTicker` payload
+        """
+
+        ticker = self.ticker(event_time)
+
+        if mini:
+            return {
+                'e': '24hrMiniTicker',
+                'E': event_time,
+                's': self.symbol,
+                'c': ticker['lastPrice'],
+                'o': ticker['openPrice'],
+                'h': ticker['highPrice'],
+                'l': ticker['lowPrice'],
+                'v': ticker['volume'],
+                'q': ticker['quoteVolume']
+            }
+
+        return {
+            'e': '24hrTicker',
+            'E': event_time,
+            's': self.symbol,
+            'p': ticker['priceChange'],
+            'P': ticker['priceChangePercent'],
+            'w': ticker['weightedAvgPrice'],
+            'x': ticker['prevClosePrice'],
+            'c': ticker['lastPrice'],
+            'Q': ticker['lastQty'],
+            'b': ticker['bidPrice'],
+            'B': ticker['bidQty'],
+            'a': ticker['askPrice'],
+            'A': ticker['askQty'],
+            'o': ticker['openPrice'],
+            'h': ticker['highPrice'],
+            'l': ticker['lowPrice'],
+            'v': ticker['volume'],
+            'q': ticker['quoteVolume'],
+            'O': ticker['openTime'],
+            'C': ticker['closeTime'],
+            'F': ticker['firstId'],
+            'L': ticker['lastId'],
+            'n': ticker['count']
+        }
+
+    # Matching
+    # -----------------------------------------------
+
+    def _has_open_orders(self, is_ask: bool, price: int) -> bool:
+        side = OrderSide.SELL.value if is_ask else OrderSide.BUY.value
+
+        return any(
+            order['_price'] == price and order['side'] == side
+            for order in self._open_orders()
+        )
+
+    def _open_orders(self) -> List[dict]:
+        return [
+            order for order in self._orders.values()
+            if order['status'] not in FINAL_STATUSES
+        ]
+
+    def _record_trade(
+        self,
+        price: int,
+        quantity: float,
+        is_buyer_maker: bool,
+        trade_time: int
+    ) -> dict:
+        self._trade_id += 1
+
+        trade = {
+            'id': self._trade_id,
+            'price': price,
+            'qty': quantity,
+            'time': trade_time,
+            'isBuyerMaker': is_buyer_maker
+        }
+
+        self.trades.append(trade)
+        return trade
+
+    def _take(
+        self,
+        is_buy: bool,
+        quantity: float,
+        limit: Optional[int],
+        trade_time: int
+    ) -> List[dict]:
+        """Consumes the levels of the opposite side from the best price
+
+        Returns:
+            List[dict]: the trades
+        """
+
+        levels = self._levels(is_buy)
+        trades = []
+
+        while quantity > 1e-12 and levels:
+            price = self.best(is_buy)
+
+            if limit is not None and (
+                price > limit if is_buy else price < limit
+            ):
+                break
+
+            filled = min(quantity, levels[price])
+            quantity -= filled
+
+            self._set_level(
+                is_buy,
+                price,
+                round(levels[price] - filled, 8)
+            )
+
+            trades.append(
+                self._record_trade(price, filled, not is_buy, trade_time)
+            )
+
+            self._fill_resting(is_buy, price, filled, trade_time)
+
+        return trades
+
+    def _fill_resting(
+        self,
+        is_ask: bool,
+        price: int,
+        quantity: float,
+        trade_time: int
+    ) -> None:
+        # Resting orders at the level are filled first in time priority
+        side = OrderSide.SELL.value if is_ask else OrderSide.BUY.value
+
+        for order in self._open_orders():
+            if quantity <= 1e-12:
+                return
+
+            if order['_price'] != price or order['side'] != side:
+                continue
+
+            filled = min(quantity, order['_remaining'])
+            quantity -= filled
+
+            self._fill(order, price, filled, trade_time, False)
+
+    def _fill(
+        self,
+        order: dict,
+        price: int,
+        quantity: float,
+        trade_time: int,
+        is_taker: bool
+    ) -> None:
+        order['_remaining'] = round(order['_remaining'] - quantity, 8)
+        executed = float(order['origQty']) - order['_remaining']
+        quote = float(order['cummulativeQuoteQty']) + \
+            price * self.tick_size * quantity
+
+        order['executedQty'] = format_number(executed)
+        order['cummulativeQuoteQty'] = format_number(quote)
+        order['status'] = STATUS_FILLED if order['_remaining'] <= 1e-12 \
+            else STATUS_PARTIALLY_FILLED
+        order['updateTime'] = trade_time
+
+        order['fills'].append({
+            'price': self._format_price(price),
+            'qty': format_number(quantity),
+            'commission': '0.00000000',
+            'commissionAsset': 'BNB',
+            'tradeId': self._trade_id
+        })
+
+        self._report(order, 'TRADE', trade_time, price, quantity, is_taker)
+
+    def _report(
+        self,
+        order: dict,
+        execution_type: str,
+        event_time: int,
+        price: int = 0,
+        quantity: float = 0.,
+        is_taker: bool = False
+    ) -> None:
+        self._reports.append({
+            'e': 'executionReport',
+            'E': event_time,
+            's': self.symbol,
+            'c': order['clientOrderId'],
+            'S': order['side'],
+            'o': order['type'],
+            'f': order['timeInForce'],
+            'q': order['origQty'],
+            'p': order['price'],
+            'P': '0.00000000',
+            'F': '0.00000000',
+            'g': -1,
+            'C': '',
+            'x': execution_type,
+            'X': order['status'],
+            'r': 'NONE',
+            'i': order['orderId'],
+            'l': format_number(quantity),
+            'z': order['executedQty'],
+            'L': self._format_price(price),
+            'n': '0',
+            'N': None,
+            'T': event_time,
+            't': self._trade_id if execution_type == 'TRADE' else -1,
+            'I': 0,
+            'w': order['status'] in (STATUS_NEW, STATUS_PARTIALLY_FILLED),
+            'm': not is_taker,
+            'M': False,
+            'O': order['time'],
+            'Z': order['cummulativeQuoteQty'],
+            'Y': format_number(price * self.tick_size * quantity),
+            'Q': '0.00000000'
+        })
+
+    def drain_reports(self) -> List[dict]:
+        """Gets and clears the pending `executionReport` payloads of user data streams
+        """
+
+        reports = self._reports
+        self._reports = []
+        return reports
+
+    def _fillable(
+        self,
+        is_buy: bool,
+        limit: Optional[int]
+    ) -> float:
+        levels = self._levels(is_buy)
+
+        return sum(
+            quantity for price, quantity in levels.items()
+            if limit is None or (price <= limit if is_buy else price >= limit)
+        )
+
+    def place_order(
+        self,
+        side: str,
+        type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        time_in_force: str = TimeInForce.GTC.value,
+        client_order_id: Optional[str] = None,
+        test: bool = False,
+        transact_time: Optional[int] = None
+    ) -> dict:
+        """Places an order, which is matched against the orderbook immediately, and the remaining quantity of a GTC limit order rests in the orderbook
+
+        Returns:
+            dict: the order in the format of the `FULL` response of `POST /api/v3/order`
+
+        Raises:
+            MockOrderRejectedException: if the order is invalid or rejected
+        """
+
+        if transact_time is None:
+            transact_time = now_ms()
+
+        try:
+            side = OrderSide(side).value
+            type = OrderType(type).value
+            time_in_force = TimeInForce(time_in_force).value
+        except ValueError as e:
+            raise MockOrderRejectedException(ERROR_INVALID_PARAM, str(e))
+
+        if type not in (
+            OrderType.LIMIT.value,
+            OrderType.MARKET.value,
+            OrderType.LIMIT_MAKER.value
+        ):
+            raise MockOrderRejectedException(
+                ERROR_INVALID_PARAM,
+                f'Unsupported order type {type}.'
+            )
+
+        quantity = float(quantity)
+        is_buy = side == OrderSide.BUY.value
+        is_market = type == OrderType.MARKET.value
+
+        if quantity <= 0:
+            raise MockOrderRejectedException(
+                ERROR_INVALID_PARAM,
+                'Invalid quantity.'
+            )
+
+        if is_market:
+            limit = None
+        elif price is None:
+            raise MockOrderRejectedException(
+                ERROR_INVALID_PARAM,
+                'Mandatory parameter \'price\' was not sent.'
+            )
+        else:
+            limit = self._to_ticks(price)
+
+        best = self.best(is_buy)
+        crosses = best is not None and (
+            is_market or (best <= limit if is_buy else best >= limit)
+        )
+
+        if type == OrderType.LIMIT_MAKER.value and crosses:
+            raise MockOrderRejectedException(
+                ERROR_ORDER_REJECTED,
+                'Order would immediately match and take.'
+            )
+
+        if time_in_force == TimeInForce.FOK.value and \
+                self._fillable(is_buy, limit) < quantity:
+            expired = True
+        else:
+            expired = False
+
+        if test:
+            return {}
+
+        self._order_id += 1
+
+        order = {
+            'symbol': self.symbol,
+            'orderId': self._order_id,
+            'orderListId': -1,
+            'clientOrderId': client_order_id or f'mock{self._order_id}',
+            'transactTime': transact_time,
+            'price': format_number(0 if limit is None else float(price)),
+            'origQty': format_number(quantity),
+            'executedQty': format_number(0),
+            'cummulativeQuoteQty': format_number(0),
+            'status': STATUS_NEW,
+            'timeInForce': time_in_force,
+            'type': type,
+            'side': side,
+            'time': transact_time,
+            'updateTime': transact_time,
+            'fills': [],
+            '_price': limit,
+            '_remaining': quantity
+        }
+
+        self._orders[order['orderId']] = order
+        self._report(order, 'NEW', transact_time)
+
+        if expired:
+            order['status'] = STATUS_EXPIRED
+            self._report(order, 'EXPIRED', transact_time)
+            return order
+
+        for trade in self._take(is_buy, quantity, limit, transact_time):
+            self._fill(
+                order,
+                trade['price'],
+                trade['qty'],
+                transact_time,
+                True
+            )
+
+        if order['status'] not in FINAL_STATUSES:
+            if is_market or time_in_force != TimeInForce.GTC.value:
+                order['status'] = STATUS_EXPIRED
+                self._report(order, 'EXPIRED', transact_time)
+            else:
+                # Rests in the orderbook
+                levels = self._levels(not is_buy)
+                self._set_level(
+                    not is_buy,
+                    limit,
+                    round(levels.get(limit, 0) + order['_remaining'], 8)
+                )
+
+        self._refill(is_buy)
+
+        return order
+
+    def _find_order(
+        self,
+        order_id: Optional[int] = None,
+        client_order_id: Optional[str] = None
+    ) -> dict:
+        if order_id is not None:
+            order = self._orders.get(int(order_id))
+        else:
+            order = next((
+                order for order in self._orders.values()
+                if order['clientOrderId'] == client_order_id
+            ), None)
+
+        if order is None:
+            raise MockOrderRejectedException(
+                ERROR_ORDER_NOT_FOUND,
+                'Order does not exist.'
+            )
+
+        return order
+
+    def get_order(
+        self,
+        order_id: Optional[int] = None,
+        client_order_id: Optional[str] = None
+    ) -> dict:
+        return self._find_order(order_id, client_order_id)
+
+    def cancel_order(
+        self,
+        order_id: Optional[int] = None,
+        client_order_id: Optional[str] = None,
+        event_time: Optional[int] = None
+    ) -> dict:
+        """Cancels an open order and removes its remaining quantity from the orderbook
+
+        Raises:
+            MockOrderRejectedException: if the order does not exist or is not open
+        """
+
+        order = self._find_order(order_id, client_order_id)
+
+        if order['status'] in FINAL_STATUSES:
+            raise MockOrderRejectedException(
+                ERROR_ORDER_NOT_FOUND,
+                'Unknown order sent.'
+            )
+
+        is_ask = order['side'] == OrderSide.SELL.value
+        price = order['_price']
+        levels = self._levels(is_ask)
+
+        self._set_level(
+            is_ask,
+            price,
+            round(levels.get(price, 0) - order['_remaining'], 8)
+        )
+
+        order['status'] = STATUS_CANCELED
+        self._report(
+            order,
+            'CANCELED',
+            now_ms() if event_time is None else event_time
+        )
+
+        self._refill(is_ask)
+
+        return order
+
+    def open_orders(self) -> List[dict]:
+        return self._open_orders()
+
+    def all_orders(self) -> List[dict]:
+        return list(self._orders.values())
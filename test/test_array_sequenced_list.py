@@ -0,0 +1,130 @@
+import random
+from array import array
+
+import pytest
+
+from binance import (
+    OrderBook,
+    ArraySequencedList,
+    SequencedList
+)
+from binance.common.array_sequenced_list import (
+    _merge,
+    _array_merge
+)
+
+
+@pytest.fixture
+def items():
+    return ArraySequencedList([
+        (x, random.randint(1, 100)) for x in range(0, 10)
+    ])
+
+
+def test_add(items):
+    assert items.add((-1, 10)) == (0, False)
+    assert items[0] == (-1, 10)
+
+    assert items.add((0, 2)) == (1, True)
+    assert items[1] == (0, 2)
+
+    assert items.add((100, 100)) == (11, False)
+    assert items[11] == (100, 100)
+    assert len(items) == 12
+
+
+def test_zero_quantity(items):
+    assert items.add((1, 0)) == (1, True)
+
+    assert items[1][0] == 2
+    assert len(items) == 9
+
+    origin_quantity = items[0][1]
+
+    assert items.add((-1, 0)) == (0, False)
+    assert items[0][1] == origin_quantity
+    assert len(items) == 9
+
+
+def test_merge_strings():
+    items = ArraySequencedList()
+    items.merge([['100.5', '1.0'], ['99.5', '2'], ['101', '3']])
+
+    assert items == [[99.5, 2], [100.5, 1], [101, 3]]
+    assert items[1:] == [(100.5, 1), (101, 3)]
+
+    items.merge([['100.5', '0'], ['101', '4'], ['102', '0'], ['98', '5']])
+
+    assert items == [[98, 5], [99.5, 2], [101, 4]]
+    assert list(items.prices) == [98, 99.5, 101]
+    assert list(items.quantities) == [5, 2, 4]
+
+
+def test_views(items):
+    prices = items.prices
+    origin = list(prices)
+
+    with pytest.raises((ValueError, TypeError)):
+        prices[0] = 1
+
+    # The list could still be changed when views are alive
+    items.add((-1, 1))
+    items.add((3, 0))
+
+    assert list(prices) == origin
+    assert list(items.prices)[:4] == [-1, 0, 1, 2]
+    assert len(items.quantities) == 10
+
+
+@pytest.mark.parametrize('batch', [False, True])
+def test_merge_levels_or_batch(batch):
+    size = 100 if batch else 10
+
+    expected = SequencedList()
+    items = ArraySequencedList()
+
+    for _ in range(20):
+        levels = create_levels(size)
+
+        expected.merge(levels)
+        items.merge(levels)
+
+        assert items == expected
+
+
+def create_levels(count):
+    return [
+        (random.randint(0, 100), random.choice([0, 0, 1, 2, 3]))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize('merge', [_merge, _array_merge])
+def test_merge_same_as_sequenced_list(merge):
+    expected = SequencedList()
+
+    prices = array('d')
+    quantities = array('d')
+
+    for _ in range(50):
+        levels = create_levels(20)
+
+        expected.merge(levels)
+        prices, quantities = merge(prices, quantities, levels)
+
+        assert list(zip(prices, quantities)) == [
+            (float(p), float(q)) for p, q in expected
+        ]
+
+
+@pytest.mark.asyncio
+async def test_order_book_sequenced_list():
+    class ArrayOrderBook(OrderBook):
+        SEQUENCED_LIST = ArraySequencedList
+
+    orderbook = ArrayOrderBook('BTCUSDT')
+    orderbook._merge(1, [['10', '1']], [['9', '2'], ['8', '1']])
+
+    assert isinstance(orderbook.asks, ArraySequencedList)
+    assert orderbook.asks == [(10, 1)]
+    assert orderbook.bids == [(8, 1), (9, 2)]
@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+from aioresponses import aioresponses
+from yarl import URL as URL_TYPE
+
+from binance import (
+    Client,
+    ResponseCache
+)
+from binance.client.single_flight import SingleFlight
+
+EXCHANGE_INFO_URL = 'https://api.binance.com/api/v3/exchangeInfo'
+TICKER_URL = 'https://api.binance.com/api/v3/ticker/price'
+
+PRICE_FILTER = {
+    'filterType': 'PRICE_FILTER',
+    'minPrice': '0.01000000',
+    'maxPrice': '1000000.00000000',
+    'tickSize': '0.01000000'
+}
+
+LOT_SIZE = {
+    'filterType': 'LOT_SIZE',
+    'minQty': '0.00000100',
+    'maxQty': '9000.00000000',
+    'stepSize': '0.00000100'
+}
+
+EXCHANGE_INFO = {
+    'rateLimits': [],
+    'symbols': [
+        {
+            'symbol': 'BTCUSDT',
+            'filters': [PRICE_FILTER, LOT_SIZE]
+        }
+    ]
+}
+
+
+def count(m, url):
+    return len(m.requests.get(('GET', URL_TYPE(url)), []))
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesces_requests():
+    client = Client(response_cache=ResponseCache())
+
+    with aioresponses() as m:
+        m.get(EXCHANGE_INFO_URL, payload=EXCHANGE_INFO, repeat=True)
+
+        results = await asyncio.gather(*[
+            client.get_exchange_info() for _ in range(5)
+        ])
+
+        assert count(m, EXCHANGE_INFO_URL) == 1
+        assert all(result == EXCHANGE_INFO for result in results)
+
+        # Served from the cache
+        await client.get_exchange_info()
+        assert count(m, EXCHANGE_INFO_URL) == 1
+
+        client.response_cache.invalidate('get_exchange_info')
+
+        await client.get_exchange_info()
+        assert count(m, EXCHANGE_INFO_URL) == 2
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl():
+    client = Client(response_cache=ResponseCache({
+        'get_exchange_info': 0.1,
+        'get_ticker_price': 60
+    }))
+
+    with aioresponses() as m:
+        m.get(EXCHANGE_INFO_URL, payload=EXCHANGE_INFO, repeat=True)
+        m.get(TICKER_URL + '?symbol=BTCUSDT', payload={}, repeat=True)
+        m.get(TICKER_URL + '?symbol=ETHUSDT', payload={}, repeat=True)
+
+        await client.get_exchange_info()
+        await asyncio.sleep(0.15)
+        await client.get_exchange_info()
+
+        assert count(m, EXCHANGE_INFO_URL) == 2
+
+        # Endpoints without default ttls could also be cached
+        await client.get_ticker_price(symbol='BTCUSDT')
+        await client.get_ticker_price(symbol='BTCUSDT')
+        await client.get_ticker_price(symbol='ETHUSDT')
+
+        assert count(m, TICKER_URL + '?symbol=BTCUSDT') == 1
+        assert count(m, TICKER_URL + '?symbol=ETHUSDT') == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_failure_not_cached():
+    client = Client(response_cache=ResponseCache())
+
+    with aioresponses() as m:
+        m.get(EXCHANGE_INFO_URL, status=500)
+        m.get(EXCHANGE_INFO_URL, payload=EXCHANGE_INFO)
+
+        with pytest.raises(Exception, match='500'):
+            await client.get_exchange_info()
+
+        assert await client.get_exchange_info() == EXCHANGE_INFO
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_symbol_filters():
+    client = Client(response_cache=ResponseCache())
+
+    assert client.symbol_filters == {}
+
+    with aioresponses() as m:
+        m.get(EXCHANGE_INFO_URL, payload=EXCHANGE_INFO, repeat=True)
+
+        filters = await client.get_symbol_filters('BTCUSDT')
+
+        assert filters['PRICE_FILTER'] == PRICE_FILTER
+        assert filters['LOT_SIZE'] == LOT_SIZE
+        assert client.symbol_filters['BTCUSDT'] is filters
+
+        assert await client.get_symbol_filters('FOOBAR') is None
+        assert count(m, EXCHANGE_INFO_URL) == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_leader():
+    flights = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    leader = asyncio.ensure_future(flights.do('key', call))
+    await asyncio.sleep(0)
+
+    follower = asyncio.ensure_future(flights.do('key', call))
+    await asyncio.sleep(0)
+
+    assert len(flights) == 1
+
+    leader.cancel()
+
+    # The follower takes over the call
+    assert await follower == 2
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_symbol_filters_without_cache():
+    client = Client()
+
+    with aioresponses() as m:
+        m.get(EXCHANGE_INFO_URL, payload=EXCHANGE_INFO, repeat=True)
+
+        filters = await client.get_symbol_filters('BTCUSDT')
+        assert await client.get_symbol_filters('BTCUSDT') is filters
+        assert count(m, EXCHANGE_INFO_URL) == 1
+
+        # Unknown symbols are requested again
+        assert await client.get_symbol_filters('FOOBAR') is None
+        assert count(m, EXCHANGE_INFO_URL) == 2
+
+    await client.close()
@@ -1,9 +1,19 @@
+import asyncio
+import re
+
 import pytest
-from aioresponses import aioresponses
+from aioresponses import (
+    aioresponses,
+    CallbackResult
+)
+from yarl import URL as URL_TYPE
 
 from binance import (
     Client,
-    StatusException
+    SecurityType,
+    RequestMethod,
+    StatusException,
+    APISecretNotDefinedException
 )
 
 # TODO:
@@ -91,3 +101,164 @@ async def test_force_params():
         )
 
         assert res == payload
+
+
+@pytest.mark.asyncio
+async def test_session_reused():
+    payload = {
+        'foo': 'bar'
+    }
+
+    client = Client('api_key', pool_size=10)
+
+    with aioresponses() as m:
+        m.get(URL, payload=payload, status=200, repeat=True)
+
+        assert await client.get(URL) == payload
+
+        session = client._session
+        assert session is not None
+        assert session.connector.limit == 10
+
+        assert await client.get(URL) == payload
+        # The same session should be used for every request
+        assert client._session is session
+
+        await client.close()
+
+        assert session.closed
+        assert client._session is None
+
+        # A new session is created on demand after closed
+        assert await client.get(URL) == payload
+        assert client._session is not session
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_api_key_header():
+    client = Client('api_key')
+
+    with aioresponses() as m:
+        m.get(URL, payload={}, status=200)
+
+        await client.get(URL, security_type=SecurityType.MARKET_DATA)
+
+        request = list(m.requests.values())[0][0]
+        assert request.kwargs['headers']['X-MBX-APIKEY'] == 'api_key'
+
+        # The api key is not baked into the session
+        assert 'X-MBX-APIKEY' not in client._session.headers
+
+    await client.close()
+
+
+def test_signed_request_kwargs():
+    client = Client('api_key', 'api_secret')
+
+    url, kwargs = client._get_request_kwargs(
+        RequestMethod.GET, URL, 'api_key', True,
+        symbol='BTCUSDT',
+        side='BUY'
+    )
+
+    query = url.raw_query_string
+    assert str(url).startswith(URL + '?side=BUY&symbol=BTCUSDT&timestamp=')
+    assert 'data' not in kwargs
+
+    payload, signature = query.split('&signature=')
+    assert signature == client._signer.sign(payload.encode())
+
+    url, kwargs = client._get_request_kwargs(
+        RequestMethod.POST, URL, 'api_key', True,
+        symbol='BTCUSDT',
+        price=1.5
+    )
+
+    body = kwargs['data']
+
+    assert url == URL
+    assert body.startswith('price=1.5&symbol=BTCUSDT&timestamp=')
+    assert kwargs['headers']['Content-Type'] == \
+        'application/x-www-form-urlencoded'
+    assert kwargs['headers']['X-MBX-APIKEY'] == 'api_key'
+
+    payload, signature = body.split('&signature=')
+    assert signature == client._signer.sign(payload.encode())
+
+
+@pytest.mark.asyncio
+async def test_signed_request():
+    client = Client('api_key', 'api_secret')
+
+    with aioresponses() as m:
+        m.get(re.compile(re.escape(URL) + r'\?.+'), payload={}, status=200)
+
+        await client.get(
+            URL,
+            security_type=SecurityType.USER_DATA,
+            symbol='BTCUSDT'
+        )
+
+        [((_, url), _)] = m.requests.items()
+        assert url.query['symbol'] == 'BTCUSDT'
+        assert 'signature' in url.query
+
+    client._signer = None
+
+    with pytest.raises(APISecretNotDefinedException):
+        await client.get(URL, security_type=SecurityType.USER_DATA)
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_requests():
+    client = Client('api_key', 'api_secret')
+
+    with aioresponses() as m:
+        async def slow_response(url, **kwargs):
+            await asyncio.sleep(0.01)
+            return CallbackResult(payload={'foo': 'bar'})
+
+        m.get(URL + '?a=1&b=2', callback=slow_response, repeat=True)
+        m.get(re.compile(re.escape(URL) + r'\?.+timestamp.+'), payload={},
+              repeat=True)
+
+        results = await asyncio.gather(
+            client.get(URL, a=1, b=2),
+            # The order of params does not matter
+            client.get(URL, b=2, a=1),
+            client.get(URL, a=1, b=2)
+        )
+
+        assert results == [{'foo': 'bar'}] * 3
+        assert results[0] is results[1]
+        assert len(m.requests[('GET', URL_TYPE(URL + '?a=1&b=2'))]) == 1
+
+        # Not coalesced after completed
+        await client.get(URL, a=1, b=2)
+        assert len(m.requests[('GET', URL_TYPE(URL + '?a=1&b=2'))]) == 2
+
+        # Signed requests are never coalesced
+        await asyncio.gather(*[
+            client.get(URL, security_type=SecurityType.USER_DATA)
+            for _ in range(2)
+        ])
+        assert sum(
+            len(requests) for (_, url), requests in m.requests.items()
+            if 'timestamp' in url.query
+        ) == 2
+
+    await client.close()
+
+    client = Client(coalesce_requests=False)
+
+    with aioresponses() as m:
+        m.get(URL, payload={}, repeat=True)
+
+        await asyncio.gather(client.get(URL), client.get(URL))
+        assert len(m.requests[('GET', URL_TYPE(URL))]) == 2
+
+    await client.close()
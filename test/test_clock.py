@@ -0,0 +1,123 @@
+import asyncio
+import re
+import time
+
+import pytest
+from aioresponses import (
+    aioresponses,
+    CallbackResult
+)
+from yarl import URL as URL_TYPE
+
+from binance import (
+    Client,
+    SecurityType
+)
+from binance.client.clock import Clock
+
+TIME_URL = 'https://api.binance.com/api/v3/time'
+URL = 'https://api.binance.com/api/v3/account'
+
+
+def test_clock_min_round_trip():
+    clock = Clock(samples=3)
+
+    assert not clock.synced
+    assert clock.offset == 0
+    assert clock.uncertainty is None
+
+    clock.add_sample(1000, 1600, 1200)
+    assert clock.offset == 500
+    assert clock.uncertainty == 100
+
+    # The sample with a shorter round trip is more accurate
+    clock.add_sample(2000, 2530, 2040)
+    assert clock.offset == 510
+    assert clock.uncertainty == 20
+
+    # A slower sample is ignored
+    clock.add_sample(3000, 3900, 3400)
+    assert clock.offset == 510
+
+    # The oldest samples are discarded
+    clock.add_sample(4000, 4600, 4200)
+    clock.add_sample(5000, 5600, 5200)
+    assert clock.offset == 500
+    assert clock.uncertainty == 100
+
+
+@pytest.mark.asyncio
+async def test_clock_sync():
+    client = Client('api_key', 'api_secret', clock_sync_interval=60)
+
+    # The server clock is 10 seconds ahead
+    offset = 10000
+
+    def server_time(url, **kwargs):
+        return CallbackResult(
+            payload={'serverTime': int(time.time() * 1000) + offset}
+        )
+
+    with aioresponses() as m:
+        m.get(TIME_URL, callback=server_time, repeat=True)
+        m.get(re.compile(re.escape(URL) + r'\?.+'), payload={}, repeat=True)
+
+        await client.get(URL, security_type=SecurityType.USER_DATA)
+
+        assert client.clock.synced
+        assert abs(client.clock.offset - offset) < 100
+
+        # Take more samples for the first sync
+        assert len(m.requests[('GET', URL_TYPE(TIME_URL))]) == 3
+
+        [(_, url)] = [
+            key for key in m.requests.keys()
+            if str(key[1]).startswith(URL)
+        ]
+
+        timestamp = int(url.query['timestamp'])
+        assert abs(timestamp - time.time() * 1000 - offset) < 1000
+
+    await client.close()
+    assert client._clock_sync_task is None
+
+
+@pytest.mark.asyncio
+async def test_clock_sync_fails():
+    client = Client('api_key', 'api_secret', clock_sync_interval=60)
+
+    with aioresponses() as m:
+        m.get(TIME_URL, status=500, repeat=True)
+        m.get(re.compile(re.escape(URL) + r'\?.+'), payload={'ok': 1})
+
+        # Signed requests are not blocked
+        assert await client.get(
+            URL, security_type=SecurityType.USER_DATA
+        ) == {'ok': 1}
+
+        assert not client.clock.synced
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_while_waiting_for_clock_sync():
+    client = Client('api_key', 'api_secret', clock_sync_interval=60)
+
+    async def never_synced(samples=1):
+        await asyncio.Event().wait()
+
+    client.sync_clock = never_synced
+
+    request = asyncio.create_task(
+        client.get(URL, security_type=SecurityType.USER_DATA)
+    )
+
+    # The request is waiting for the first sync
+    await asyncio.sleep(0.01)
+    assert not request.done()
+
+    await client.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(request, 1)
@@ -0,0 +1,71 @@
+import pytest
+
+from binance import (
+    Client,
+    Stream,
+    JSONCodec,
+    get_json_codec,
+    UnsupportedJSONCodecException
+)
+from binance.common.codec import (
+    JSON_CODECS,
+    StdJSONCodec,
+    json_stringify
+)
+
+
+MSG = '{"stream":"btcusdt@ticker","data":{"e":"24hrTicker","s":"BTCUSDT","c":"0.0025","E":123456789}}'  # noqa:E501
+
+
+def get_codecs():
+    codecs = []
+
+    for Codec in JSON_CODECS:
+        try:
+            codecs.append(Codec())
+        except ImportError:  # pragma: no cover
+            pass
+
+    return codecs
+
+
+@pytest.mark.parametrize('codec', get_codecs(), ids=lambda c: c.NAME)
+def test_codec(codec):
+    parsed = codec.loads(MSG)
+
+    assert parsed['data']['E'] == 123456789
+    assert codec.loads(MSG.encode()) == parsed
+    assert codec.loads(codec.dumps(parsed)) == parsed
+
+    with pytest.raises(ValueError):
+        codec.loads('{"ok":true')
+
+
+def test_get_json_codec():
+    assert isinstance(get_json_codec(), JSONCodec)
+    assert isinstance(get_json_codec('json'), StdJSONCodec)
+
+    codec = StdJSONCodec()
+    assert get_json_codec(codec) is codec
+
+    with pytest.raises(UnsupportedJSONCodecException, match='not supported'):
+        get_json_codec('unknown')
+
+
+def test_client_json_codec():
+    codec = StdJSONCodec()
+
+    client = Client(json_codec=codec)
+    assert client._json_codec is codec
+
+    stream = Stream('fake url', print, json_codec='json')
+    assert isinstance(stream._json_codec, StdJSONCodec)
+
+
+def test_json_stringify():
+    class Codec(StdJSONCodec):
+        def dumps(self, obj):
+            return 'dumped'
+
+    assert json_stringify({'a': [1, 2]}) == '{"a":[1,2]}'
+    assert json_stringify({'a': 1}, Codec()) == 'dumped'
@@ -0,0 +1,202 @@
+import re
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from aioresponses import aioresponses
+
+from binance import (
+    Client,
+    ColumnarFormat,
+    KlineHandlerBase,
+    TradeHandlerBase,
+    TickerHandlerBase
+)
+from binance.common.columnar import (
+    REST_KLINE_FIELDS,
+    REST_AGG_TRADE_FIELDS,
+    decode_rows
+)
+
+KLINES_URL = re.compile(
+    re.escape('https://api.binance.com/api/v3/klines') + r'\?.+'
+)
+
+KLINE = [
+    1499040000000,
+    '0.01634790',
+    '0.80000000',
+    '0.01575800',
+    '0.01577100',
+    '148976.11427815',
+    1499644799999,
+    '2434.19055334',
+    308,
+    '1756.87402397',
+    '28.46694368',
+    '17928899.62484339'
+]
+
+TRADE = {
+    'e': 'trade',
+    'E': 123456789,
+    's': 'BNBBTC',
+    't': 12345,
+    'p': '0.001',
+    'q': '100',
+    'b': 88,
+    'a': 50,
+    'T': 123456785,
+    'm': True,
+    'M': True
+}
+
+KLINE_MSG = {
+    'e': 'kline',
+    'E': 123456789,
+    's': 'BNBBTC',
+    'k': {
+        't': 123400000,
+        'T': 123460000,
+        's': 'BNBBTC',
+        'i': '1m',
+        'f': 100,
+        'L': 200,
+        'o': '0.0010',
+        'c': '0.0020',
+        'h': '0.0025',
+        'l': '0.0015',
+        'v': '1000',
+        'n': 100,
+        'x': False,
+        'q': '1.0000',
+        'V': '500',
+        'Q': '0.500',
+        'B': '123456'
+    }
+}
+
+
+def test_decode_rows():
+    klines = decode_rows(
+        [KLINE, KLINE],
+        REST_KLINE_FIELDS,
+        ColumnarFormat.NUMPY
+    )
+
+    assert klines.dtype['open_time'] == np.int64
+    assert klines.dtype['close'] == np.float64
+    assert klines['high'].tolist() == [0.8, 0.8]
+    assert klines['total_trades'].tolist() == [308, 308]
+
+    trades = decode_rows([
+        {'a': 1, 'p': '1.5', 'q': '2', 'f': 1, 'l': 2, 'T': 3, 'm': True,
+         'M': False}
+    ], REST_AGG_TRADE_FIELDS, ColumnarFormat.DATAFRAME)
+
+    assert isinstance(trades, pd.DataFrame)
+    assert trades['price'].dtype == np.float64
+    assert trades['is_maker'].dtype == np.bool_
+
+    empty = decode_rows([], REST_AGG_TRADE_FIELDS, ColumnarFormat.NUMPY)
+    assert len(empty) == 0
+    assert empty.dtype['price'] == np.float64
+
+
+@pytest.mark.asyncio
+async def test_get_klines_columnar():
+    client = Client()
+
+    with aioresponses() as m:
+        m.get(KLINES_URL, payload=[KLINE] * 3, repeat=True)
+
+        klines = await client.get_klines(
+            symbol='BTCUSDT',
+            interval='1m',
+            columnar=ColumnarFormat.DATAFRAME
+        )
+
+        assert list(klines.columns)[:2] == ['open_time', 'open']
+        assert klines['volume'].tolist() == [148976.11427815] * 3
+
+        # Raw rows are returned by default
+        assert await client.get_klines(
+            symbol='BTCUSDT',
+            interval='1m'
+        ) == [KLINE] * 3
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_handler_columnar():
+    batches = []
+
+    class Handler(TradeHandlerBase):
+        def receive_batch(self, batch):
+            batches.append(batch)
+
+    handler = Handler(batch_size=3, columnar=ColumnarFormat.NUMPY)
+
+    for i in range(3):
+        handler.receiveDispatch({**TRADE, 't': i})
+
+    batch, = batches
+
+    assert batch['trade_id'].tolist() == [0, 1, 2]
+    assert batch['price'].tolist() == [0.001] * 3
+    assert batch.dtype['is_maker'] == np.bool_
+
+    kline = KlineHandlerBase(columnar='numpy').receive(KLINE_MSG)
+
+    assert kline['close'].tolist() == [0.002]
+    assert kline['event_time'].tolist() == [123456789]
+    assert kline.dtype['total_trades'] == np.int64
+
+
+def test_handler_columnar_unsupported():
+    with pytest.raises(ValueError, match='columnar'):
+        TickerHandlerBase(columnar=ColumnarFormat.NUMPY)
+
+    with pytest.raises(ValueError):
+        TradeHandlerBase(columnar='unknown')
+
+
+def test_arrow_optional():
+    try:
+        import pyarrow  # noqa: F401
+    except ModuleNotFoundError:
+        with pytest.raises(ModuleNotFoundError, match='pyarrow'):
+            TradeHandlerBase(columnar=ColumnarFormat.ARROW)
+        return
+
+    batch = decode_rows([KLINE], REST_KLINE_FIELDS, ColumnarFormat.ARROW)
+
+    assert batch.num_rows == 1
+
+
+NO_PANDAS_SCRIPT = '''
+import sys
+sys.modules['pandas'] = None
+
+from binance import KlineHandlerBase, TradeHandlerBase
+
+trade = TradeHandlerBase(columnar='numpy').receive(%r)
+assert trade['price'].tolist() == [0.001], trade
+
+kline = KlineHandlerBase(columnar='numpy').receive(%r)
+assert kline['close'].tolist() == [0.002], kline
+
+# Messages are not changed without columnar
+assert TradeHandlerBase().receive({'e': 'trade'}) == {'e': 'trade'}
+'''
+
+
+def test_handler_columnar_without_pandas():
+    # pandas is imported once per process, so test it in a new one
+    subprocess.run(
+        [sys.executable, '-c', NO_PANDAS_SCRIPT % (TRADE, KLINE_MSG)],
+        check=True
+    )
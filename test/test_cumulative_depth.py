@@ -0,0 +1,156 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from binance import (
+    OrderBook,
+    OrderSide,
+    LevelFormat,
+    ArraySequencedList,
+    FixedPointLevelParser
+)
+
+
+class ArrayOrderBook(OrderBook):
+    SEQUENCED_LIST = ArraySequencedList
+
+
+def brute_fill(levels, quantity):
+    rest = quantity
+    notional = 0
+
+    for price, level_quantity in levels:
+        taken = min(rest, level_quantity)
+        notional += price * taken
+        rest -= taken
+
+        if rest == 0:
+            return price, notional / quantity
+
+    return None
+
+
+@pytest.mark.asyncio
+async def test_orderbook_queries():
+    orderbook = OrderBook('BTCUSDT')
+
+    assert orderbook.mid is None
+    assert orderbook.best_ask is None
+    assert orderbook.quantity_within(1) is None
+    assert orderbook.imbalance() is None
+    assert orderbook.fill_price(OrderSide.BUY, 1) is None
+
+    orderbook._merge(
+        1,
+        [['101', '1'], ['102', '2'], ['104', '4']],
+        [['99', '3'], ['98', '1']]
+    )
+
+    assert orderbook.best_ask == (101., 1.)
+    assert orderbook.best_bid == (99., 3.)
+    assert orderbook.spread == 2.
+    assert orderbook.mid == 100.
+
+    assert orderbook.quantity_within(2) == (4., 3.)
+    assert orderbook.quantity_within(0.5) == (0., 0.)
+    assert orderbook.imbalance() == 0.5
+    assert orderbook.imbalance(2) == 1 / 7
+
+    assert orderbook.fill_price(OrderSide.BUY, 2) == (102., 101.5)
+    assert orderbook.fill_price(OrderSide.SELL, 3) == (99., 99.)
+    assert orderbook.fill_price(OrderSide.SELL, 4) == (98., 98.75)
+    assert orderbook.fill_price(OrderSide.SELL, 5) is None
+
+    # Update the best levels
+    orderbook._merge(2, [['101', '0'], ['100.5', '2']], [['99', '1']])
+
+    assert orderbook.mid == 99.75
+    assert orderbook.quantity_within(1.5) == (1., 2.)
+    assert orderbook.fill_price(OrderSide.BUY, 4) == (102., 101.25)
+    assert orderbook.fill_price(OrderSide.SELL, 2) == (98., 98.5)
+
+
+@pytest.mark.asyncio
+async def test_orderbook_fixed_point_queries():
+    orderbook = OrderBook('BTCUSDT', level_format=LevelFormat.FIXED_POINT)
+    # Instead of fetching the filters of the symbol
+    orderbook._level_parser = FixedPointLevelParser('0.01', '0.001')
+
+    orderbook._merge(1, [['100.01', '0.002']], [['99.99', '0.001']])
+
+    assert orderbook.mid == 10000
+    assert orderbook.quantity_within(1) == (1, 2)
+    assert orderbook.fill_price(OrderSide.BUY, 2) == (10001, 10001)
+
+
+@pytest.mark.asyncio
+async def test_orderbook_decimal_queries():
+    # Float arrays could not store decimals
+    with pytest.raises(ValueError, match='does not support'):
+        ArrayOrderBook('BTCUSDT', level_format=LevelFormat.DECIMAL)
+
+    orderbook = OrderBook('BTCUSDT', level_format=LevelFormat.DECIMAL)
+
+    orderbook._merge(1, [['100.1', '1'], ['100.2', '2']], [['99.9', '1']])
+    assert orderbook.fill_price(OrderSide.BUY, Decimal('2')) == \
+        (Decimal('100.2'), Decimal('100.15'))
+
+    # Merged after the buckets are built by the query above
+    orderbook._merge(2, [['100.1', '0.5']], [['99.8', '3']])
+    assert orderbook.fill_price(OrderSide.BUY, Decimal('2')) == \
+        (Decimal('100.2'), Decimal('100.175'))
+    assert orderbook.quantity_within(Decimal('0.2')) == \
+        (Decimal('4'), Decimal('2.5'))
+
+    # Floats are converted into decimals
+    assert orderbook.quantity_within(0.2) == (Decimal('4'), Decimal('2.5'))
+    assert orderbook.fill_price(OrderSide.BUY, 2.) == \
+        (Decimal('100.2'), Decimal('100.175'))
+    assert orderbook.fill_price(OrderSide.SELL, 4) == \
+        (Decimal('99.8'), Decimal('99.825'))
+    assert orderbook.imbalance(0.2) == Decimal('1.5') / Decimal('6.5')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('bucket_size', [2, 32])
+@pytest.mark.parametrize('Book', [OrderBook, ArrayOrderBook])
+async def test_cumulative_depth_random(Book, bucket_size):
+    rand = random.Random(0)
+    orderbook = Book('BTCUSDT')
+
+    # Small buckets to test rebuilding
+    orderbook._ask_depth._bucket_size = bucket_size
+    orderbook._bid_depth._bucket_size = bucket_size
+
+    def levels(low, high):
+        return [
+            [str(rand.randint(low, high)), str(rand.choice([0, 1, 2, 5]))]
+            for _ in range(rand.randint(0, 20))
+        ]
+
+    orderbook._merge(1, levels(101, 200), levels(1, 99))
+
+    for i in range(300):
+        orderbook._merge(i + 2, levels(101, 200), levels(1, 99))
+
+        asks = list(orderbook.asks)
+        bids = list(reversed(list(orderbook.bids)))
+
+        if not asks or not bids:
+            continue
+
+        mid = orderbook.mid
+        distance = rand.randint(0, 100)
+
+        assert orderbook.quantity_within(distance) == (
+            sum(q for p, q in bids if p >= mid - distance),
+            sum(q for p, q in asks if p <= mid + distance)
+        )
+
+        quantity = rand.randint(1, 100)
+
+        assert orderbook.fill_price(OrderSide.BUY, quantity) == \
+            pytest.approx(brute_fill(asks, quantity))
+        assert orderbook.fill_price(OrderSide.SELL, quantity) == \
+            pytest.approx(brute_fill(bids, quantity))
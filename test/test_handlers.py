@@ -4,6 +4,7 @@ import asyncio
 from binance import (
     Client,
     TickerHandlerBase,
+    TradeHandlerBase,
     ReuseHandlerException,
 
     KlineHandlerBase,
@@ -263,3 +264,172 @@ def test_handler_reuse():
     with pytest.raises(ReuseHandlerException, match='more than one'):
         client.handler(handler)
         client2.handler(handler)
+
+
+TRADE = {
+    'e': 'trade',
+    'E': 123456789,
+    's': 'BNBBTC',
+    't': 12345,
+    'p': '0.001',
+    'q': '100',
+    'b': 88,
+    'a': 50,
+    'T': 123456785,
+    'm': True,
+    'M': True
+}
+
+
+@pytest.mark.asyncio
+async def test_batch_size(client):
+    batches = []
+
+    class Handler(TradeHandlerBase):
+        def receive_batch(self, df):
+            batches.append(df)
+
+    client.handler(Handler(batch_size=3))
+
+    for i in range(7):
+        await client._receive({
+            'data': {**TRADE, 't': i},
+            'stream': 'bnbbtc@trade'
+        })
+
+    assert len(batches) == 2
+
+    df = batches[0]
+    assert list(df['trade_id']) == [0, 1, 2]
+    assert list(df['price']) == ['0.001'] * 3
+    assert list(batches[1]['trade_id']) == [3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_batch_interval(client):
+    future = asyncio.Future()
+
+    class Handler(KlineHandlerBase):
+        async def receive_batch(self, df):
+            future.set_result(df)
+
+    handler = Handler(batch_interval=0.1)
+    client.handler(handler)
+
+    for i in range(2):
+        await client._receive({
+            'data': {
+                'e': 'kline',
+                'E': i,
+                's': 'BNBBTC',
+                'k': {
+                    's': 'BNBBTC',
+                    'o': '0.0010'
+                }
+            },
+            'stream': 'bnbbtc@kline_1m'
+        })
+
+    assert not future.done()
+
+    df = await future
+
+    assert list(df['event_time']) == [0, 1]
+    assert list(df['symbol']) == ['BNBBTC'] * 2
+
+    # Nothing to flush
+    await handler.flush()
+
+
+@pytest.mark.asyncio
+async def test_batch_interval_exception(client):
+    future = asyncio.Future()
+    e = ValueError('this is an exception for testing, not a bug')
+
+    class Handler(AllMarketMiniTickersHandlerBase):
+        def receive_batch(self, df):
+            raise e
+
+    class ExceptionHandler(HandlerExceptionHandlerBase):
+        def receive(self, e):
+            future.set_result(e)
+
+    client.handler(Handler(batch_interval=0.01), ExceptionHandler())
+
+    await client._receive({
+        'data': [{'e': '24hrMiniTicker', 's': 'BNBBTC'}] * 2,
+        'stream': '!miniTicker@arr'
+    })
+
+    assert await future is e
+
+
+def test_conflate_invalid():
+    with pytest.raises(ValueError, match='not support conflation'):
+        TradeHandlerBase(conflate=True)
+
+    with pytest.raises(ValueError, match='batches'):
+        TickerHandlerBase(conflate=True, batch_size=10)
+
+
+@pytest.mark.asyncio
+async def test_conflate_ticker(client):
+    received = []
+
+    class Handler(TickerHandlerBase):
+        async def receive(self, payload):
+            received.append((payload['s'], payload['E']))
+            await asyncio.sleep(0.05)
+
+    client.handler(Handler(conflate=True))
+
+    for i in range(5):
+        for symbol in ['BNBBTC', 'ETHBTC']:
+            await client._receive({
+                'data': {'e': '24hrTicker', 'E': i, 's': symbol},
+                'stream': f'{symbol.lower()}@ticker'
+            })
+
+        # Let the handler start to receive
+        await asyncio.sleep(0.01)
+
+    await asyncio.sleep(0.3)
+
+    # The first tickers are received at once,
+    #   and then only the newest ones of each symbol
+    assert received == [
+        ('BNBBTC', 0),
+        ('ETHBTC', 4),
+        ('BNBBTC', 4)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_conflate_all_market_tickers(client):
+    received = []
+
+    class Handler(AllMarketMiniTickersHandlerBase):
+        async def receive(self, payload):
+            received.append(payload)
+            await asyncio.sleep(0.05)
+
+    client.handler(Handler(conflate=True))
+
+    for tickers in [
+        [{'s': 'BNBBTC', 'E': 0}],
+        [{'s': 'BNBBTC', 'E': 1}, {'s': 'ETHBTC', 'E': 1}],
+        [{'s': 'ETHBTC', 'E': 2}]
+    ]:
+        await client._receive({
+            'data': tickers,
+            'stream': '!miniTicker@arr'
+        })
+
+        await asyncio.sleep(0.01)
+
+    await asyncio.sleep(0.2)
+
+    assert received == [
+        [{'s': 'BNBBTC', 'E': 0}],
+        [{'s': 'BNBBTC', 'E': 1}, {'s': 'ETHBTC', 'E': 2}]
+    ]
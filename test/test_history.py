@@ -0,0 +1,222 @@
+import re
+
+import pytest
+from aioresponses import (
+    aioresponses,
+    CallbackResult
+)
+
+from binance import (
+    Client,
+    KlineInterval
+)
+
+KLINES_URL = re.compile(
+    re.escape('https://api.binance.com/api/v3/klines') + r'\?.+'
+)
+AGG_TRADES_URL = re.compile(
+    re.escape('https://api.binance.com/api/v3/aggTrades') + r'\?.+'
+)
+ALL_ORDERS_URL = re.compile(
+    re.escape('https://api.binance.com/api/v3/allOrders') + r'\?.+'
+)
+
+MINUTE = 60 * 1000
+
+# The market was closed during [20, 30) minutes
+CLOSED = range(20 * MINUTE, 30 * MINUTE)
+
+
+def klines(url, **kwargs):
+    start = int(url.query['startTime'])
+    end = int(url.query['endTime'])
+    limit = int(url.query['limit'])
+
+    # Align to minutes
+    start = (start + MINUTE - 1) // MINUTE * MINUTE
+
+    return CallbackResult(payload=[
+        [t, '1', '1', '1', '1', '1', t + MINUTE - 1]
+        for t in range(start, end + 1, MINUTE)
+        if t not in CLOSED
+    ][:limit])
+
+
+# Aggregate trades 0 - 2499, one trade per second
+LAST_AGG_TRADE_ID = 2499
+
+
+def agg_trades(url, **kwargs):
+    limit = int(url.query['limit'])
+
+    if 'fromId' in url.query:
+        first = int(url.query['fromId'])
+    else:
+        first = (int(url.query['startTime']) + 999) // 1000
+
+    return CallbackResult(payload=[
+        {'a': i, 'T': i * 1000}
+        for i in range(first, min(first + limit, LAST_AGG_TRADE_ID + 1))
+    ])
+
+
+@pytest.mark.asyncio
+async def test_iter_klines():
+    client = Client()
+
+    with aioresponses() as m:
+        m.get(KLINES_URL, callback=klines, repeat=True)
+
+        iterator = client.iter_klines(
+            symbol='BTCUSDT',
+            interval=KlineInterval.M1,
+            start_time=0,
+            end_time=100 * MINUTE - 1,
+            limit=10
+        )
+
+        rows = await iterator.to_list()
+
+        assert [row[0] for row in rows] == [
+            t for t in range(0, 100 * MINUTE, MINUTE) if t not in CLOSED
+        ]
+
+        # 10 pages, including the empty page when the market was closed
+        assert len(list(m.requests.values())) == 10
+
+        assert iterator.checkpoint == 99 * MINUTE + 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_klines_resume():
+    client = Client()
+
+    with aioresponses() as m:
+        m.get(KLINES_URL, callback=klines, repeat=True)
+
+        def iterate(checkpoint=None):
+            return client.iter_klines(
+                symbol='BTCUSDT',
+                interval='1m',
+                start_time=0,
+                end_time=50 * MINUTE - 1,
+                limit=7,
+                checkpoint=checkpoint
+            )
+
+        iterator = iterate()
+        received = []
+
+        async for row in iterator:
+            received.append(row[0])
+
+            if len(received) == 12:
+                break
+
+        await iterator.close()
+
+        async for row in iterate(iterator.checkpoint):
+            received.append(row[0])
+
+        assert received == [
+            t for t in range(0, 50 * MINUTE, MINUTE) if t not in CLOSED
+        ]
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_klines_month():
+    client = Client()
+
+    with aioresponses() as m:
+        m.get(KLINES_URL, callback=klines, repeat=True)
+
+        # Months are requested page by page
+        rows = await client.iter_klines(
+            symbol='BTCUSDT',
+            interval=KlineInterval.MONTH,
+            start_time=0,
+            end_time=15 * MINUTE - 1,
+            limit=10
+        ).to_list()
+
+        assert [row[0] for row in rows] == list(range(0, 15 * MINUTE, MINUTE))
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_aggregate_trades():
+    client = Client()
+
+    with aioresponses() as m:
+        m.get(AGG_TRADES_URL, callback=agg_trades, repeat=True)
+
+        rows = await client.iter_aggregate_trades(
+            symbol='BTCUSDT',
+            from_id=100,
+            to_id=1234,
+            limit=100
+        ).to_list()
+
+        assert [row['a'] for row in rows] == list(range(100, 1235))
+
+        # Until the latest trade
+        iterator = client.iter_aggregate_trades(
+            symbol='BTCUSDT',
+            from_id=2000,
+            limit=100
+        )
+
+        pages = [page async for page in iterator.pages()]
+        assert [len(page) for page in pages] == [100] * 5
+        assert iterator.checkpoint == LAST_AGG_TRADE_ID + 1
+
+        # By time
+        rows = await client.iter_aggregate_trades(
+            symbol='BTCUSDT',
+            start_time=1500,
+            end_time=10000,
+            limit=3
+        ).to_list()
+
+        assert [row['a'] for row in rows] == list(range(2, 11))
+
+        with pytest.raises(ValueError):
+            client.iter_aggregate_trades(symbol='BTCUSDT')
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_all_orders():
+    client = Client('api_key', 'api_secret')
+
+    # Order ids are not continuous
+    order_ids = list(range(0, 100, 3))
+
+    def all_orders(url, **kwargs):
+        first = int(url.query['orderId'])
+        limit = int(url.query['limit'])
+
+        return CallbackResult(payload=[
+            {'orderId': i, 'time': i}
+            for i in order_ids if i >= first
+        ][:limit])
+
+    with aioresponses() as m:
+        m.get(ALL_ORDERS_URL, callback=all_orders, repeat=True)
+
+        rows = await client.iter_all_orders(
+            symbol='BTCUSDT',
+            limit=5,
+            end_time=50
+        ).to_list()
+
+        assert [row['orderId'] for row in rows] == \
+            [i for i in order_ids if i <= 50]
+
+    await client.close()
@@ -0,0 +1,98 @@
+import time
+import asyncio
+
+import pytest
+
+from binance import (
+    MessageQueue,
+    OverflowPolicy
+)
+
+
+def ticker(stream, i):
+    return dict(
+        stream=stream,
+        data=dict(e='24hrTicker', E=time.time() * 1000, i=i)
+    )
+
+
+def trade(i):
+    return dict(
+        stream='btcusdt@trade',
+        data=dict(e='trade', i=i)
+    )
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError, match='positive'):
+        MessageQueue(0)
+
+
+@pytest.mark.asyncio
+async def test_block():
+    queue = MessageQueue(2)
+
+    await queue.put(trade(0))
+    await queue.put(trade(1))
+
+    task = asyncio.create_task(queue.put(trade(2)))
+    await asyncio.sleep(0)
+
+    # The producer is blocked until a message is taken out
+    assert not task.done()
+    assert len(queue) == 2
+
+    assert (await queue.get())['data']['i'] == 0
+    await task
+
+    assert [
+        (await queue.get())['data']['i'] for _ in range(2)
+    ] == [1, 2]
+
+    stats = queue.stats()
+    assert stats['depth'] == 0
+    assert stats['max_depth'] == 2
+    assert stats['dropped'] == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    queue = MessageQueue(2, OverflowPolicy.DROP_OLDEST)
+
+    for i in range(5):
+        await queue.put(trade(i))
+
+    assert [
+        (await queue.get())['data']['i'] for _ in range(2)
+    ] == [3, 4]
+
+    assert queue.stats()['dropped'] == 3
+
+
+@pytest.mark.asyncio
+async def test_conflate():
+    queue = MessageQueue(4, OverflowPolicy.CONFLATE)
+
+    await queue.put(ticker('btcusdt@ticker', 0))
+    await queue.put(trade(1))
+    await queue.put(ticker('btcusdt@ticker', 2))
+    await queue.put(ticker('ethusdt@ticker', 3))
+    await queue.put(dict(stream='!ticker@arr', data=[{'E': 0}]))
+
+    # Tickers of the same stream are conflated, and the position is kept
+    assert [
+        (await queue.get())['data']['i'] for _ in range(3)
+    ] == [2, 1, 3]
+
+    assert (await queue.get())['stream'] == '!ticker@arr'
+
+    stats = queue.stats()
+    assert stats['conflated'] == 1
+    assert stats['lags']['btcusdt@ticker'] >= 0
+    assert stats['lags']['!ticker@arr'] > 0
+
+    # Trades should never be conflated
+    await queue.put(trade(0))
+    await queue.put(trade(1))
+
+    assert len(queue) == 2
@@ -0,0 +1,228 @@
+import json
+import re
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from binance import (
+    Client,
+    Stream,
+    Histogram,
+    HistogramMetrics,
+    TradeHandlerBase
+)
+
+
+DEPTH_URL = 'https://api.binance.com/api/v3/depth'
+
+
+def test_histogram():
+    histogram = Histogram()
+
+    for value in range(1, 100001):
+        histogram.record(value)
+
+    assert histogram.count == 100000
+    assert histogram.min == 1
+    assert histogram.max == 100000
+    assert histogram.mean == 50000.5
+
+    percentiles = histogram.percentiles((50, 99, 100))
+
+    for percentile, value in percentiles.items():
+        expected = percentile * 1000
+        # The relative error is bounded by the significant bits
+        assert expected <= value <= expected * (1 + 2 ** -6)
+
+    assert percentiles[100] == 100000
+
+    # Small values are counted exactly
+    histogram = Histogram()
+
+    for value in (-1, 3, 3, 5):
+        histogram.record(value)
+
+    assert histogram.min == 0
+    assert histogram.percentile(50) == 3
+    assert histogram.percentile(75) == 3
+    assert histogram.percentile(99.9) == 5
+
+    assert Histogram().percentile(50) == 0
+
+    with pytest.raises(ValueError, match='positive'):
+        Histogram(0)
+
+
+@pytest.mark.asyncio
+async def test_report_and_export():
+    exported = []
+
+    async def exporter(report):
+        exported.append(report)
+
+    metrics = HistogramMetrics(exporters=[exported.append])
+    metrics.add_exporter(exporter)
+
+    metrics.observe('a', 'x', 10)
+    metrics.observe('a', 'x', 20)
+    metrics.increment('b', None)
+    metrics.increment('b', None, 2)
+
+    assert metrics.histogram('a', 'x').count == 2
+    assert metrics.histogram('a') is None
+    assert metrics.counter('b') == 3
+
+    report = metrics.report((50,))
+
+    assert report == dict(
+        histograms=[
+            dict(
+                name='a',
+                tag='x',
+                count=2,
+                min=10,
+                max=20,
+                mean=15.,
+                percentiles={50: 10}
+            )
+        ],
+        counters=[
+            dict(name='b', tag=None, value=3)
+        ]
+    )
+
+    await metrics.export(reset=True)
+
+    assert len(exported) == 2
+    assert exported[0] is exported[1]
+    assert metrics.counter('b') == 0
+
+
+class FakeSocket:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def recv(self):
+        return self._messages.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_stream_metrics():
+    metrics = HistogramMetrics()
+    received = []
+
+    stream = Stream('ws://localhost/stream', received.append, metrics=metrics)
+
+    event_time = time.time_ns() // 1000000 - 50
+
+    stream._socket = FakeSocket([
+        json.dumps({
+            'stream': 'btcusdt@trade',
+            'data': {'e': 'trade', 'E': event_time}
+        }),
+        json.dumps({
+            'stream': 'btcusdt@depth5',
+            'data': {'lastUpdateId': 1}
+        }),
+        '{"result":null,"id":1}'
+    ])
+
+    for _ in range(3):
+        await stream._receive()
+
+    assert len(received) == 3
+
+    assert metrics.counter('stream.messages', 'btcusdt@trade') == 1
+    assert metrics.counter('stream.messages', 'btcusdt@depth5') == 1
+
+    latency = metrics.histogram('stream.latency', 'btcusdt@trade')
+    assert latency.count == 1
+    # At least 50ms
+    assert latency.min >= 50 * 1000000
+
+    # No event time
+    assert metrics.histogram('stream.latency', 'btcusdt@depth5') is None
+
+    assert metrics.histogram('stream.decode', 'btcusdt@trade').count == 1
+    assert metrics.histogram('stream.decode', None).count == 1
+
+    await stream._reconnect(Exception('error'), 1)
+    assert metrics.counter('stream.reconnects', 'ws://localhost/stream') == 1
+
+
+class SlowRecorder:
+    def record(self, stream, msg, received_at):
+        time.sleep(0.05)
+
+
+@pytest.mark.asyncio
+async def test_stream_decode_excludes_recorder():
+    metrics = HistogramMetrics()
+
+    stream = Stream(
+        'ws://localhost/stream',
+        lambda msg: None,
+        recorder=SlowRecorder(),
+        metrics=metrics
+    )
+    stream._socket = FakeSocket(['{"result":null,"id":1}'])
+
+    await stream._receive()
+
+    decode = metrics.histogram('stream.decode', None)
+    assert decode.count == 1
+    assert decode.max < 50 * 1000000
+
+
+class TradeHandler(TradeHandlerBase):
+    def __init__(self):
+        super().__init__()
+        self.received = []
+
+    async def receive(self, payload):
+        self.received.append(payload)
+
+
+@pytest.mark.asyncio
+async def test_handler_metrics():
+    metrics = HistogramMetrics()
+    client = Client(metrics=metrics)
+
+    handler = TradeHandler()
+    client.handler(handler)
+
+    await client._receive({
+        'stream': 'btcusdt@trade',
+        'data': {'e': 'trade', 'E': 1}
+    })
+
+    # Not routed
+    await client._receive({'stream': 'btcusdt@unknown', 'data': {}})
+
+    assert len(handler.received) == 1
+
+    for name in ('stream.route', 'stream.dispatch'):
+        assert metrics.histogram(name, 'TradeProcessor').count == 1
+
+    assert metrics.histogram('handler.receive', 'TradeHandler').count == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_rest_metrics():
+    metrics = HistogramMetrics()
+    client = Client(metrics=metrics)
+
+    with aioresponses() as m:
+        m.get(
+            re.compile(re.escape(DEPTH_URL) + r'\?.+'),
+            payload={'lastUpdateId': 1, 'asks': [], 'bids': []}
+        )
+        await client.get_orderbook(symbol='BTCUSDT', limit=5000)
+
+    assert metrics.counter('rest.weight', DEPTH_URL) == 50
+    assert metrics.histogram('rest.latency', DEPTH_URL).count == 1
+
+    await client.close()
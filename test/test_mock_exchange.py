@@ -0,0 +1,202 @@
+import asyncio
+
+import pytest
+
+from binance import (
+    Client,
+    SubType,
+    OrderSide,
+    OrderType,
+    TimeInForce,
+    StatusException,
+    OrderBookHandlerBase,
+    OrderUpdateHandlerBase,
+    TradeHandlerBase
+)
+from .mock import (
+    MockExchange,
+    MockMarket
+)
+
+
+def create_client(exchange, **kwargs):
+    return Client(
+        'api_key',
+        'api_secret',
+        api_host=exchange.rest_host,
+        stream_host=exchange.stream_host,
+        **kwargs
+    )
+
+
+def test_market_matching():
+    market = MockMarket('BTCUSDT', price=100., tick_size=0.01, seed=1)
+
+    snapshot = market.snapshot(5)
+    best_ask = float(snapshot['asks'][0][0])
+    best_bid = float(snapshot['bids'][0][0])
+
+    assert best_ask == 100.01
+    assert best_bid == 99.99
+
+    # Rests in the orderbook
+    order = market.place_order('BUY', 'LIMIT', 1, '99.5')
+    assert order['status'] == 'NEW'
+    assert len(market.open_orders()) == 1
+
+    # Taker
+    order = market.place_order('BUY', 'MARKET', 0.001)
+    assert order['status'] == 'FILLED'
+    assert order['fills'][0]['price'] == '100.01000000'
+
+    order = market.place_order('SELL', 'LIMIT', 10000, '99', 'IOC')
+    assert order['status'] == 'EXPIRED'
+    assert float(order['executedQty']) > 0
+
+    # The resting order is filled by the taker
+    resting = market.get_order(1)
+    assert resting['status'] == 'FILLED'
+
+    with pytest.raises(Exception, match='immediately match'):
+        market.place_order('SELL', 'LIMIT_MAKER', 1, '1')
+
+    reports = market.drain_reports()
+    assert [r['x'] for r in reports if r['i'] == 1] == ['NEW', 'TRADE']
+    assert market.drain_reports() == []
+
+    depth_update, _ = market.step()
+    assert depth_update['U'] <= depth_update['u']
+
+
+@pytest.mark.asyncio
+async def test_rest_apis():
+    async with MockExchange(api_secret='api_secret', seed=0) as exchange:
+        client = create_client(exchange)
+
+        info = await client.get_exchange_info()
+        assert info['symbols'][0]['symbol'] == 'BTCUSDT'
+
+        snapshot = await client.get_orderbook(symbol='BTCUSDT', limit=10)
+        assert len(snapshot['asks']) == 10
+
+        best_ask = snapshot['asks'][0][0]
+
+        order = await client.create_order(
+            symbol='BTCUSDT',
+            side=OrderSide.BUY,
+            type=OrderType.LIMIT,
+            timeInForce=TimeInForce.GTC,
+            quantity='0.001',
+            price=best_ask
+        )
+        assert order['status'] == 'FILLED'
+
+        order = await client.create_order(
+            symbol='BTCUSDT',
+            side=OrderSide.SELL,
+            type=OrderType.LIMIT,
+            timeInForce=TimeInForce.GTC,
+            quantity='1',
+            price='20000'
+        )
+        assert order['status'] == 'NEW'
+
+        open_orders = await client.get_open_orders(symbol='BTCUSDT')
+        assert [o['orderId'] for o in open_orders] == [order['orderId']]
+
+        canceled = await client.cancel_order(
+            symbol='BTCUSDT',
+            orderId=order['orderId']
+        )
+        assert canceled['status'] == 'CANCELED'
+
+        with pytest.raises(StatusException, match='-1102'):
+            await client.get_order(symbol='BTCUSDT')
+
+        with pytest.raises(StatusException, match='Invalid symbol'):
+            await client.get_orderbook(symbol='FOOBAR')
+
+        await client.close()
+
+        # Wrong secret
+        client = Client(
+            'api_key',
+            'wrong_secret',
+            api_host=exchange.rest_host
+        )
+
+        with pytest.raises(StatusException, match='-1022'):
+            await client.get_account()
+
+        await client.close()
+
+        assert exchange.stats()['requests'] == 9
+
+
+class Trades(TradeHandlerBase):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def receive(self, payload):
+        self.count += 1
+
+
+@pytest.mark.asyncio
+async def test_streams():
+    async with MockExchange(
+        rate=200,
+        gap_probability=0.1,
+        disconnect_interval=0.5,
+        seed=0
+    ) as exchange:
+        client = create_client(exchange)
+
+        orderbook_handler = OrderBookHandlerBase()
+        trades = Trades()
+        orders = []
+
+        class Orders(OrderUpdateHandlerBase):
+            def receive(self, payload):
+                orders.append(payload)
+
+        client.handler(orderbook_handler, trades, Orders())
+
+        await client.subscribe(
+            [SubType.ORDER_BOOK, SubType.TRADE],
+            'BTCUSDT'
+        )
+        await client.subscribe(SubType.USER)
+
+        assert {'btcusdt@depth', 'btcusdt@trade'} < \
+            set(await client.list_subscriptions())
+
+        orderbook = orderbook_handler.orderbook('BTCUSDT')
+        await orderbook.updated()
+
+        await client.create_order(
+            symbol='BTCUSDT',
+            side=OrderSide.BUY,
+            type=OrderType.MARKET,
+            quantity='0.001'
+        )
+
+        # Survives disconnects
+        await asyncio.sleep(1.2)
+
+        stats = exchange.stats()
+
+        assert stats['gaps'] > 0
+        assert stats['disconnects'] > 0
+        assert trades.count > 0
+
+        assert [o['x'] for o in orders] == ['NEW', 'TRADE']
+
+        count = trades.count
+        await asyncio.sleep(0.3)
+        assert trades.count > count
+
+        # Bids are in ascending order
+        assert float(orderbook.asks[0][0]) > float(orderbook.bids[-1][0])
+
+        await client.close()
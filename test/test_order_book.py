@@ -1,9 +1,17 @@
 import pytest
 import asyncio
+from decimal import Decimal
 
 from aioresponses import aioresponses
 
-from binance import Client, OrderBook
+from binance import (
+    Client,
+    OrderBook,
+    LevelFormat,
+    FixedPointLevelParser,
+    ArraySequencedList,
+    OrderBookFetchAbandonedException
+)
 
 
 def test_order_book_no_client():
@@ -14,7 +22,7 @@ def test_order_book_no_client():
 @pytest.mark.asyncio
 async def test_order_book():
     with aioresponses() as m:
-        a00, b00, b01, a10 = [100, 10], [99, 100], [98, 2], [101, 3]
+        a00, b00, b01, a10 = (100, 10), (99, 100), (98, 2), (101, 3)
         asks = [a00]
         bids = [b00, b01]
         bids_sort = [b01, b00]
@@ -50,7 +58,7 @@ async def test_order_book():
             assert orderbook.bids == bids_sort
 
         def assert_state_c():
-            assert orderbook.asks == [[95, 1], *asks1_sort]
+            assert orderbook.asks == [(95, 1), *asks1_sort]
             assert orderbook.bids == bids_sort
 
         print('\nround one  : normal initialization')
@@ -99,7 +107,7 @@ async def test_order_book():
             b=[]
         ))
 
-        assert orderbook.asks == [[95, 1], *asks1_sort]
+        assert orderbook.asks == [(95, 1), *asks1_sort]
 
         print('round three: new update when still refetching')
 
@@ -229,3 +237,130 @@ async def test_order_book():
         await f
 
         assert_state_b()
+
+
+@pytest.mark.asyncio
+async def test_order_book_levels():
+    orderbook = OrderBook('BTCUSDT')
+
+    orderbook._merge(
+        1,
+        [['100.01000000', '1.00000000'], ['99.99000000', '2.00000000']],
+        [['99.00000000', '3.00000000']]
+    )
+
+    assert orderbook.asks == [(99.99, 2.), (100.01, 1.)]
+    assert orderbook.bids == [(99., 3.)]
+
+    # Levels with formatted zero quantity are removed
+    orderbook._merge(2, [['99.99000000', '0.00000000']], [])
+    assert orderbook.asks == [(100.01, 1.)]
+
+    # Prices are compared as numbers rather than strings
+    orderbook._merge(3, [['9.50000000', '1.00000000']], [])
+    assert orderbook.asks[0] == (9.5, 1.)
+
+
+@pytest.mark.asyncio
+async def test_order_book_decimal_levels():
+    orderbook = OrderBook('BTCUSDT', level_format=LevelFormat.DECIMAL)
+
+    orderbook._merge(1, [['0.10000000', '1.50000000']], [])
+
+    assert orderbook.asks == [(Decimal('0.1'), Decimal('1.5'))]
+    assert orderbook.level_parser.price(orderbook.asks[0][0]) == 0.1
+
+
+def test_fixed_point_level_parser():
+    parser = FixedPointLevelParser('0.01000000', '0.00001000')
+
+    assert parser.parse([['100.29000000', '0.00300000']]) == [(10029, 300)]
+    assert parser.price(10029) == 100.29
+    assert parser.quantity(300) == 0.003
+
+    with pytest.raises(ValueError, match='positive'):
+        FixedPointLevelParser('0.00000000', '1')
+
+
+@pytest.mark.asyncio
+async def test_order_book_fixed_point_levels():
+    with aioresponses() as m:
+        m.get('https://api.binance.com/api/v3/exchangeInfo', payload=dict(
+            symbols=[dict(
+                symbol='BTCUSDT',
+                filters=[
+                    dict(filterType='PRICE_FILTER', tickSize='0.01000000'),
+                    dict(filterType='LOT_SIZE', stepSize='0.00100000')
+                ]
+            )]
+        ))
+        m.get('https://api.binance.com/api/v3/depth?limit=100&symbol=BTCUSDT', payload=dict(
+            lastUpdateId=10,
+            asks=[['100.01000000', '1.50000000']],
+            bids=[['99.99000000', '0.00200000']]
+        ))
+
+        client = Client('api_key')
+        orderbook = OrderBook(
+            'BTCUSDT',
+            client,
+            level_format=LevelFormat.FIXED_POINT
+        )
+
+        assert orderbook.level_parser is None
+
+        await orderbook.updated()
+
+        assert orderbook.asks == [(10001, 1500)]
+        assert orderbook.bids == [(9999, 2)]
+        assert orderbook.level_parser.price(orderbook.asks[0][0]) == 100.01
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_order_book_level_format_not_supported():
+    class ArrayOrderBook(OrderBook):
+        SEQUENCED_LIST = ArraySequencedList
+
+    for level_format in [LevelFormat.DECIMAL, LevelFormat.FIXED_POINT]:
+        with pytest.raises(ValueError, match='does not support'):
+            ArrayOrderBook('BTCUSDT', level_format=level_format)
+
+    ArrayOrderBook('BTCUSDT', level_format=LevelFormat.FLOAT)
+
+
+@pytest.mark.asyncio
+async def test_order_book_fixed_point_unknown_symbol():
+    with aioresponses() as m:
+        m.get(
+            'https://api.binance.com/api/v3/exchangeInfo',
+            payload=dict(symbols=[]),
+            repeat=True
+        )
+
+        client = Client('api_key')
+        orderbook = OrderBook(
+            'FOOBAR',
+            client,
+            level_format=LevelFormat.FIXED_POINT
+        )
+
+        updated = orderbook._updated_future
+
+        # Abandoned without retrying
+        with pytest.raises(OrderBookFetchAbandonedException):
+            await asyncio.wait_for(updated, 1)
+
+        updated = orderbook._updated_future
+        await orderbook.fetch()
+
+        # The exchange info is not requested again
+        with pytest.raises(OrderBookFetchAbandonedException):
+            await asyncio.wait_for(updated, 1)
+
+        assert len(m.requests) == 1
+        [calls] = m.requests.values()
+        assert len(calls) == 1
+
+        await client.close()
@@ -0,0 +1,130 @@
+import pytest
+import pandas
+import numpy
+
+from binance import (
+    OrderBookHandlerBase,
+    DepthFormat
+)
+from binance.handlers.orderbook_handler import (
+    LazyDepth,
+    merge_depth_updates
+)
+
+
+PAYLOAD = {
+    'e': 'depthUpdate',
+    'E': 123456789,
+    's': 'BNBBTC',
+    'U': 157,
+    'u': 160,
+    'b': [
+        ['0.0024', '10']
+    ],
+    'a': [
+        ['0.0026', '100'],
+        ['0.0027', '0']
+    ]
+}
+
+
+class OrderBookHandler(OrderBookHandlerBase):
+    def receive(self, payload):
+        return super().receive(payload)
+
+
+def test_has_receive():
+    assert not OrderBookHandlerBase()._has_receive
+    assert OrderBookHandler()._has_receive
+
+
+def test_dataframe():
+    info, [bids, asks] = OrderBookHandler().receive(PAYLOAD)
+
+    assert isinstance(info, pandas.DataFrame)
+    assert info.iloc[0]['symbol'] == 'BNBBTC'
+    assert isinstance(bids, pandas.DataFrame)
+    assert len(asks) == 2
+
+
+def test_lazy_dataframe():
+    depth = OrderBookHandler(
+        depth_format=DepthFormat.LAZY_DATAFRAME
+    ).receive(PAYLOAD)
+
+    assert isinstance(depth, LazyDepth)
+    assert depth._bids is None
+
+    bids = depth.bids
+    assert bids.iloc[0]['price'] == '0.0024'
+    # cached
+    assert depth.bids is bids
+    assert depth._asks is None
+
+    info, [bids, asks] = depth
+
+    assert info.iloc[0]['last_update_id'] == 160
+    assert len(asks) == 2
+
+
+def test_tuple():
+    payload, [bids, asks] = OrderBookHandler(
+        depth_format=DepthFormat.TUPLE
+    ).receive(PAYLOAD)
+
+    assert payload is PAYLOAD
+    assert bids == [(0.0024, 10.)]
+    assert asks == [(0.0026, 100.), (0.0027, 0.)]
+
+
+def test_numpy():
+    payload, [bids, asks] = OrderBookHandler(
+        depth_format=DepthFormat.NUMPY
+    ).receive(PAYLOAD)
+
+    assert payload is PAYLOAD
+    assert isinstance(bids, numpy.ndarray)
+    assert bids.shape == (1, 2)
+    assert asks.tolist() == [[0.0026, 100.], [0.0027, 0.]]
+
+
+def test_numpy_empty():
+    _, [bids, _] = OrderBookHandler(
+        depth_format=DepthFormat.NUMPY
+    ).receive({**PAYLOAD, 'b': []})
+
+    assert bids.shape == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_receive_dispatch_without_receive():
+    handler = OrderBookHandlerBase()
+    orderbook = handler.orderbook('BNBBTC')
+
+    orderbook._last_update_id = 156
+
+    await handler.receiveDispatch(PAYLOAD)
+
+    assert orderbook.asks[0] == (0.0026, 100.)
+    assert orderbook.bids == [(0.0024, 10.)]
+
+
+def test_merge_depth_updates():
+    merged = merge_depth_updates(
+        {
+            'e': 'depthUpdate', 'E': 1, 's': 'BNBBTC', 'U': 1, 'u': 2,
+            'b': [['0.1', '1'], ['0.2', '2']],
+            'a': [['0.3', '1']]
+        },
+        {
+            'e': 'depthUpdate', 'E': 2, 's': 'BNBBTC', 'U': 3, 'u': 5,
+            'b': [['0.2', '0']],
+            'a': [['0.4', '3']]
+        }
+    )
+
+    assert merged == {
+        'e': 'depthUpdate', 'E': 2, 's': 'BNBBTC', 'U': 1, 'u': 5,
+        'b': [['0.1', '1'], ['0.2', '0']],
+        'a': [['0.3', '1'], ['0.4', '3']]
+    }
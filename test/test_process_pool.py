@@ -0,0 +1,188 @@
+import os
+import pickle
+import asyncio
+
+import pytest
+
+from binance import (
+    Client,
+    TickerHandlerBase,
+    TradeHandlerBase,
+    OrderBookHandlerBase,
+    HandlerExceptionHandlerBase,
+    ReuseHandlerException
+)
+from binance.common.codec import (
+    StdJSONCodec,
+    get_json_codec
+)
+
+
+class PidTickerHandler(TickerHandlerBase):
+    def __init__(self):
+        super().__init__()
+        self.results = []
+
+    def receive(self, payload):
+        if payload['c'] == 'error':
+            raise RuntimeError(payload['s'])
+
+        return os.getpid(), payload['s'], payload['E']
+
+    def receive_result(self, result):
+        self.results.append(result)
+
+
+class CountTradeHandler(TradeHandlerBase):
+    def __init__(self):
+        super().__init__(batch_size=100)
+        self.results = []
+
+    def receive_batch(self, batch):
+        return len(batch)
+
+    def receive_result(self, result):
+        self.results.append(result)
+
+
+class ExceptionHandler(HandlerExceptionHandlerBase):
+    def __init__(self):
+        super().__init__()
+        self.exceptions = []
+
+    def receive(self, e):
+        self.exceptions.append(e)
+
+
+class WorkerCodec(StdJSONCodec):
+    # Only set in the worker process which unpickles the codec
+    unpickled = False
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        WorkerCodec.unpickled = True
+
+
+class CodecTickerHandler(TickerHandlerBase):
+    def __init__(self):
+        super().__init__()
+        self.results = []
+
+    def receive(self, payload):
+        return WorkerCodec.unpickled
+
+    def receive_result(self, result):
+        self.results.append(result)
+
+
+def ticker(symbol, event_time, close='1'):
+    return dict(
+        stream=f'{symbol.lower()}@ticker',
+        data=dict(
+            e='24hrTicker',
+            E=event_time,
+            s=symbol,
+            c=close
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_handler_processes():
+    client = Client(handler_processes=2).start()
+
+    ticker_handler = PidTickerHandler()
+    trade_handler = CountTradeHandler()
+    exception_handler = ExceptionHandler()
+
+    client.handler(ticker_handler, exception_handler)
+
+    symbols = ['BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'XRPUSDT']
+
+    for i in range(20):
+        for symbol in symbols:
+            await client._receive(ticker(symbol, i))
+
+    # Handlers could also be added after workers started
+    client.handler(trade_handler)
+
+    for i in range(3):
+        await client._receive(dict(
+            stream='btcusdt@trade',
+            data=dict(e='trade', E=i, s='BTCUSDT')
+        ))
+
+    await client._receive(ticker('ETHUSDT', 20, 'error'))
+
+    await client.close()
+    await asyncio.sleep(0.1)
+
+    results = ticker_handler.results
+    assert len(results) == 80
+
+    for symbol in symbols:
+        symbol_results = [r for r in results if r[1] == symbol]
+
+        # Payloads of the same symbol are received by the same worker in order
+        assert len({pid for pid, _, _ in symbol_results}) == 1
+        assert [r[2] for r in symbol_results] == list(range(20))
+
+    assert os.getpid() not in {pid for pid, _, _ in results}
+
+    # Batches are flushed when the client is closed
+    assert trade_handler.results == [3]
+
+    [e] = exception_handler.exceptions
+    assert isinstance(e, RuntimeError)
+    assert str(e) == 'ETHUSDT'
+
+
+@pytest.mark.asyncio
+async def test_pickle_orderbook_handler():
+    handler = OrderBookHandlerBase()
+    handler.orderbook('BTCUSDT')
+    handler._client = object()
+
+    copied = pickle.loads(pickle.dumps(handler))
+
+    assert copied._client is None
+    assert copied._orderbooks == {}
+
+
+@pytest.mark.asyncio
+async def test_handler_processes_set_client():
+    client = Client(handler_processes=1)
+    handler = PidTickerHandler()
+
+    client.handler(handler)
+    # Registering the same handler again is ok
+    client.handler(handler)
+
+    assert handler._client is client
+
+    with pytest.raises(ReuseHandlerException):
+        Client(handler_processes=1).handler(handler)
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_handler_processes_json_codec():
+    # Built-in codecs are re-created by name
+    codec = get_json_codec('json')
+    assert pickle.loads(pickle.dumps(codec)) is codec
+
+    codec = WorkerCodec()
+    client = Client(handler_processes=1, json_codec=codec).start()
+    assert client._get_worker_kwargs()['json_codec'] is codec
+
+    handler = CodecTickerHandler()
+    client.handler(handler)
+
+    await client._receive(ticker('BTCUSDT', 1))
+
+    await client.close()
+    await asyncio.sleep(0.1)
+
+    # The worker uses the custom codec rather than the default one
+    assert handler.results == [True]
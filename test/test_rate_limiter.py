@@ -0,0 +1,188 @@
+import asyncio
+import re
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from binance import (
+    Client,
+    RateLimiter,
+    RateLimitType
+)
+from binance.apis.rest import depth_weight
+from binance.client.rate_limiter import TokenBucket
+
+EXCHANGE_INFO_URL = 'https://api.binance.com/api/v3/exchangeInfo'
+PING_URL = 'https://api.binance.com/api/v3/ping'
+DEPTH_URL = 'https://api.binance.com/api/v3/depth'
+
+
+def rate_limit(limit_type, interval, interval_num, limit):
+    return dict(
+        rateLimitType=limit_type,
+        interval=interval,
+        intervalNum=interval_num,
+        limit=limit
+    )
+
+
+def test_token_bucket():
+    bucket = TokenBucket(10, 1)
+
+    assert bucket.delay(10) == 0
+
+    bucket.consume(8)
+    assert 0 < bucket.delay(5) <= 0.3
+
+    # The server reports more usage
+    bucket.reconcile(10)
+    assert 0.4 < bucket.delay(5) <= 0.5
+
+    # A request heavier than the limit waits for a full bucket
+    assert bucket.delay(100) == pytest.approx(bucket.delay(10), abs=0.01)
+
+
+def test_depth_weight():
+    assert depth_weight({}) == 1
+    assert depth_weight({'limit': 100}) == 1
+    assert depth_weight({'limit': 500}) == 5
+    assert depth_weight({'limit': 1000}) == 10
+    assert depth_weight({'limit': 5000}) == 50
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits():
+    limiter = RateLimiter([
+        rate_limit('REQUEST_WEIGHT', 'SECOND', 1, 10),
+        rate_limit('ORDERS', 'SECOND', 1, 2)
+    ])
+
+    start = time.monotonic()
+
+    await limiter.acquire(10)
+    assert time.monotonic() - start < 0.05
+
+    # Waits for half of the weight bucket
+    await limiter.acquire(5)
+    assert time.monotonic() - start >= 0.45
+
+    start = time.monotonic()
+
+    await limiter.acquire(1, orders=2)
+    await limiter.acquire(1, orders=1)
+    assert time.monotonic() - start >= 0.45
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_headers():
+    limiter = RateLimiter([
+        rate_limit('REQUEST_WEIGHT', 'MINUTE', 1, 1200)
+    ])
+
+    bucket = limiter._buckets[(RateLimitType.REQUEST_WEIGHT, '1M')]
+
+    limiter.update(200, {
+        'x-mbx-used-weight-1m': '1000',
+        'X-MBX-USED-WEIGHT': '1000'
+    })
+    assert bucket.tokens == pytest.approx(200, abs=1)
+
+    limiter.update(429, {'Retry-After': '1'})
+
+    start = time.monotonic()
+    await limiter.acquire()
+    assert time.monotonic() - start >= 0.9
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_from_exchange_info():
+    limiter = RateLimiter()
+    client = Client(rate_limiter=limiter)
+
+    assert client.rate_limiter is limiter
+    assert (RateLimitType.RAW_REQUESTS, '5M') in limiter._buckets
+
+    with aioresponses() as m:
+        m.get(EXCHANGE_INFO_URL, payload={
+            'rateLimits': [
+                rate_limit('REQUEST_WEIGHT', 'MINUTE', 1, 6000)
+            ]
+        })
+        m.get(
+            PING_URL,
+            payload={},
+            headers={'X-MBX-USED-WEIGHT-1M': '100'}
+        )
+        m.get(DEPTH_URL + '?limit=1000&symbol=BTCUSDT', payload={})
+
+        await client.get_exchange_info()
+
+        [key] = limiter._buckets.keys()
+        bucket = limiter._buckets[key]
+
+        assert key == (RateLimitType.REQUEST_WEIGHT, '1M')
+        assert bucket.limit == 6000
+
+        await client.ping()
+        assert bucket.tokens == pytest.approx(5900, abs=1)
+
+        await client.get_orderbook(symbol='BTCUSDT', limit=1000)
+        assert bucket.tokens == pytest.approx(5890, abs=1)
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_fifo():
+    limiter = RateLimiter([
+        rate_limit('REQUEST_WEIGHT', 'SECOND', 1, 10)
+    ])
+
+    await limiter.acquire(10)
+
+    order = []
+
+    async def request(i, weight):
+        await limiter.acquire(weight)
+        order.append(i)
+
+    # A light request does not overtake a heavy one queued before it
+    await asyncio.gather(request(0, 5), request(1, 1))
+
+    assert order == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_signed_request_timestamped_after_waiting():
+    limiter = RateLimiter([
+        rate_limit('REQUEST_WEIGHT', 'SECOND', 1, 10)
+    ])
+    client = Client('api_key', 'api_secret', rate_limiter=limiter)
+
+    # Hold the limiter, so that the request waits for half a second
+    await limiter.acquire(10)
+
+    sent = []
+
+    def callback(url, **kwargs):
+        sent.append((int(url.query['timestamp']), time.time() * 1000))
+
+    with aioresponses() as m:
+        m.get(
+            re.compile(r'^https://api\.binance\.com/api/v3/account'),
+            payload={},
+            callback=callback
+        )
+
+        start = time.time() * 1000
+        await client.get_account()
+
+    [(timestamp, sent_at)] = sent
+
+    assert sent_at - start >= 450
+    # The request is timestamped after waiting for the rate limiter
+    assert timestamp >= start + 450
+    assert sent_at - timestamp < 100
+
+    await client.close()
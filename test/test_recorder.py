@@ -0,0 +1,190 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from binance import (
+    Stream,
+    Recorder,
+    RecordingReader
+)
+
+from .common import (
+    PORT,
+    SocketServer
+)
+
+SECOND = 10 ** 9
+
+
+def depth(i):
+    return json.dumps({
+        'stream': 'btcusdt@depth',
+        'data': {'e': 'depthUpdate', 'u': i}
+    })
+
+
+def trade(i):
+    return json.dumps({
+        'stream': 'btcusdt@trade',
+        'data': {'e': 'trade', 't': i}
+    })
+
+
+def record(recorder, count, start=0):
+    for i in range(start, start + count):
+        stream, data = ('btcusdt@depth', depth(i)) if i % 2 == 0 \
+            else ('btcusdt@trade', trade(i))
+
+        recorder.record(stream, data, i * SECOND)
+
+
+@pytest.mark.asyncio
+async def test_record_and_read(tmp_path):
+    recorder = Recorder(str(tmp_path), block_size=200)
+
+    record(recorder, 100)
+    recorder.record(None, '{"result":null,"id":1}', 100 * SECOND)
+
+    await recorder.close()
+
+    stats = recorder.stats()
+    assert stats['recorded'] == 101
+    assert stats['dropped'] == 0
+    assert stats['written'] > 1
+
+    reader = RecordingReader(str(tmp_path))
+    assert len(reader.segments) == 1
+
+    frames = list(reader)
+    assert [f.received_at for f in frames] == \
+        [i * SECOND for i in range(101)]
+    assert frames[0].data == depth(0).encode()
+    assert frames[-1].stream is None
+
+    # By time
+    assert [
+        f.received_at // SECOND
+        for f in reader.frames(start=10 * SECOND, end=14 * SECOND)
+    ] == [10, 11, 12, 13, 14]
+
+    # By stream
+    trades = list(reader.frames(streams=['btcusdt@trade']))
+    assert [json.loads(f.data)['data']['t'] for f in trades] == \
+        list(range(1, 100, 2))
+
+
+@pytest.mark.asyncio
+async def test_segment_rotation(tmp_path):
+    recorder = Recorder(
+        str(tmp_path),
+        block_size=1,
+        compression=0,
+        segment_size=500,
+        segment_interval=10
+    )
+
+    record(recorder, 30)
+    await recorder.close()
+
+    # Continues the sequence of segments after closed
+    record(recorder, 10, 30)
+    await recorder.close()
+
+    reader = RecordingReader(str(tmp_path))
+    assert len(reader.segments) > 3
+
+    assert [f.received_at for f in reader] == \
+        [i * SECOND for i in range(40)]
+
+
+@pytest.mark.asyncio
+async def test_read_without_index(tmp_path):
+    recorder = Recorder(str(tmp_path), block_size=100)
+
+    record(recorder, 20)
+    await recorder.close()
+
+    segment, = RecordingReader(str(tmp_path)).segments
+    index = segment[:-len('.seg')] + '.idx'
+
+    with open(index) as f:
+        lines = f.readlines()
+
+    # The writer crashed after the second block and in the middle of the last
+    with open(index, 'w') as f:
+        f.writelines(lines[:2])
+
+    with open(segment, 'ab') as f:
+        f.write(b'BNR1\x01')
+
+    frames = list(RecordingReader(str(tmp_path)).frames(
+        streams=['btcusdt@depth']
+    ))
+
+    assert [f.received_at // SECOND for f in frames] == list(range(0, 20, 2))
+
+    os.remove(index)
+    assert len(list(RecordingReader(str(tmp_path)))) == 20
+
+
+@pytest.mark.asyncio
+async def test_recorder_flush_interval(tmp_path):
+    recorder = Recorder(str(tmp_path), flush_interval=0.05)
+
+    record(recorder, 3)
+    assert recorder.stats()['buffered'] == 3
+
+    await asyncio.sleep(0.2)
+
+    assert recorder.stats()['buffered'] == 0
+    assert recorder.stats()['written'] == 1
+
+    await recorder.close()
+
+
+def test_recorder_drops_when_writer_falls_behind(tmp_path):
+    recorder = Recorder(str(tmp_path), max_pending_blocks=1)
+
+    # The writer thread never consumes the blocks
+    recorder._start_writer = lambda: None
+
+    record(recorder, 2)
+    recorder.flush()
+    record(recorder, 2, 2)
+    recorder.flush()
+
+    stats = recorder.stats()
+    assert stats['recorded'] == 2
+    assert stats['dropped'] == 2
+
+    with pytest.raises(ValueError, match='positive'):
+        Recorder(str(tmp_path), max_pending_blocks=0)
+
+
+@pytest.mark.asyncio
+async def test_stream_recorder(tmp_path):
+    server = SocketServer()
+    await server.no_timeout().start().run()
+
+    received = []
+    recorder = Recorder(str(tmp_path))
+
+    stream = Stream(
+        'ws://localhost:%s/stream' % PORT,
+        received.append,
+        recorder=recorder
+    ).connect()
+
+    await asyncio.sleep(0.3)
+
+    await stream.close()
+    await server.shutdown()
+    await recorder.close()
+
+    frames = list(RecordingReader(str(tmp_path)))
+
+    assert len(frames) == len(received) > 0
+    assert frames[0].data == b'{"ok":true}'
+    assert frames[0].stream is None
@@ -0,0 +1,177 @@
+import json
+import re
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from binance import (
+    Client,
+    ReplayClient,
+    Recorder,
+    RecordingReader,
+    OrderBookHandlerBase,
+    TradeHandlerBase,
+    SubType
+)
+
+SECOND = 10 ** 9
+
+DEPTH_URL = re.compile(
+    re.escape('https://api.binance.com/api/v3/depth') + r'\?.+'
+)
+
+
+def message(stream, payload):
+    return json.dumps({'stream': stream, 'data': payload})
+
+
+def depth_update(first, last, asks, bids):
+    return 'btcusdt@depth', message('btcusdt@depth', {
+        'e': 'depthUpdate',
+        'E': 1,
+        's': 'BTCUSDT',
+        'U': first,
+        'u': last,
+        'a': asks,
+        'b': bids
+    })
+
+
+def trade(i):
+    return 'btcusdt@trade', message('btcusdt@trade', {
+        'e': 'trade',
+        'E': 1,
+        's': 'BTCUSDT',
+        't': i,
+        'p': '100',
+        'q': '1',
+        'T': 1,
+        'm': True
+    })
+
+
+SNAPSHOT = {
+    'lastUpdateId': 12,
+    'asks': [['101', '1'], ['102', '1']],
+    'bids': [['99', '1'], ['98', '1']]
+}
+
+
+async def record_session(path):
+    recorder = Recorder(path, block_size=100)
+
+    frames = [
+        depth_update(10, 11, [['101', '5']], []),
+        trade(1),
+        depth_update(12, 13, [['103', '1']], [['99', '2']]),
+        # The snapshot the live orderbook got
+        ('btcusdt@depthSnapshot', json.dumps(SNAPSHOT)),
+        depth_update(14, 15, [['102', '4']], [['97', '3']]),
+        trade(2)
+    ]
+
+    for i, (stream, data) in enumerate(frames):
+        recorder.record(stream, data, i * SECOND // 10)
+
+    await recorder.close()
+
+
+class Trades(TradeHandlerBase):
+    def __init__(self):
+        super().__init__()
+        self.trade_ids = []
+
+    def receive(self, payload):
+        self.trade_ids.append(payload['t'])
+
+
+@pytest.mark.asyncio
+async def test_replay(tmp_path):
+    path = str(tmp_path)
+    await record_session(path)
+
+    client = ReplayClient(path)
+
+    trades = Trades()
+    client.handler(OrderBookHandlerBase(), trades)
+
+    await client.subscribe(
+        [SubType.ORDER_BOOK, SubType.TRADE],
+        'BTCUSDT'
+    )
+
+    assert await client.list_subscriptions() == \
+        ['btcusdt@depth', 'btcusdt@trade']
+
+    assert await client.replay() == 5
+
+    assert trades.trade_ids == [1, 2]
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_orderbook(tmp_path):
+    path = str(tmp_path)
+    await record_session(path)
+
+    client = ReplayClient(path)
+    handler = OrderBookHandlerBase()
+    client.handler(handler)
+
+    await client.subscribe(SubType.ORDER_BOOK, 'BTCUSDT')
+    await client.replay()
+
+    orderbook = handler.orderbook('BTCUSDT')
+
+    assert orderbook.ready
+    # The update before the snapshot is abandoned
+    assert orderbook.asks == [(101., 1.), (102., 4.), (103., 1.)]
+    assert orderbook.bids == [(97., 3.), (98., 1.), (99., 2.)]
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_speed(tmp_path):
+    path = str(tmp_path)
+    await record_session(path)
+
+    # The recorded messages span 0.5 seconds
+    client = ReplayClient(
+        path,
+        speed=2.,
+        streams=['btcusdt@trade']
+    )
+
+    trades = Trades()
+    client.handler(trades)
+
+    start = time.monotonic()
+    assert await client.replay() == 2
+
+    # 0.4 seconds between the two trades
+    assert time.monotonic() - start >= 0.19
+    assert trades.trade_ids == [1, 2]
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_record_snapshot(tmp_path):
+    path = str(tmp_path)
+    recorder = Recorder(path)
+    client = Client(recorder=recorder)
+
+    with aioresponses() as m:
+        m.get(DEPTH_URL, payload=SNAPSHOT)
+        await client.get_orderbook(symbol='BTCUSDT', limit=10)
+
+    await client.close()
+    await recorder.close()
+
+    frame, = RecordingReader(path)
+
+    assert frame.stream == 'btcusdt@depthSnapshot'
+    assert json.loads(frame.data) == SNAPSHOT
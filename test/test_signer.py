@@ -0,0 +1,57 @@
+import pickle
+
+import pytest
+
+from binance import (
+    HMACSigner,
+    RSASigner,
+    Ed25519Signer
+)
+
+# The example of the official document
+SECRET = 'NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j'
+QUERY = b'symbol=LTCBTC&side=BUY&type=LIMIT&timeInForce=GTC&quantity=1&price=0.1&recvWindow=5000&timestamp=1499827319559'
+SIGNATURE = 'c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71'
+
+
+def test_hmac_signer():
+    signer = HMACSigner(SECRET)
+
+    assert signer.sign(QUERY) == SIGNATURE
+    # The keyed hmac object is not changed by signing
+    assert signer.sign(QUERY) == SIGNATURE
+
+    assert pickle.loads(pickle.dumps(signer)).sign(QUERY) == SIGNATURE
+
+
+def test_private_key_signers():
+    pytest.importorskip('cryptography')
+
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import (
+        ed25519,
+        rsa
+    )
+
+    def pem(key):
+        return key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        )
+
+    rsa_key = pem(rsa.generate_private_key(65537, 2048))
+    ed25519_key = pem(ed25519.Ed25519PrivateKey.generate())
+
+    for Signer, key in [
+        (RSASigner, rsa_key),
+        (Ed25519Signer, ed25519_key)
+    ]:
+        signer = Signer(key)
+        signature = signer.sign(QUERY)
+
+        assert signature == signer.sign(QUERY)
+        assert pickle.loads(pickle.dumps(signer)).sign(QUERY) == signature
+
+    with pytest.raises(ValueError, match='RSA private key expected'):
+        RSASigner(ed25519_key)
@@ -0,0 +1,165 @@
+import asyncio
+import pickle
+import time
+
+import pytest
+
+from binance import (
+    OrderBookHandlerBase,
+    SnapshotScheduler
+)
+
+
+class FakeClient:
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.requests = []
+        self.ongoing = 0
+        self.max_ongoing = 0
+
+    async def get_orderbook(self, symbol, limit):
+        self.requests.append((symbol, limit))
+
+        self.ongoing += 1
+        self.max_ongoing = max(self.max_ongoing, self.ongoing)
+
+        await asyncio.sleep(self.delay)
+
+        self.ongoing -= 1
+
+        return dict(lastUpdateId=1, asks=[], bids=[], symbol=symbol)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_concurrency_and_priority():
+    client = FakeClient()
+    scheduler = SnapshotScheduler(
+        concurrency=2,
+        priority_symbols=['ethusdt']
+    )
+
+    symbols = ['A', 'B', 'C', 'D', 'ETHUSDT']
+
+    results = await asyncio.gather(*[
+        scheduler.fetch(client, symbol, 100) for symbol in symbols
+    ])
+
+    assert [r['symbol'] for r in results] == symbols
+    assert client.max_ongoing == 2
+
+    # The priority symbol is requested before the queued ones
+    assert [symbol for symbol, _ in client.requests] == \
+        ['A', 'B', 'ETHUSDT', 'C', 'D']
+
+    assert scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_dedupes():
+    client = FakeClient()
+    scheduler = SnapshotScheduler()
+
+    results = await asyncio.gather(*[
+        scheduler.fetch(client, 'BTCUSDT', 1000) for _ in range(3)
+    ])
+
+    assert len(client.requests) == 1
+    assert results[0] is results[2]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_weight_budget():
+    client = FakeClient(0)
+
+    # 50 weight per 0.5 second
+    scheduler = SnapshotScheduler(weight_budget=50, interval=0.5)
+
+    start = time.monotonic()
+
+    # Each costs 50 weight
+    await asyncio.gather(
+        scheduler.fetch(client, 'A', 5000),
+        scheduler.fetch(client, 'B', 5000)
+    )
+
+    assert time.monotonic() - start >= 0.45
+    assert len(client.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_exception():
+    class FailingClient(FakeClient):
+        async def get_orderbook(self, symbol, limit):
+            raise RuntimeError('boom')
+
+    scheduler = SnapshotScheduler()
+
+    with pytest.raises(RuntimeError, match='boom'):
+        await scheduler.fetch(FailingClient(), 'A', 100)
+
+    assert scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_shared_by_handler():
+    scheduler = SnapshotScheduler(priority_symbols=['BTCUSDT'])
+    handler = OrderBookHandlerBase(snapshot_scheduler=scheduler)
+
+    assert handler.orderbook('btcusdt')._snapshot_scheduler is scheduler
+
+    # Handlers have their own schedulers by default
+    assert OrderBookHandlerBase()._snapshot_scheduler is not None
+
+    copied = pickle.loads(pickle.dumps(scheduler))
+    assert copied._priority_symbols == {'BTCUSDT'}
+
+
+@pytest.mark.asyncio
+async def test_scheduler_client_rate_limiter():
+    client = FakeClient(0)
+    # The weight is limited by the rate limiter of the client instead
+    client.rate_limiter = object()
+
+    scheduler = SnapshotScheduler(weight_budget=50, interval=0.5)
+
+    start = time.monotonic()
+
+    await asyncio.gather(
+        scheduler.fetch(client, 'A', 5000),
+        scheduler.fetch(client, 'B', 5000)
+    )
+
+    assert time.monotonic() - start < 0.2
+    assert len(client.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_close():
+    client = FakeClient(10)
+
+    handler = OrderBookHandlerBase()
+    scheduler = handler._snapshot_scheduler
+    scheduler._concurrency = 1
+
+    ongoing = asyncio.create_task(scheduler.fetch(client, 'A', 100))
+    queued = asyncio.create_task(scheduler.fetch(client, 'B', 100))
+    await asyncio.sleep(0)
+
+    assert scheduler.pending == 2
+
+    await handler.close()
+
+    for task in (ongoing, queued):
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert scheduler.pending == 0
+    assert not scheduler._tasks
+
+    # Schedulers specified by users are not closed by handlers
+    shared = SnapshotScheduler()
+    task = asyncio.create_task(shared.fetch(FakeClient(0.05), 'A', 100))
+    await asyncio.sleep(0)
+
+    await OrderBookHandlerBase(snapshot_scheduler=shared).close()
+    assert (await task)['symbol'] == 'A'
@@ -3,6 +3,7 @@ import asyncio
 
 from binance import (
     Stream,
+    OverflowPolicy,
     StreamDisconnectedException,
     StreamSubscribeException
 )
@@ -108,3 +109,34 @@ async def test_json_error():
 
     await stream.close()
     await server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_stream_queue():
+    server = SocketServer()
+    await server.no_timeout().start().run()
+
+    received = []
+
+    async def slow_on_message(msg):
+        received.append(msg)
+        await asyncio.sleep(0.2)
+
+    stream = Stream(
+        'ws://localhost:%s/stream' % PORT,
+        slow_on_message,
+        queue_size=1,
+        overflow_policy=OverflowPolicy.DROP_OLDEST
+    ).connect()
+
+    await asyncio.sleep(1)
+
+    stats = stream.queue.stats()
+
+    # The socket reader is not blocked by the slow handler
+    assert stats['dropped'] > 0
+    assert stats['max_depth'] == 1
+    assert 0 < len(received) < 10
+
+    await stream.close()
+    await server.shutdown()
@@ -7,9 +7,11 @@ from binance import (
     Client,
     SubType,
     KlineInterval,
+    ShardStrategy,
 
     TickerHandlerBase,
     KlineHandlerBase,
+    AllMarketTickersHandlerBase,
 
     InvalidHandlerException,
     OrderBookHandlerBase,
@@ -204,3 +206,137 @@ async def test_orderbook_handler_init_orderbook_ahead(client):
 @pytest.mark.asyncio
 async def test_orderbook_handler_init_orderbook_after(client):
     await run_orderbook_handler(client, False)
+
+
+@pytest.mark.asyncio
+async def test_message_routes(client):
+    ctx = client._get_handler_ctx()
+
+    client.handler(TickerHandlerBase(), AllMarketTickersHandlerBase())
+
+    assert set(ctx._payload_routes.keys()) == {'24hrTicker'}
+    assert set(ctx._stream_routes.keys()) == {'!ticker@arr'}
+
+    assert await ctx.subscribe_params(True, [
+        (SubType.ALL_MARKET_TICKERS, 3000),
+        (SubType.TICKER, 'BTCUSDT')
+    ]) == ['!ticker@arr@3000ms', 'btcusdt@ticker']
+
+    # Only streams without payload types are routed by stream names
+    assert set(ctx._stream_routes.keys()) == {
+        '!ticker@arr',
+        '!ticker@arr@3000ms'
+    }
+
+    await ctx.subscribe_params(False, [
+        (SubType.ALL_MARKET_TICKERS, 3000)
+    ])
+
+    assert set(ctx._stream_routes.keys()) == {'!ticker@arr'}
+
+
+@pytest.mark.asyncio
+async def test_message_routes_by_stream_prefix(client):
+    class AllMarketTickers(AllMarketTickersHandlerBase):
+        def __init__(self):
+            super().__init__()
+            self.received = []
+
+        def receive(self, payload):
+            self.received.append(payload)
+
+    ctx = client._get_handler_ctx()
+    handler = AllMarketTickers()
+    client.handler(handler)
+
+    # Streams of other intervals which are not subscribed by the client
+    await ctx.receive(dict(stream='!ticker@arr@3000ms', data=[1]))
+    await ctx.receive(dict(stream='!ticker@arr@3000ms', data=[2]))
+    await ctx.receive(dict(stream='!miniTicker@arr@1000ms', data=[3]))
+    await ctx.receive(dict(stream='unknown', data=[4]))
+
+    assert handler.received == [[1], [2]]
+    assert ctx._stream_routes['!ticker@arr@3000ms'] is \
+        ctx._stream_routes['!ticker@arr']
+    assert 'unknown' not in ctx._stream_routes
+
+
+class FakeStream:
+    def __init__(self):
+        self.subscribed = []
+
+    async def send(self, msg):
+        method = msg['method']
+
+        if method == 'SUBSCRIBE':
+            self.subscribed.extend(msg['params'])
+        elif method == 'UNSUBSCRIBE':
+            for param in msg['params']:
+                self.subscribed.remove(param)
+        else:
+            return [*self.subscribed]
+
+    async def close(self, code):
+        pass
+
+
+def fake_streams(client):
+    streams = [FakeStream() for _ in client._data_streams]
+    client._data_streams = [*streams]
+    return streams
+
+
+@pytest.mark.asyncio
+async def test_shards_by_hash():
+    client = Client(stream_shards=4)
+    streams = fake_streams(client)
+
+    symbols = [f'SYMBOL{i}USDT' for i in range(20)]
+
+    await client.subscribe(
+        ([SubType.TICKER, SubType.TRADE], symbols)
+    )
+
+    # Subscriptions of the same symbol are in the same shard
+    for stream in streams:
+        assert len(stream.subscribed) < 40
+
+        for param in stream.subscribed:
+            symbol = param.split('@')[0]
+            assert f'{symbol}@ticker' in stream.subscribed
+            assert f'{symbol}@trade' in stream.subscribed
+
+    assert len(await client.list_subscriptions()) == 40
+
+    await client.unsubscribe(SubType.TRADE, symbols)
+
+    assert sorted(await client.list_subscriptions()) == sorted(
+        f'{symbol.lower()}@ticker' for symbol in symbols
+    )
+
+    await client.close()
+    assert client._data_streams == [None] * 4
+
+
+@pytest.mark.asyncio
+async def test_shards_by_load():
+    client = Client(
+        stream_shards=3,
+        stream_shard_strategy=ShardStrategy.LOAD
+    )
+    streams = fake_streams(client)
+
+    await client.subscribe(SubType.TICKER, ['A', 'B', 'C', 'D'])
+
+    assert [len(stream.subscribed) for stream in streams] == [2, 1, 1]
+
+    await client.unsubscribe(SubType.TICKER, 'A')
+    await client.subscribe(SubType.TICKER, ['E', 'F'])
+
+    assert [len(stream.subscribed) for stream in streams] == [2, 2, 1]
+
+    streams[1].subscribed.clear()
+
+    # resubscribe after reconnected
+    await client._resubscribe(1)
+    assert len(streams[1].subscribed) == 2